@@ -69,6 +69,122 @@ options:
     default: []
     vars:
     - name: ansible_ios_config_commands
+  config_cache_ttl:
+    type: int
+    default: 0
+    description:
+    - Number of seconds the running-config fetched over this persistent connection
+      is kept and served again to later tasks, instead of being fetched from the device.
+    - Both C(get_config) requests and C(show running-config | section/include) requests
+      are answered from the cached running-config.
+    - C(show vlan) output is cached the same way.
+    - The cache is cleared by every configuration change sent through this connection.
+    - The default C(0) disables the cache.
+    version_added: 11.6.0
+    env:
+    - name: ANSIBLE_IOS_CONFIG_CACHE_TTL
+    vars:
+    - name: ansible_ios_config_cache_ttl
+  config_pipeline_window:
+    type: int
+    default: 0
+    description:
+    - Number of configuration lines C(edit_config) writes to the device before
+      waiting for their prompts, instead of waiting for the prompt after every line.
+    - Errors reported by the device are mapped back to the line that caused them
+      and the push stops at the first error. Lines following the failing one in the
+      same window have already been sent to the device and may have been applied.
+    - Lines that expect a prompt/answer exchange are always sent one at a time.
+    - The default C(0) sends one line per round trip.
+    version_added: 11.6.0
+    env:
+    - name: ANSIBLE_IOS_CONFIG_PIPELINE_WINDOW
+    vars:
+    - name: ansible_ios_config_pipeline_window
+  command_pipeline_window:
+    type: int
+    default: 0
+    description:
+    - Number of read-only C(show) commands C(run_commands) and C(run_commands_batch)
+      write to the device before waiting for their output, instead of waiting for
+      the output of every command before sending the next one.
+    - When a command in a window returns an error, the whole window is run again
+      one command at a time so that every command gets its own result.
+    - Commands that expect a prompt/answer exchange and C(show running-config)
+      requests are always sent one at a time.
+    - The default C(0) sends one command per round trip.
+    version_added: 11.6.0
+    env:
+    - name: ANSIBLE_IOS_COMMAND_PIPELINE_WINDOW
+    vars:
+    - name: ansible_ios_command_pipeline_window
+  device_info_cache_path:
+    type: path
+    description:
+    - Path of a JSON file on the controller where the device type found by
+      C(get_device_info) is kept between connections, so that the L2/L3 probe
+      is not run again on every play.
+    - Entries are keyed by host and tied to the serial number and boot time
+      reported by C(show version), a reload of the device invalidates them.
+    - When not set, the device type is probed on every new connection.
+    version_added: 11.6.0
+    env:
+    - name: ANSIBLE_IOS_DEVICE_INFO_CACHE_PATH
+    vars:
+    - name: ansible_ios_device_info_cache_path
+  parse_cache_path:
+    type: path
+    description:
+    - Path of a directory on the controller where the resource modules keep the
+      facts parsed from each top-level block of the configuration, so that the
+      blocks that did not change are not parsed again by later tasks and plays.
+    - Entries are keyed by resource, collection version and the content of the
+      block, they are shared by all the devices using the same directory.
+    - When not set, the configuration is parsed on every task.
+    version_added: 11.6.0
+    env:
+    - name: ANSIBLE_IOS_PARSE_CACHE_PATH
+    vars:
+    - name: ansible_ios_parse_cache_path
+  parse_cache_max_size:
+    type: int
+    default: 256
+    description:
+    - Size in megabytes the entries of C(parse_cache_path) are kept under, the
+      least recently used entries are removed first.
+    version_added: 11.6.0
+    env:
+    - name: ANSIBLE_IOS_PARSE_CACHE_MAX_SIZE
+    vars:
+    - name: ansible_ios_parse_cache_max_size
+  parse_workers:
+    type: int
+    default: 0
+    description:
+    - Number of worker processes C(ios_facts) and the resource modules parse the
+      facts of several resources in, each resource in one process, once the
+      running-config is at least C(parse_parallel_min_size) large.
+    - The workers are forked from the module process, the option has no effect
+      on controllers where processes cannot be forked. It is capped by the
+      number of CPUs of the controller.
+    - The default C(0) parses the resources one after another.
+    version_added: 11.6.0
+    env:
+    - name: ANSIBLE_IOS_PARSE_WORKERS
+    vars:
+    - name: ansible_ios_parse_workers
+  parse_parallel_min_size:
+    type: int
+    default: 1024
+    description:
+    - Size in kilobytes of the running-config from which the resources are
+      parsed in C(parse_workers) processes, smaller configurations are parsed
+      in the module process.
+    version_added: 11.6.0
+    env:
+    - name: ANSIBLE_IOS_PARSE_PARALLEL_MIN_SIZE
+    vars:
+    - name: ansible_ios_parse_parallel_min_size
 """
 
 EXAMPLES = """
@@ -136,30 +252,179 @@ EXAMPLES = """
 
 """
 
+import hashlib
 import json
+import os
 import re
+import tempfile
 import time
 
 from collections.abc import Mapping
 
 from ansible.errors import AnsibleConnectionFailure
-from ansible.module_utils.common.text.converters import to_text
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.config import (
-    NetworkConfig,
-    dumps,
-)
+from ansible.module_utils.common.text.converters import to_bytes, to_text
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.config import dumps
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import to_list
 from ansible_collections.ansible.netcommon.plugins.plugin_utils.cliconf_base import (
     CliconfBase,
     enable_mode,
 )
 
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.config_sections import (
+    RUNNING_CONFIG_FILTER_RE,
+    filter_include,
+    filter_section,
+    split_sections,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.config_tree import (
+    IosNetworkConfig,
+)
+from ansible_collections.cisco.ios.plugins.terminal.ios import TerminalModule
+
+
+CONFIG_MODE_COMMAND_RE = re.compile(
+    r"^\s*(conf(i(g(u(r(e)?)?)?)?)?\b|copy\s+\S+\s+(system:)?running-config|reload|archive|write)",
+)
+SHOW_COMMAND_RE = re.compile(r"^\s*sh(o(w)?)?\s+\S")
+BANNER_START_RE = re.compile(r"banner ([\w-]+) \^C")
+UPTIME_UNITS = {
+    "year": 31536000,
+    "week": 604800,
+    "day": 86400,
+    "hour": 3600,
+    "minute": 60,
+    "second": 1,
+}
+
+
+def _collection_version():
+    """Return the version of this collection, read from its MANIFEST.json
+    when it is installed or from its galaxy.yml in a source tree"""
+    root = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..")
+    try:
+        with open(os.path.join(root, "MANIFEST.json")) as f:
+            return json.load(f)["collection_info"]["version"]
+    except (IOError, OSError, ValueError, KeyError, TypeError):
+        pass
+    try:
+        with open(os.path.join(root, "galaxy.yml")) as f:
+            match = re.search(r"^version:\s*[\"']?([^\"'\s]+)", f.read(), re.M)
+    except (IOError, OSError):
+        return None
+    return match.group(1) if match else None
+
+
+def _uptime_seconds(uptime):
+    """Convert an IOS uptime such as `1 day, 16 hours, 15 minutes` to seconds"""
+    seconds = 0
+    for value, unit in re.findall(r"(\d+) (year|week|day|hour|minute|second)", uptime):
+        seconds += int(value) * UPTIME_UNITS[unit]
+    return seconds
+
 
 class Cliconf(CliconfBase):
     def __init__(self, *args, **kwargs):
         self._device_info = {}
+        self._config_cache = {}
+        self._config_cache_stats = {"hits": 0, "misses": 0}
+        self._config_cache_hit = False
+        self._config_window_count = 0
         super(Cliconf, self).__init__(*args, **kwargs)
 
+    def _get_option_value(self, option, default):
+        try:
+            return self.get_option(option) or default
+        except KeyError:
+            return default
+
+    def _get_config_cache_ttl(self):
+        return self._get_option_value("config_cache_ttl", 0)
+
+    def _is_config_command(self, command):
+        if CONFIG_MODE_COMMAND_RE.match(command):
+            return True
+        return command in self._get_option_value("config_commands", [])
+
+    def invalidate_config_cache(self):
+        """
+        Drop every running-config entry held by this connection
+        :return: None
+        """
+        if self._config_cache:
+            self._connection.queue_message("vvvv", "invalidating running-config cache")
+        self._config_cache = {}
+
+    def get_config_cache_info(self):
+        """
+        Report and reset the running-config cache counters
+        :return: Dictionary with the cache state and the number of requests
+                 served from the cache (hits) or from the device (misses)
+                 since the previous call.
+        """
+        info = {"enabled": self._get_config_cache_ttl() > 0}
+        info.update(self._config_cache_stats)
+        self._config_cache_stats = {"hits": 0, "misses": 0}
+        return info
+
+    def get_config_cache_hit(self):
+        """
+        Tell whether the last running-config request was served from the cache
+        :return: True when the output of the last `get_config` or `show
+                 running-config` request came from the cache, False when it was
+                 fetched from the device.
+        """
+        return self._config_cache_hit
+
+    def _cache_lookup(self, command, ttl):
+        entry = self._config_cache.get(command)
+        if entry is None:
+            return None
+        if time.time() - entry[0] > ttl:
+            del self._config_cache[command]
+            return None
+        return entry[1]
+
+    def _get_running_config(self, command):
+        """
+        Serve a `show running-config` or `show vlan` request through the
+        connection cache
+        :param command: The `show running-config` command, optionally with flags
+        :return: The command output
+        """
+        ttl = self._get_config_cache_ttl()
+        if not ttl:
+            return self.send_command(command)
+
+        out = self._cache_lookup(command, ttl)
+        if out is not None:
+            self._config_cache_stats["hits"] += 1
+            self._config_cache_hit = True
+            return out
+
+        match = RUNNING_CONFIG_FILTER_RE.match(command)
+        if match:
+            # answer the filter locally from the full running-config
+            full = self._get_running_config("show running-config")
+            filter_type, pattern = match.groups()
+            try:
+                sections = split_sections(to_text(full, errors="surrogate_then_replace"))
+                if filter_type == "section":
+                    lines = filter_section(sections, pattern)
+                else:
+                    lines = filter_include(sections, pattern)
+            except re.error:
+                lines = None
+            if lines is not None:
+                out = "\n".join(lines)
+                self._config_cache[command] = (time.time(), out)
+                return out
+
+        self._config_cache_stats["misses"] += 1
+        self._config_cache_hit = False
+        out = self.send_command(command)
+        self._config_cache[command] = (time.time(), out)
+        return out
+
     @enable_mode
     def get_config(self, source="running", flags=None, format=None):
         if source not in ("running", "startup"):
@@ -178,6 +443,8 @@ class Cliconf(CliconfBase):
         cmd += " ".join(to_list(flags))
         cmd = cmd.strip()
 
+        if source == "running":
+            return self._get_running_config(cmd)
         return self.send_command(cmd)
 
     @enable_mode
@@ -185,6 +452,7 @@ class Cliconf(CliconfBase):
         if not filename:
             raise ValueError("'file_name' value is required for restore")
         cmd = f"configure replace {path}{filename} force"
+        self.invalidate_config_cache()
         return self.send_command(cmd)
 
     def get_diff(
@@ -249,14 +517,18 @@ class Cliconf(CliconfBase):
             )
 
         # prepare candidate configuration
-        candidate_obj = NetworkConfig(indent=1)
+        candidate_obj = IosNetworkConfig(indent=1)
         want_src, want_banners = self._extract_banners(candidate)
         candidate_obj.load(want_src)
 
         if running and diff_match != "none":
             # running configuration
             have_src, have_banners = self._extract_banners(running)
-            running_obj = NetworkConfig(indent=1, contents=have_src, ignore_lines=diff_ignore_lines)
+            running_obj = IosNetworkConfig(
+                indent=1,
+                contents=have_src,
+                ignore_lines=diff_ignore_lines,
+            )
             configdiffobjs = candidate_obj.difference(
                 running_obj,
                 path=path,
@@ -327,16 +599,35 @@ class Cliconf(CliconfBase):
         # commit confirm specific attributes
         commit_confirm = self.get_option("commit_confirm_immediate")
         if commit:
+            self.invalidate_config_cache()
             self.configure()
+            window_size = self._get_option_value("config_pipeline_window", 0)
+            window = []
             for line in to_list(candidate):
                 if not isinstance(line, Mapping):
                     line = {"command": line}
 
                 cmd = line["command"]
                 if cmd != "end" and cmd[0] != "!":
+                    if window_size > 1 and list(line) == ["command"]:
+                        window.append(cmd)
+                        if len(window) == window_size:
+                            results.extend(self._send_config_window(window))
+                            requests.extend(window)
+                            window = []
+                        continue
+
+                    if window:
+                        results.extend(self._send_config_window(window))
+                        requests.extend(window)
+                        window = []
                     results.append(self.send_command(**line))
                     requests.append(cmd)
 
+            if window:
+                results.extend(self._send_config_window(window))
+                requests.extend(window)
+
             self.send_command("end")
             if commit_confirm:
                 self.send_command("configure confirm")
@@ -348,6 +639,115 @@ class Cliconf(CliconfBase):
         resp["response"] = results
         return resp
 
+    def _send_config_window(self, window):
+        """
+        Write a window of configuration lines in one go and collect the
+        per-line responses from the returned stream
+        :param window: List of configuration lines
+        :return: List of responses, one per line
+        """
+        self._config_window_count += 1
+        # a comment line is accepted in every configuration mode, its echo
+        # marks the end of the window in the response stream
+        marker = "! ansible config window %d" % self._config_window_count
+        try:
+            response = to_text(
+                self.send_command(command="\n".join(window + [marker]), strip_prompt=False),
+                errors="surrogate_then_replace",
+            )
+            while marker not in response:
+                # the prompt matched before the whole window was processed, the
+                # next read carries on right after that prompt
+                response += to_text(
+                    self._connection.receive(strip_prompt=False),
+                    errors="surrogate_then_replace",
+                )
+        except AnsibleConnectionFailure as exc:
+            error = to_text(exc, errors="surrogate_then_replace")
+            if marker not in error:
+                self._drain_window(marker, len(window))
+            raise AnsibleConnectionFailure(self._map_window_error(window, error))
+
+        return self._split_window_response(window, marker, response)
+
+    def _drain_window(self, terminator, max_reads):
+        """
+        Read the output of the lines of a failed window that were already
+        sent, so that the next command starts on a clean stream
+        :param terminator: Text marking the end of the window output
+        :param max_reads: Upper bound of reads to attempt
+        """
+        for _ in range(max_reads):
+            try:
+                out = to_text(self._connection.receive(strip_prompt=False))
+            except AnsibleConnectionFailure as exc:
+                out = to_text(exc)
+                if not self._find_window_error(out):
+                    # not a device error, nothing left to read
+                    return
+            if terminator in out:
+                return
+
+    def _find_window_error(self, text):
+        """
+        Locate the first device error in a response
+        :param text: The response text
+        :return: Offset of the first terminal_stderr_re match or None
+        """
+        data = to_bytes(text, errors="surrogate_then_replace")
+        starts = [
+            match.start()
+            for match in (regex.search(data) for regex in TerminalModule.terminal_stderr_re)
+            if match
+        ]
+        if not starts:
+            return None
+        return len(to_text(data[: min(starts)], errors="surrogate_then_replace"))
+
+    def _map_window_error(self, window, error):
+        """
+        Find the line of a window whose echo precedes the first error in the
+        device response
+        :param window: List of configuration lines sent in the window
+        :param error: The error response received from the device
+        :return: Error message naming the failing line
+        """
+        position = self._find_window_error(error)
+        if position is None:
+            position = len(error)
+
+        failed = None
+        echo_position = -1
+        for cmd in window:
+            found = error.rfind("#" + cmd, 0, position)
+            if found > echo_position:
+                failed, echo_position = cmd, found
+
+        if failed is None:
+            return error
+        return "configuration line '%s' failed: %s" % (failed, error)
+
+    def _is_prompt(self, row):
+        data = to_bytes(row, errors="surrogate_then_replace")
+        for regex in TerminalModule.terminal_stdout_re:
+            match = regex.match(data)
+            if match and match.end() == len(data):
+                return True
+        return False
+
+    def _split_window_response(self, window, marker, response):
+        results = [[] for _ in window]
+        index = -1
+        for row in response.splitlines():
+            stripped = row.rstrip()
+            if marker and stripped.endswith("#" + marker):
+                break
+            if index + 1 < len(window) and stripped.endswith("#" + window[index + 1].rstrip()):
+                index += 1
+            elif index >= 0 and not self._is_prompt(stripped):
+                results[index].append(row)
+        return ["\n".join(output).strip() for output in results]
+
     @enable_mode
     def edit_config_with_prompt(self, candidate=None, commit=True, replace=None, comment=None):
         resp = {}
@@ -359,6 +759,7 @@ class Cliconf(CliconfBase):
         # commit confirm specific attributes
         commit_confirm = self.get_option("commit_confirm_immediate")
         if commit:
+            self.invalidate_config_cache()
             self.configure()
             for item_dict in candidate:
                 config_line = item_dict.get("config_line")
@@ -398,6 +799,7 @@ class Cliconf(CliconfBase):
         results = []
         requests = []
         if commit:
+            self.invalidate_config_cache()
             commands = ""
             self.send_command("config terminal")
             time.sleep(0.1)
@@ -436,6 +838,13 @@ class Cliconf(CliconfBase):
         if output:
             raise ValueError("'output' value %s is not supported for get" % output)
 
+        if (command.startswith("show running-config") or command == "show vlan") and not (
+            prompt or answer or sendonly
+        ):
+            return self._get_running_config(command)
+        if self._is_config_command(command):
+            self.invalidate_config_cache()
+
         return self.send_command(
             command=command,
             prompt=prompt,
@@ -448,11 +857,90 @@ class Cliconf(CliconfBase):
     def check_device_type(self):
         device_type = "L2"
         try:
-            self.get(command="show vlan")
+            # only L2 capable devices know `show vlan`, filter its output so
+            # that large VLAN tables are not transferred just for the probe;
+            # the filtered output holds no VLANs and cannot answer a later
+            # `show vlan`, that one is served by the running-config cache
+            self.get(command="show vlan | include ^VLAN")
         except Exception:
             device_type = "L3"
         return device_type
 
+    def _get_device_id(self, data):
+        """
+        Identify the device and its current boot from `show version` output
+        :param data: The `show version` output
+        :return: A hash of the serial number and boot time, None when the
+                 output does not show both
+        """
+        serial = re.search(r"^Processor board ID (\S+)", data, re.M)
+        restarted = re.search(r"^System restarted at (.+)$", data, re.M)
+        uptime = re.search(r"^\S+ uptime is (.+)$", data, re.M)
+        if not serial or not (restarted or uptime):
+            return None
+        if restarted:
+            boot = restarted.group(1).strip()
+        else:
+            # uptime is reported in minutes, round the boot time to the hour
+            boot = str(int(time.time() - _uptime_seconds(uptime.group(1))) // 3600)
+        return hashlib.sha256(to_bytes("%s|%s" % (serial.group(1), boot))).hexdigest()
+
+    def _get_cache_host(self):
+        try:
+            return self._connection.get_option("host")
+        except (AttributeError, KeyError):
+            return None
+
+    def _load_device_info_cache(self, path):
+        try:
+            with open(path) as f:
+                cache = json.load(f)
+        except (IOError, OSError, ValueError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
+
+    def _store_device_info_cache(self, path, cache):
+        """Write the device info cache file atomically, concurrent writers
+        may drop each other's entries but never corrupt the file"""
+        directory = os.path.dirname(path) or "."
+        try:
+            if not os.path.isdir(directory):
+                os.makedirs(directory)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".ios_device_info")
+            with os.fdopen(fd, "w") as f:
+                json.dump(cache, f, sort_keys=True, indent=2)
+            os.rename(tmp_path, path)
+        except (IOError, OSError) as exc:
+            self._connection.queue_message(
+                "vvvv",
+                "unable to write device info cache %s: %s" % (path, to_text(exc)),
+            )
+
+    def _get_device_type(self, data):
+        """
+        Return the L2/L3 device type, from the on-disk cache when the device
+        has not been reloaded since it was stored
+        :param data: The `show version` output
+        """
+        path = self._get_option_value("device_info_cache_path", None)
+        host = self._get_cache_host() if path else None
+        device_id = self._get_device_id(data) if host else None
+        if not device_id:
+            return self.check_device_type()
+
+        cache = self._load_device_info_cache(path)
+        entry = cache.get(host)
+        if isinstance(entry, dict) and entry.get("id") == device_id:
+            device_type = entry.get("network_os_type")
+            if device_type in ("L2", "L3"):
+                self._connection.queue_message("vvvv", "device type read from %s" % path)
+                return device_type
+
+        device_type = self.check_device_type()
+        cache[host] = {"id": device_id, "network_os_type": device_type}
+        self._store_device_info_cache(path, cache)
+        return device_type
+
     def get_device_info(self):
         if not self._device_info:
             device_info = {}
@@ -484,7 +972,7 @@ class Cliconf(CliconfBase):
             match = re.search(r'image file is "(.+)"', data)
             if match:
                 device_info["network_os_image"] = match.group(1)
-            device_info["network_os_type"] = self.check_device_type()
+            device_info["network_os_type"] = self._get_device_type(data)
             self._device_info = device_info
 
         return self._device_info
@@ -514,11 +1002,61 @@ class Cliconf(CliconfBase):
 
     def get_capabilities(self):
         result = super(Cliconf, self).get_capabilities()
-        result["rpc"] += ["edit_banner", "get_diff", "run_commands", "get_defaults_flag"]
+        result["rpc"] += [
+            "edit_banner",
+            "get_diff",
+            "run_commands",
+            "run_commands_batch",
+            "get_defaults_flag",
+            "get_config_cache_info",
+            "get_config_cache_hit",
+            "invalidate_config_cache",
+        ]
         result["device_operations"] = self.get_device_operations()
         result.update(self.get_option_values())
+        config_cache_ttl = self._get_config_cache_ttl()
+        if config_cache_ttl:
+            result["config_cache"] = {"ttl": config_cache_ttl}
+        parse_cache = self.get_parse_cache_info()
+        if parse_cache:
+            result["parse_cache"] = parse_cache
+        parallel_parse = self.get_parallel_parse_info()
+        if parallel_parse:
+            result["parallel_parse"] = parallel_parse
         return json.dumps(result)
 
+    def get_parse_cache_info(self):
+        """
+        Return the settings of the parse cache of the resource modules
+        :return: A dict with the cache directory, its size cap in bytes and the
+                 collection version the entries are tied to, or None when the
+                 cache is not enabled or the collection version is not known
+        """
+        path = self._get_option_value("parse_cache_path", None)
+        version = _collection_version() if path else None
+        if not version:
+            return None
+        return {
+            "path": path,
+            "max_size": self._get_option_value("parse_cache_max_size", 256) * 1024 * 1024,
+            "version": version,
+        }
+
+    def get_parallel_parse_info(self):
+        """
+        Return the settings of the parallel parsing of resource facts
+        :return: A dict with the number of worker processes and the size in
+                 bytes of the running-config from which they are used, or None
+                 when fewer than two workers are set
+        """
+        workers = self._get_option_value("parse_workers", 0)
+        if workers < 2:
+            return None
+        return {
+            "workers": workers,
+            "min_size": self._get_option_value("parse_parallel_min_size", 1024) * 1024,
+        }
+
     def edit_banner(self, candidate=None, multiline_delimiter="@", commit=True):
         """
         Edit banner on remote device
@@ -536,6 +1074,7 @@ class Cliconf(CliconfBase):
         results = []
         requests = []
         if commit:
+            self.invalidate_config_cache()
             for key, value in banners_obj.items():
                 key += " %s" % multiline_delimiter
                 self.send_command("config terminal", sendonly=True)
@@ -555,10 +1094,23 @@ class Cliconf(CliconfBase):
         return resp
 
     def run_commands(self, commands=None, check_rc=True):
+        return [item["output"] for item in self.run_commands_batch(commands, check_rc)]
+
+    def run_commands_batch(self, commands=None, check_rc=True):
+        """
+        Run a list of exec commands in one call, pipelining read-only `show`
+        commands when command_pipeline_window is set
+        :param commands: List of commands, each a string or a dictionary with the
+                         command, prompt and answer keys accepted by run_commands
+        :param check_rc: Raise on the first command that returns an error
+        :return: List of dictionaries, one per command, with the command, its output,
+                 its error (None on success) and the seconds spent waiting for it.
+                 Pipelined commands share the elapsed time of their window.
+        """
         if commands is None:
             raise ValueError("'commands' value is required")
 
-        responses = list()
+        items = list()
         for cmd in to_list(commands):
             if not isinstance(cmd, Mapping):
                 cmd = {"command": cmd}
@@ -566,17 +1118,106 @@ class Cliconf(CliconfBase):
             output = cmd.pop("output", None)
             if output:
                 raise ValueError("'output' value %s is not supported for run_commands" % output)
+            items.append(cmd)
+
+        window_size = self._get_option_value("command_pipeline_window", 0)
+        results = list()
+        window = list()
+        for cmd in items:
+            if window_size > 1 and self._is_pipeline_safe(cmd):
+                window.append(cmd["command"])
+                if len(window) == window_size:
+                    results.extend(self._run_command_window(window, check_rc))
+                    window = []
+                continue
+
+            if window:
+                results.extend(self._run_command_window(window, check_rc))
+                window = []
+            results.append(self._run_timed_command(cmd, check_rc))
+
+        if window:
+            results.extend(self._run_command_window(window, check_rc))
+
+        return results
+
+    def _is_pipeline_safe(self, cmd):
+        command = cmd["command"]
+        return (
+            list(cmd) == ["command"]
+            and SHOW_COMMAND_RE.match(command) is not None
+            and not command.startswith("show running-config")
+        )
 
-            try:
+    def _run_timed_command(self, cmd, check_rc):
+        command = cmd["command"]
+        if self._is_config_command(command):
+            self.invalidate_config_cache()
+
+        error = None
+        start = time.time()
+        try:
+            if list(cmd) == ["command"] and command.startswith("show running-config"):
+                out = self._get_running_config(command)
+            else:
                 out = self.send_command(**cmd)
-            except AnsibleConnectionFailure as e:
-                if check_rc:
-                    raise
-                out = getattr(e, "err", to_text(e))
+        except AnsibleConnectionFailure as e:
+            if check_rc:
+                raise
+            out = error = getattr(e, "err", to_text(e))
 
-            responses.append(out)
+        return {
+            "command": command,
+            "output": out,
+            "error": error,
+            "elapsed": round(time.time() - start, 3),
+        }
 
-        return responses
+    def _run_command_window(self, window, check_rc):
+        """
+        Write a window of `show` commands in one go and split the returned
+        stream into per-command output
+        :param window: List of show commands
+        :param check_rc: Passed on when the window is run again serially
+        :return: List of result dictionaries, one per command
+        """
+        if len(window) == 1:
+            return [self._run_timed_command({"command": window[0]}, check_rc)]
+
+        start = time.time()
+        try:
+            response = to_text(
+                self.send_command(command="\n".join(window), strip_prompt=False),
+                errors="surrogate_then_replace",
+            )
+            while self._count_window_echoes(window, response) < len(window):
+                # the prompt matched before every command was processed, the
+                # next read carries on right after that prompt
+                response += to_text(
+                    self._connection.receive(strip_prompt=False),
+                    errors="surrogate_then_replace",
+                )
+        except AnsibleConnectionFailure as exc:
+            error = to_text(exc, errors="surrogate_then_replace")
+            if self._count_window_echoes(window, error) < len(window):
+                self._drain_window("#" + window[-1].rstrip(), len(window))
+            # show commands are safe to repeat, run them again one by one so
+            # that the error is reported against the command that caused it
+            return [self._run_timed_command({"command": cmd}, check_rc) for cmd in window]
+
+        elapsed = round(time.time() - start, 3)
+        outputs = self._split_window_response(window, None, response)
+        return [
+            {"command": cmd, "output": out, "error": None, "elapsed": elapsed, "pipelined": True}
+            for cmd, out in zip(window, outputs)
+        ]
+
+    def _count_window_echoes(self, window, response):
+        index = 0
+        for row in response.splitlines():
+            if index < len(window) and row.rstrip().endswith("#" + window[index].rstrip()):
+                index += 1
+        return index
 
     def get_defaults_flag(self):
         """
@@ -616,23 +1257,46 @@ class Cliconf(CliconfBase):
                 self._connection.send_command("end")
 
     def _extract_banners(self, config):
+        """
+        Strip the `banner <type> ^C ... ^C` blocks from a configuration in a
+        single pass
+        :param config: The configuration text
+        :return: Tuple of the configuration with every banner block replaced
+                 by `!! banner removed` and a dictionary of banner texts keyed
+                 by `banner <type>`, the first block winning for repeated types
+                 and blocks with an empty body left out
+        """
         banners = {}
-        banner_cmds = re.findall(r"^banner (\w+)", config, re.M)
-        for cmd in banner_cmds:
-            regex = r"banner %s \^C(.+?)(?=\^C)" % cmd
-            match = re.search(regex, config, re.S)
-            if match:
-                key = "banner %s" % cmd
-                banners[key] = match.group(1).strip()
-
-        for cmd in banner_cmds:
-            regex = r"banner %s \^C(.+?)(?=\^C)" % cmd
-            match = re.search(regex, config, re.S)
-            if match:
-                config = config.replace(str(match.group(1)), "")
-
-        config = re.sub(r"banner \w+ \^C\^C", "!! banner removed", config)
-        return config, banners
+        pieces = []
+        pos = 0
+        # str.find is much cheaper than a multiline regex search over a
+        # large configuration, the regex only checks candidate lines
+        start = config.find("banner ")
+        while start != -1:
+            match = None
+            if start == 0 or config[start - 1] == "\n":
+                match = BANNER_START_RE.match(config, start)
+            if not match:
+                start = config.find("banner ", start + 1)
+                continue
+
+            body_start = match.end()
+            end = config.find("^C", body_start)
+            if end == -1:
+                break
+            body = config[body_start:end]
+            if body:
+                # an empty banner block is removed but is not a banner text
+                banners.setdefault("banner %s" % match.group(1), body.strip())
+            pieces.append(config[pos:start])
+            pieces.append("!! banner removed")
+            pos = end + 2
+            start = config.find("banner ", pos)
+
+        if not pieces:
+            return config, banners
+        pieces.append(config[pos:])
+        return "".join(pieces), banners
 
     def _diff_banners(self, want, have):
         candidate = {}
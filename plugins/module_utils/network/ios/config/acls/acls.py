@@ -16,20 +16,26 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 from ansible.module_utils.common.text.converters import to_text
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.resource_module import (
-    ResourceModule,
-)
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     dict_merge,
 )
 
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.acls.acls import (  # noqa: F401
+    AclsFacts,
+)
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.facts import Facts
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.acls import (
     AclsTemplate,
 )
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.resource_module import (
+    IosResourceModule,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.utils import (
+    get_facts_targets,
+)
 
 
-class Acls(ResourceModule):
+class Acls(IosResourceModule):
     """
     The ios_acls config class
     """
@@ -37,7 +43,7 @@ class Acls(ResourceModule):
     def __init__(self, module):
         super(Acls, self).__init__(
             empty_fact_val={},
-            facts_module=Facts(module),
+            facts_module=Facts(module, targets=get_facts_targets(module, "name", nested="acls")),
             module=module,
             resource="acls",
             tmplt=AclsTemplate(),
@@ -18,22 +18,25 @@ necessary to bring the current configuration to its desired end-state is
 created.
 """
 
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.resource_module import (
-    ResourceModule,
-)
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     dict_merge,
 )
 
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.bfd_templates.bfd_templates import (  # noqa: F401
+    Bfd_templatesFacts,
+)
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.facts import (
     Facts,
 )
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.bfd_templates import (
     Bfd_templatesTemplate,
 )
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.resource_module import (
+    IosResourceModule,
+)
 
 
-class Bfd_templates(ResourceModule):
+class Bfd_templates(IosResourceModule):
     """
     The ios_bfd_templates config class
     """
@@ -23,20 +23,23 @@ import re
 from copy import deepcopy
 
 from ansible.module_utils.connection import ConnectionError
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.resource_module import (
-    ResourceModule,
-)
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     dict_merge,
 )
 
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.bgp_address_family.bgp_address_family import (  # noqa: F401
+    Bgp_address_familyFacts,
+)
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.facts import Facts
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.bgp_address_family import (
     Bgp_address_familyTemplate,
 )
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.resource_module import (
+    IosResourceModule,
+)
 
 
-class Bgp_address_family(ResourceModule):
+class Bgp_address_family(IosResourceModule):
     """
     The cisco.ios_bgp_address_family config class
     """
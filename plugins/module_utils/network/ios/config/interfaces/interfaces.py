@@ -18,23 +18,27 @@ necessary to bring the current configuration to its desired end-state is
 created.
 """
 
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.resource_module import (
-    ResourceModule,
-)
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     dict_merge,
 )
 
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.facts import Facts
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.interfaces.interfaces import (  # noqa: F401
+    InterfacesFacts,
+)
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.interfaces import (
     InterfacesTemplate,
 )
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.resource_module import (
+    IosResourceModule,
+)
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.utils import (
+    get_facts_targets,
     normalize_interface,
 )
 
 
-class Interfaces(ResourceModule):
+class Interfaces(IosResourceModule):
     """
     The ios_interfaces config class
     """
@@ -42,7 +46,7 @@ class Interfaces(ResourceModule):
     def __init__(self, module):
         super(Interfaces, self).__init__(
             empty_fact_val={},
-            facts_module=Facts(module),
+            facts_module=Facts(module, targets=get_facts_targets(module, "name")),
             module=module,
             resource="interfaces",
             tmplt=InterfacesTemplate(),
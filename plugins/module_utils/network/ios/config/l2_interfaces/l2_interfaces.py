@@ -18,26 +18,29 @@ necessary to bring the current configuration to its desired end-state is
 created.
 """
 
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.resource_module import (
-    ResourceModule,
-)
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     dict_merge,
 )
 
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.facts import Facts
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.l2_interfaces.l2_interfaces import (  # noqa: F401
+    L2_interfacesFacts,
+)
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.l2_interfaces import (
     L2_interfacesTemplate,
 )
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.resource_module import (
+    IosResourceModule,
+)
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.utils import (
     generate_switchport_trunk,
+    get_facts_targets,
     normalize_interface,
-    vlan_list_to_range,
-    vlan_range_to_list,
 )
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.vlan_set import VlanSet
 
 
-class L2_interfaces(ResourceModule):
+class L2_interfaces(IosResourceModule):
     """
     The ios_l2_interfaces config class
     """
@@ -45,7 +48,7 @@ class L2_interfaces(ResourceModule):
     def __init__(self, module):
         super(L2_interfaces, self).__init__(
             empty_fact_val={},
-            facts_module=Facts(module),
+            facts_module=Facts(module, targets=get_facts_targets(module, "name")),
             module=module,
             resource="l2_interfaces",
             tmplt=L2_interfacesTemplate(),
@@ -175,35 +178,23 @@ class L2_interfaces(ResourceModule):
 
     def compare_list(self, want, have):
         for vlan in ["allowed_vlans", "pruning_vlans"]:
-            cmd_always = list(
-                set(want.get("trunk", {}).get(vlan, [])) - set(have.get("trunk", {}).get(vlan, [])),
-            )  # find vlans to create wrt have
+            vlan_type = vlan.split("_", maxsplit=1)[0]
+            want_vlans = want.get("trunk", {}).get(vlan) or VlanSet()
+            have_vlans = have.get("trunk", {}).get(vlan) or VlanSet()
+            cmd_always = want_vlans - have_vlans  # find vlans to create wrt have
             if self.state != "merged":
-                rem_vlan = []
-                for vl_no in have.get("trunk", {}).get(vlan, []):
-                    if vl_no not in cmd_always and vl_no not in want.get("trunk", {}).get(vlan, []):
-                        rem_vlan.append(vl_no)
-                if (
-                    not want.get("trunk", {}).get(vlan, []) and rem_vlan
-                ):  # remove vlan all as want blank
-                    self.commands.append(
-                        "no switchport trunk {0} vlan".format(vlan.split("_", maxsplit=1)[0]),
-                    )
+                rem_vlan = have_vlans - want_vlans
+                if not want_vlans and rem_vlan:  # remove vlan all as want blank
+                    self.commands.append("no switchport trunk {0} vlan".format(vlan_type))
                 elif rem_vlan:  # remove excess vlans for replaced overridden with vlan entries
                     self.commands.append(
                         "switchport trunk {0} vlan remove {1}".format(
-                            vlan.split("_", maxsplit=1)[0],
-                            vlan_list_to_range(sorted(rem_vlan)),
+                            vlan_type,
+                            rem_vlan.to_range(),
                         ),
                     )
             if self.state != "deleted" and cmd_always:  # add configuration needed
-                self.commands.extend(
-                    generate_switchport_trunk(
-                        vlan.split("_", maxsplit=1)[0],
-                        have.get("trunk", {}).get(vlan, []),
-                        vlan_list_to_range(sorted(cmd_always)),
-                    ),
-                )
+                self.commands.extend(generate_switchport_trunk(vlan_type, have_vlans, cmd_always))
 
     def process_list_attrs(self, param):
         if param:
@@ -212,4 +203,4 @@ class L2_interfaces(ResourceModule):
                 if val.get("trunk"):
                     for vlan in ["allowed_vlans", "pruning_vlans"]:
                         if val.get("trunk").get(vlan):
-                            val["trunk"][vlan] = vlan_range_to_list(val.get("trunk").get(vlan))
+                            val["trunk"][vlan] = VlanSet.from_ranges(val.get("trunk").get(vlan))
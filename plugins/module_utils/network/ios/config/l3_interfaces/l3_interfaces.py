@@ -14,24 +14,28 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.resource_module import (
-    ResourceModule,
-)
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     dict_merge,
 )
 
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.facts import Facts
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.l3_interfaces.l3_interfaces import (  # noqa: F401
+    L3_InterfacesFacts,
+)
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.l3_interfaces import (
     L3_interfacesTemplate,
 )
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.resource_module import (
+    IosResourceModule,
+)
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.utils import (
+    get_facts_targets,
     normalize_interface,
     validate_n_expand_ipv4,
 )
 
 
-class L3_interfaces(ResourceModule):
+class L3_interfaces(IosResourceModule):
     """
     The ios_l3_interfaces class
     """
@@ -39,7 +43,7 @@ class L3_interfaces(ResourceModule):
     def __init__(self, module):
         super(L3_interfaces, self).__init__(
             empty_fact_val={},
-            facts_module=Facts(module),
+            facts_module=Facts(module, targets=get_facts_targets(module, "name")),
             module=module,
             resource="l3_interfaces",
             tmplt=L3_interfacesTemplate(),
@@ -20,20 +20,23 @@ created.
 from copy import deepcopy
 
 from ansible.module_utils.common.text.converters import to_text
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.resource_module import (
-    ResourceModule,
-)
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     dict_merge,
 )
 
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.facts import Facts
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.logging_global.logging_global import (  # noqa: F401
+    Logging_globalFacts,
+)
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.logging_global import (
     Logging_globalTemplate,
 )
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.resource_module import (
+    IosResourceModule,
+)
 
 
-class Logging_global(ResourceModule):
+class Logging_global(IosResourceModule):
     """
     The ios_logging_global config class
     """
@@ -20,7 +20,9 @@ created.
 
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import utils
 
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.ios import run_commands
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.ios import (
+    run_commands_batch,
+)
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.ping import (
     PingTemplate,
 )
@@ -71,8 +73,11 @@ class Ping:
         self.result["commands"] = self.build_ping(self.module.params)
 
     def run_command(self):
-        ping_results = run_commands(self.module, commands=self.result["commands"])
-        return ping_results
+        batch = run_commands_batch(self.module, commands=self.result["commands"])
+        self.result["command_timing"] = [
+            {"command": item["command"], "elapsed": item["elapsed"]} for item in batch
+        ]
+        return [item["output"] for item in batch]
 
     def process_result(self, ping_results):
         """
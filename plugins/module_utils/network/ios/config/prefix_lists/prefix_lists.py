@@ -18,20 +18,29 @@ necessary to bring the current configuration to its desired end-state is
 created.
 """
 
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.resource_module import (
-    ResourceModule,
-)
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     dict_merge,
 )
 
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.facts import Facts
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.prefix_lists.prefix_lists import (  # noqa: F401
+    Prefix_listsFacts,
+)
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.prefix_lists import (
     Prefix_listsTemplate,
 )
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.prefix_entries import (
+    PrefixEntries,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.resource_module import (
+    IosResourceModule,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.utils import (
+    get_facts_targets,
+)
 
 
-class Prefix_lists(ResourceModule):
+class Prefix_lists(IosResourceModule):
     """
     The cisco.ios_prefix_lists config class
     """
@@ -39,7 +48,10 @@ class Prefix_lists(ResourceModule):
     def __init__(self, module):
         super(Prefix_lists, self).__init__(
             empty_fact_val={},
-            facts_module=Facts(module),
+            facts_module=Facts(
+                module,
+                targets=get_facts_targets(module, "name", nested="prefix_lists"),
+            ),
             module=module,
             resource="prefix_lists",
             tmplt=Prefix_listsTemplate(),
@@ -114,6 +126,8 @@ class Prefix_lists(ResourceModule):
                 )
 
     def _compare_seqs(self, want, have):
+        if self._compare_packed_seqs(want, have):
+            return
         for wseq, wentry in want.items():
             hentry = have.pop(wseq, {})
             if hentry != wentry:
@@ -133,6 +147,44 @@ class Prefix_lists(ResourceModule):
         for hseq in have.values():
             self.addcmd(hseq, "entry", negate=True)
 
+    def _compare_packed_seqs(self, want, have):
+        """Compare the sequences as PrefixEntries, merged by sequence, when
+        both sides pack
+
+        :returns: False when an entry does not pack, the sequences being
+                  left to _compare_seqs
+        """
+        entries = [next(iter(seqs.values())) for seqs in (want, have) if seqs]
+        if not entries:
+            return True
+        afi = entries[0].get("afi")
+        name = entries[0].get("name")
+        wpacked = PrefixEntries.from_entries(afi, name, want.values())
+        if wpacked is None:
+            return False
+        hpacked = PrefixEntries.from_entries(afi, name, have.values())
+        if hpacked is None:
+            return False
+
+        changed, removed = wpacked.diff(hpacked)
+        for windex, hindex in changed:
+            if hindex != -1:
+                if self.state == "merged":
+                    self._module.fail_json(
+                        msg="Cannot update existing sequence {0} of prefix list {1} with state merged."
+                        " Please use state replaced or overridden.".format(
+                            hpacked.sequences[hindex],
+                            hpacked.name,
+                        ),
+                    )
+                else:
+                    self.commands.append(hpacked.command(hindex, negate=True))
+            self.commands.append(wpacked.command(windex))
+        # remove remaining entries from have prefix list
+        for hindex in removed:
+            self.commands.append(hpacked.command(hindex, negate=True))
+        return True
+
     def _prefix_list_transform(self, entry):
         for afi, value in entry.items():
             if "prefix_lists" in value:
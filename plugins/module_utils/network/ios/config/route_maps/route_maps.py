@@ -18,20 +18,26 @@ necessary to bring the current configuration to its desired end-state is
 created.
 """
 
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.resource_module import (
-    ResourceModule,
-)
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     dict_merge,
 )
 
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.facts import Facts
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.route_maps.route_maps import (  # noqa: F401
+    Route_mapsFacts,
+)
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.route_maps import (
     Route_mapsTemplate,
 )
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.resource_module import (
+    IosResourceModule,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.utils import (
+    get_facts_targets,
+)
 
 
-class Route_maps(ResourceModule):
+class Route_maps(IosResourceModule):
     """
     The cisco.ios_route_maps config class
     """
@@ -41,7 +47,7 @@ class Route_maps(ResourceModule):
     def __init__(self, module):
         super(Route_maps, self).__init__(
             empty_fact_val={},
-            facts_module=Facts(module),
+            facts_module=Facts(module, targets=get_facts_targets(module, "route_map")),
             module=module,
             resource="route_maps",
             tmplt=Route_mapsTemplate(),
@@ -17,20 +17,23 @@ __metaclass__ = type
 
 from copy import deepcopy
 
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.resource_module import (
-    ResourceModule,
-)
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     dict_merge,
 )
 
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.facts import Facts
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.service.service import (  # noqa: F401
+    ServiceFacts,
+)
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.service import (
     ServiceTemplate,
 )
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.resource_module import (
+    IosResourceModule,
+)
 
 
-class Service(ResourceModule):
+class Service(IosResourceModule):
     """
     The ios_service class
     """
@@ -20,20 +20,23 @@ created.
 
 from copy import deepcopy
 
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.resource_module import (
-    ResourceModule,
-)
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     dict_merge,
 )
 
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.facts import Facts
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.snmp_server.snmp_server import (  # noqa: F401
+    Snmp_serverFacts,
+)
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.snmp_server import (
     Snmp_serverTemplate,
 )
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.resource_module import (
+    IosResourceModule,
+)
 
 
-class Snmp_server(ResourceModule):
+class Snmp_server(IosResourceModule):
     """
     The ios_snmp_server config class
     """
@@ -19,20 +19,24 @@ created.
 """
 
 
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.resource_module import (
-    ResourceModule,
-)
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     dict_merge,
 )
 
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.facts import Facts
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.vlans.vlans import (  # noqa: F401
+    VlansFacts,
+)
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.vlans import (
     VlansTemplate,
 )
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.resource_module import (
+    IosResourceModule,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.vlan_set import VlanSet
 
 
-class Vlans(ResourceModule):
+class Vlans(IosResourceModule):
     """
     The ios_vlans config class
     """
@@ -68,6 +72,12 @@ class Vlans(ResourceModule):
     def segregate_resource(self):
         self.want_vlan_config = []
         self.have_vlan_config = []
+        # VLANs wanted without any attribute, created together with range commands
+        self.bare_vlans = set(
+            vlan_data.get("vlan_id")
+            for vlan_data in self.want
+            if all(value is None for key, value in vlan_data.items() if key != "vlan_id")
+        )
         for vlan_data in self.want:
             if vlan_data.get("member"):
                 self.want_vlan_config.append(
@@ -116,8 +126,7 @@ class Vlans(ResourceModule):
         if self.state == "overridden":
             excluded_vlans = {k: v for k, v in haved.items() if k not in wantd or not wantd}
             haved = {k: v for k, v in haved.items() if k in wantd or not wantd}
-            for k, have in excluded_vlans.items():
-                self.purge(have, resource)
+            self.purge_all(excluded_vlans.values(), resource)
 
         # if state is deleted, empty out wantd and set haved to wantd
         if self.state in ["deleted", "purged"]:
@@ -131,11 +140,16 @@ class Vlans(ResourceModule):
                     self._compare(want={}, have=have, resource=resource)
 
         if self.state == "purged":
-            for k, have in haved.items():
-                self.purge(have, resource)
+            self.purge_all(haved.values(), resource)
         else:
+            created = []
             for k, want in wantd.items():
-                self._compare(want=want, have=haved.pop(k, {}), resource=resource)
+                have = haved.pop(k, {})
+                if resource == "vlans" and not have and k in self.bare_vlans:
+                    created.append(k)
+                    continue
+                self._compare(want=want, have=have, resource=resource)
+            self.commands.extend(self.vlan_range_commands("vlan", created))
 
     def _compare(self, want, have, resource=None):
         """Leverages the base class `compare()` method and
@@ -171,3 +185,21 @@ class Vlans(ResourceModule):
             self.commands.append(self._tmplt.render(have, resource, True))
         elif resource == "vlans":
             self.commands.append(self._tmplt.render(have, resource, True))
+
+    def purge_all(self, haves, resource):
+        """Handle operation for purged state for several VLANs, the VLANs
+        themselves being removed with range commands
+        """
+        if resource == "vlans":
+            self.commands.extend(
+                self.vlan_range_commands("no vlan", [have["vlan_id"] for have in haves]),
+            )
+        else:
+            for have in haves:
+                self.purge(have, resource)
+
+    def vlan_range_commands(self, command, vlan_ids):
+        """Return the commands applying command to the VLANs as ranges, such
+        as `vlan 100-199,300`, each within the VLAN list length limit
+        """
+        return ["%s %s" % (command, chunk) for chunk in VlanSet(vlan_ids).chunks()]
@@ -20,20 +20,23 @@ created.
 
 from copy import deepcopy
 
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.resource_module import (
-    ResourceModule,
-)
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     dict_merge,
 )
 
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.facts import Facts
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.vrf_global.vrf_global import (  # noqa: F401
+    Vrf_globalFacts,
+)
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.vrf_global import (
     Vrf_globalTemplate,
 )
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.resource_module import (
+    IosResourceModule,
+)
 
 
-class Vrf_global(ResourceModule):
+class Vrf_global(IosResourceModule):
     """
     The ios_vrf_global config class
     """
@@ -23,6 +23,9 @@ from ansible_collections.cisco.ios.plugins.module_utils.network.ios.argspec.acl_
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.acl_interfaces import (
     Acl_interfacesTemplate,
 )
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.spec_walker import (
+    validate_config,
+)
 
 
 class Acl_interfacesFacts(object):
@@ -48,7 +51,7 @@ class Acl_interfacesFacts(object):
         if not data:
             data = self.get_acl_interfaces_data(connection)
 
-        config_parser = Acl_interfacesTemplate(lines=data.splitlines())
+        config_parser = Acl_interfacesTemplate(lines=data.splitlines(), module=self._module)
         entry = sorted(list(config_parser.parse().values()), key=lambda k, sk="name": k[sk])
         if entry:
             for item in entry:
@@ -63,7 +66,7 @@ class Acl_interfacesFacts(object):
             utils.remove_empties(cfg)
             if cfg.get("access_groups"):
                 facts["acl_interfaces"].append(cfg)
-        utils.validate_config(self.argument_spec, {"config": facts.get("acl_interfaces")})
+        validate_config(self.argument_spec, {"config": facts.get("acl_interfaces")}, self._module)
 
         ansible_facts["ansible_network_resources"].update(facts)
         return ansible_facts
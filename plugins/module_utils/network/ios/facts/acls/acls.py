@@ -19,9 +19,6 @@ import re
 
 from ansible.module_utils.common.text.converters import to_text
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import utils
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
-    NetworkTemplate,
-)
 
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.argspec.acls.acls import (
     AclsArgs,
@@ -29,57 +26,77 @@ from ansible_collections.cisco.ios.plugins.module_utils.network.ios.argspec.acls
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.acls import (
     AclsTemplate,
 )
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.config_sections import (
+    iter_lines,
+    regex_alternation,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.network_template import (
+    IosNetworkTemplate,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.spec_walker import (
+    validate_config,
+)
 
 
 class AclsFacts(object):
     """The ios_acls fact class"""
 
-    def __init__(self, module):
+    def __init__(self, module, targets=None):
         self._module = module
+        self._targets = targets
+        self._unnamed_acls = False
         self.argument_spec = AclsArgs.argument_spec
 
     def get_acl_data(self, connection):
         # Removed the show access-list
         # Removed the show running-config | include ip(v6)* access-list|remark
+        if self._targets is not None:
+            # no "?" on the command line, the device would take it for a
+            # request for help
+            return connection.get(
+                "show running-config | section ^access-list %s"
+                "|^ip access-list (standard|extended|role-based) %s|^ipv6 access-list %s"
+                % (
+                    regex_alternation(self._targets, " "),
+                    regex_alternation(self._targets, "$"),
+                    regex_alternation(self._targets, "$"),
+                ),
+            )
         return connection.get("show running-config | section access-list")
 
     def get_acl_names(self, connection):
         # this information is required to scoop out the access lists which has no aces
+        # when the running-config does not show them under their own header
         return connection.get("show access-lists | include access list")
 
-    def populate_empty_acls(self, raw_acls, raw_acls_name):
-        # this would update empty acls to the full acls entry
-        if raw_acls and raw_acls_name:
-            for aclnames, acldata in raw_acls_name.get("acls").items():
-                if aclnames not in raw_acls.get("acls").keys():
-                    if not raw_acls.get("acls"):
-                        raw_acls["acls"] = {}
-                    raw_acls["acls"][aclnames] = acldata
-        elif raw_acls_name and not raw_acls:
-            for aclnames, acldata in raw_acls_name.get("acls").items():
-                if not raw_acls.get("acls"):
-                    raw_acls["acls"] = {}
-                raw_acls["acls"][aclnames] = acldata
-        return raw_acls
-
-    def sanitize_data(self, data):
-        """removes matches or extra config info that is added on acl match"""
-        re_data = ""
+    def iter_acl_lines(self, data):
+        """yields the lines of the access-list section, noting the numbered
+        acls in the access-list <number> form, which have no header and are
+        only named by show access-lists"""
+        for line in iter_lines(data):
+            if line.startswith("access-list "):
+                self._unnamed_acls = True
+            yield line
+
+    MATCHES_RE = re.compile(r"\([^()]*\)")
+    REMARK_RE = re.compile(r"\s*(\d+\s)?remark.+", re.IGNORECASE)
+
+    def iter_sanitized(self, lines):
+        """removes matches or extra config info that is added on acl match,
+        and numbers the remarks, one line at a time"""
         remarks_idx = 0
-        for da in data.split("\n"):
+        for da in lines:
             if "match" in da:
-                mod_da = re.sub(r"\([^()]*\)", "", da)
-                re_data += mod_da[:-1] + "\n"
-            elif re.match(r"\s*\d+\sremark.+", da, re.IGNORECASE) or re.match(
-                r"\s*remark.+",
-                da,
-                re.IGNORECASE,
-            ):
+                yield self.MATCHES_RE.sub("", da)[:-1]
+            elif self.REMARK_RE.match(da):
                 remarks_idx += 1
-                re_data += to_text(remarks_idx) + " " + da + "\n"
+                yield to_text(remarks_idx) + " " + da
             else:
-                re_data += da + "\n"
-        return re_data
+                yield da
+
+    def sanitize_data(self, data):
+        """removes matches or extra config info that is added on acl match"""
+        return "".join(da + "\n" for da in self.iter_sanitized(data.split("\n")))
 
     IGMP_MAP = {
         "1": "host_query",
@@ -112,6 +129,107 @@ class AclsFacts(object):
                 mapping = AclsFacts.IGMP_MAP.get(protocol_options, protocol_options)
                 each_ace["protocol_options"] = {"igmp": {mapping: True}}
 
+    @staticmethod
+    def _factor_source_dest(ace, typ):
+        temp = ace.get(typ, {})
+        # TODO complete the ipv6 delta logic
+        if temp.get("address"):
+            ace[typ]["address"] = temp.get("address")
+            ace[typ]["wildcard_bits"] = temp.get("wildcard_bits")
+
+    @staticmethod
+    def _process_protocol_options(each):
+        for each_ace in each.get("aces"):
+            if each.get("acl_type") == "standard":
+                if len(each_ace.get("source", {})) == 1 and each_ace.get(
+                    "source",
+                    {},
+                ).get(
+                    "address",
+                ):
+                    each_ace["source"]["host"] = each_ace["source"].pop(
+                        "address",
+                    )
+                if each_ace.get("source", {}).get("address"):
+                    addr = each_ace.get("source", {}).get("address")
+                    if addr[-1] == ",":
+                        each_ace["source"]["address"] = addr[:-1]
+            else:  # for extended acl
+                if each_ace.get("source", {}):
+                    AclsFacts._factor_source_dest(each_ace, "source")
+                if each_ace.get("destination", {}):
+                    AclsFacts._factor_source_dest(each_ace, "destination")
+
+            AclsFacts._normalize_protocol_options(each_ace)
+
+    @staticmethod
+    def _collect_remarks(aces):
+        """makes remarks list per ace"""
+        ace_entry = []
+        ace_rem = []
+        rem = {}
+        # every remarks is one list item which has a sequence number
+        # every ace remark is preserved and ordered
+        # at the end of each sequence it is flushed to a ace entry
+        for i in aces:
+            # i here denotes an ace, which would be populated with remarks entries
+            if i.get("is_remark_for"):
+                if not rem.get(i.get("is_remark_for")):
+                    rem[i.get("is_remark_for")] = {"remarks": []}
+                    rem[i.get("is_remark_for")]["remarks"].append(
+                        i.get("the_remark"),
+                    )
+                else:
+                    rem[i.get("is_remark_for")]["remarks"].append(
+                        i.get("the_remark"),
+                    )
+            else:
+                if rem:
+                    if rem.get(i.get("sequence")):
+                        ace_rem = rem.pop(i.get("sequence"))
+                        i["remarks"] = ace_rem.get("remarks")
+                ace_entry.append(i)
+
+        if rem:  # pending remarks
+            for pending_rem_seq, pending_rem_val in rem.items():
+                # there can be ace entry with just a remarks and no ace actually
+                # 10 remarks I am a remarks
+                # 20 ..... so onn
+                if pending_rem_seq != "remark":
+                    ace_entry.append(
+                        {
+                            "sequence": pending_rem_seq,
+                            "remarks": pending_rem_val.get("remarks"),
+                        },
+                    )
+                else:
+                    # this handles the classic set of remarks at the end, which is not tied to
+                    # any sequence number
+                    pending_rem = rem.get("remark", {})
+                    ace_entry.append({"remarks": pending_rem.get("remarks")})
+        return ace_entry
+
+    def process_acl(self, acl, temp_v4, temp_v6):
+        """post-processes the facts of one acl parsed and adds the
+        ipv4 standard/extended and ipv6 ones to the afi lists"""
+        if self._targets is not None and str(acl.get("name")) not in self._targets:
+            return
+        if acl.get("afi") == "ipv4" and acl.get("acl_type") in [
+            "standard",
+            "extended",
+        ]:
+            del acl["afi"]
+            temp_v4.append(acl)
+        elif acl.get("afi") == "ipv6":
+            del acl["afi"]
+            temp_v6.append(acl)
+        else:
+            return
+        if acl.get("aces"):
+            # handling remarks for each ace entry
+            acl["aces"] = self._collect_remarks(acl.get("aces"))
+            self._process_protocol_options(acl)
+
     def populate_facts(self, connection, ansible_facts, data=None):
         """Populate the facts for acls
         :param connection: the device connection
@@ -121,132 +239,44 @@ class AclsFacts(object):
         :returns: facts
         """
         namedata = ""
+        fetched = not data
 
-        if not data:
+        if fetched:
             data = self.get_acl_data(connection)
-            namedata = self.get_acl_names(connection)
 
-        if data:
-            data = self.sanitize_data(data)
+        # parse main information, one acl at a time as the sanitized lines
+        # are read, IOS shows each acl once under its header, the empty
+        # acls included
+        templateObjMain = IosNetworkTemplate(
+            lines=self.iter_sanitized(self.iter_acl_lines(data)) if data else [],
+            tmplt=AclsTemplate(),
+            module=self._module,
+        )
+        names = set()
+        temp_v4 = []
+        temp_v6 = []
+        for raw_acls in templateObjMain.parse_blocks():
+            for name, acl in raw_acls.get("acls", {}).items():
+                names.add(name)
+                self.process_acl(acl, temp_v4, temp_v6)
 
-        # parse main information
-        templateObjMain = NetworkTemplate(lines=data.splitlines(), tmplt=AclsTemplate())
-        raw_acls = templateObjMain.parse()
+        if fetched and self._unnamed_acls:
+            namedata = self.get_acl_names(connection)
 
         if namedata:
             # parse just names to update empty acls
-            templateObjName = NetworkTemplate(
+            templateObjName = IosNetworkTemplate(
                 lines=namedata.splitlines(),
                 tmplt=AclsTemplate(),
+                module=self._module,
             )
             raw_acl_names = templateObjName.parse()
-            raw_acls = self.populate_empty_acls(raw_acls, raw_acl_names)
-
-        temp_v4 = []
-        temp_v6 = []
+            for name, acl in raw_acl_names.get("acls", {}).items():
+                if name not in names:
+                    self.process_acl(acl, temp_v4, temp_v6)
 
-        if raw_acls.get("acls"):
-            for k, v in raw_acls.get("acls").items():
-                if v.get("afi") == "ipv4" and v.get("acl_type") in [
-                    "standard",
-                    "extended",
-                ]:
-                    del v["afi"]
-                    temp_v4.append(v)
-                elif v.get("afi") == "ipv6":
-                    del v["afi"]
-                    temp_v6.append(v)
-
-            temp_v4 = sorted(temp_v4, key=lambda i: str(i["name"]))
-            temp_v6 = sorted(temp_v6, key=lambda i: str(i["name"]))
-
-            def factor_source_dest(ace, typ):
-                temp = ace.get(typ, {})
-                # TODO complete the ipv6 delta logic
-                if temp.get("address"):
-                    ace[typ]["address"] = temp.get("address")
-                    ace[typ]["wildcard_bits"] = temp.get("wildcard_bits")
-
-            def process_protocol_options(each):
-                for each_ace in each.get("aces"):
-                    if each.get("acl_type") == "standard":
-                        if len(each_ace.get("source", {})) == 1 and each_ace.get(
-                            "source",
-                            {},
-                        ).get(
-                            "address",
-                        ):
-                            each_ace["source"]["host"] = each_ace["source"].pop(
-                                "address",
-                            )
-                        if each_ace.get("source", {}).get("address"):
-                            addr = each_ace.get("source", {}).get("address")
-                            if addr[-1] == ",":
-                                each_ace["source"]["address"] = addr[:-1]
-                    else:  # for extended acl
-                        if each_ace.get("source", {}):
-                            factor_source_dest(each_ace, "source")
-                        if each_ace.get("destination", {}):
-                            factor_source_dest(each_ace, "destination")
-
-                    AclsFacts._normalize_protocol_options(each_ace)
-
-            def collect_remarks(aces):
-                """makes remarks list per ace"""
-                ace_entry = []
-                ace_rem = []
-                rem = {}
-                # every remarks is one list item which has a sequence number
-                # every ace remark is preserved and ordered
-                # at the end of each sequence it is flushed to a ace entry
-                for i in aces:
-                    # i here denotes an ace, which would be populated with remarks entries
-                    if i.get("is_remark_for"):
-                        if not rem.get(i.get("is_remark_for")):
-                            rem[i.get("is_remark_for")] = {"remarks": []}
-                            rem[i.get("is_remark_for")]["remarks"].append(
-                                i.get("the_remark"),
-                            )
-                        else:
-                            rem[i.get("is_remark_for")]["remarks"].append(
-                                i.get("the_remark"),
-                            )
-                    else:
-                        if rem:
-                            if rem.get(i.get("sequence")):
-                                ace_rem = rem.pop(i.get("sequence"))
-                                i["remarks"] = ace_rem.get("remarks")
-                        ace_entry.append(i)
-
-                if rem:  # pending remarks
-                    for pending_rem_seq, pending_rem_val in rem.items():
-                        # there can be ace entry with just a remarks and no ace actually
-                        # 10 remarks I am a remarks
-                        # 20 ..... so onn
-                        if pending_rem_seq != "remark":
-                            ace_entry.append(
-                                {
-                                    "sequence": pending_rem_seq,
-                                    "remarks": pending_rem_val.get("remarks"),
-                                },
-                            )
-                        else:
-                            # this handles the classic set of remarks at the end, which is not tied to
-                            # any sequence number
-                            pending_rem = rem.get("remark", {})
-                            ace_entry.append({"remarks": pending_rem.get("remarks")})
-                return ace_entry
-
-            for each in temp_v4:
-                if each.get("aces"):
-                    # handling remarks for each ace entry
-                    each["aces"] = collect_remarks(each.get("aces"))
-                    process_protocol_options(each)
-
-            for each in temp_v6:
-                if each.get("aces"):
-                    each["aces"] = collect_remarks(each.get("aces"))
-                    process_protocol_options(each)
+        temp_v4 = sorted(temp_v4, key=lambda i: str(i["name"]))
+        temp_v6 = sorted(temp_v6, key=lambda i: str(i["name"]))
 
         objs = []
         if temp_v4:
@@ -257,7 +287,7 @@ class AclsFacts(object):
         facts = {}
         if objs:
             facts["acls"] = []
-            params = utils.validate_config(self.argument_spec, {"config": objs})
+            params = validate_config(self.argument_spec, {"config": objs}, self._module)
             for cfg in params["config"]:
                 facts["acls"].append(utils.remove_empties(cfg))
         ansible_facts["ansible_network_resources"].update(facts)
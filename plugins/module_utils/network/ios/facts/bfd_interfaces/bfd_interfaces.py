@@ -25,6 +25,9 @@ from ansible_collections.cisco.ios.plugins.module_utils.network.ios.argspec.bfd_
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.bfd_interfaces import (
     Bfd_interfacesTemplate,
 )
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.interface_blocks import (
+    InterfaceBlockIndex,
+)
 
 
 class Bfd_interfacesFacts(object):
@@ -54,7 +57,10 @@ class Bfd_interfacesFacts(object):
             data = self.get_interfaces_data(connection)
 
         # parse native config using the Bfd_interfaces template
-        bfd_interfaces_parser = Bfd_interfacesTemplate(lines=data.splitlines(), module=self._module)
+        bfd_interfaces_parser = Bfd_interfacesTemplate(
+            lines=InterfaceBlockIndex.for_config(data).lines(),
+            module=self._module,
+        )
         objs = list(bfd_interfaces_parser.parse().values())
 
         ansible_facts["ansible_network_resources"].pop("bfd_interfaces", None)
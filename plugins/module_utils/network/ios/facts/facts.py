@@ -14,117 +14,70 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import importlib
+
+from collections.abc import Mapping
+from functools import partial
 
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.facts.facts import (
     FactsBase,
 )
 
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.acl_interfaces.acl_interfaces import (
-    Acl_interfacesFacts,
-)
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.acls.acls import AclsFacts
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.bfd_interfaces.bfd_interfaces import (
-    Bfd_interfacesFacts,
-)
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.bfd_templates.bfd_templates import (
-    Bfd_templatesFacts,
-)
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.bgp_address_family.bgp_address_family import (
-    Bgp_address_familyFacts,
-)
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.bgp_global.bgp_global import (
-    Bgp_globalFacts,
-)
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.evpn_ethernet.evpn_ethernet import (
-    Evpn_ethernetFacts,
-)
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.evpn_evi.evpn_evi import (
-    Evpn_eviFacts,
-)
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.evpn_global.evpn_global import (
-    Evpn_globalFacts,
-)
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.hostname.hostname import (
-    HostnameFacts,
-)
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.hsrp_interfaces.hsrp_interfaces import (
-    Hsrp_interfacesFacts,
-)
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.interfaces.interfaces import (
-    InterfacesFacts,
-)
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.l2_interfaces.l2_interfaces import (
-    L2_interfacesFacts,
-)
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.l3_interfaces.l3_interfaces import (
-    L3_InterfacesFacts,
-)
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.lacp.lacp import LacpFacts
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.lacp_interfaces.lacp_interfaces import (
-    Lacp_InterfacesFacts,
-)
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.lag_interfaces.lag_interfaces import (
-    Lag_interfacesFacts,
-)
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.legacy.base import (
     Config,
     Default,
     Hardware,
     Interfaces,
+    prefetch_commands,
 )
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.lldp_global.lldp_global import (
-    Lldp_globalFacts,
-)
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.lldp_interfaces.lldp_interfaces import (
-    Lldp_InterfacesFacts,
-)
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.logging_global.logging_global import (
-    Logging_globalFacts,
-)
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.ntp_global.ntp_global import (
-    Ntp_globalFacts,
-)
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.ospf_interfaces.ospf_interfaces import (
-    Ospf_interfacesFacts,
-)
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.ospfv2.ospfv2 import (
-    Ospfv2Facts,
-)
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.ospfv3.ospfv3 import (
-    Ospfv3Facts,
-)
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.prefix_lists.prefix_lists import (
-    Prefix_listsFacts,
-)
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.route_maps.route_maps import (
-    Route_mapsFacts,
-)
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.service.service import (
-    ServiceFacts,
-)
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.snmp_server.snmp_server import (
-    Snmp_serverFacts,
-)
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.static_routes.static_routes import (
-    Static_routesFacts,
-)
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.vlans.vlans import (
-    VlansFacts,
-)
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.vrf_address_family.vrf_address_family import (
-    Vrf_address_familyFacts,
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.config_sections import (
+    RunningConfigSnapshot,
 )
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.vrf_global.vrf_global import (
-    Vrf_globalFacts,
-)
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.vrf_interfaces.vrf_interfaces import (
-    Vrf_interfacesFacts,
-)
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.vxlan_vtep.vxlan_vtep import (
-    Vxlan_vtepFacts,
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.parallel_facts import (
+    get_parallel_parse_info,
+    populate_facts_parallel,
 )
 
 
+RESOURCE_FACTS_PACKAGE = "ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts"
+
+
+class LazyFactsRegistry(Mapping):
+    """Map resource names to their facts classes, importing the facts module
+    of a resource the first time it is looked up
+
+    The facts modules are referenced by name only so that AnsiballZ does not
+    ship every resource with each module using Facts. The config module of
+    each resource imports its own facts class and ios_facts imports
+    facts.resources, which keeps the needed facts modules in their payloads.
+    """
+
+    def __init__(self, class_names):
+        """
+        :param class_names: Dictionary of resource name to the name of the
+                            facts class in facts/<resource>/<resource>.py
+        """
+        self._class_names = class_names
+        self._classes = {}
+
+    def __getitem__(self, resource):
+        try:
+            return self._classes[resource]
+        except KeyError:
+            class_name = self._class_names[resource]
+        module = importlib.import_module(
+            "%s.%s.%s" % (RESOURCE_FACTS_PACKAGE, resource, resource),
+        )
+        self._classes[resource] = getattr(module, class_name)
+        return self._classes[resource]
+
+    def __iter__(self):
+        return iter(self._class_names)
+
+    def __len__(self):
+        return len(self._class_names)
+
+
 FACT_LEGACY_SUBSETS = dict(
     default=Default,
     hardware=Hardware,
@@ -132,41 +85,43 @@ FACT_LEGACY_SUBSETS = dict(
     config=Config,
 )
 
-FACT_RESOURCE_SUBSETS = dict(
-    interfaces=InterfacesFacts,
-    l2_interfaces=L2_interfacesFacts,
-    vlans=VlansFacts,
-    lag_interfaces=Lag_interfacesFacts,
-    lacp=LacpFacts,
-    lacp_interfaces=Lacp_InterfacesFacts,
-    lldp_global=Lldp_globalFacts,
-    lldp_interfaces=Lldp_InterfacesFacts,
-    l3_interfaces=L3_InterfacesFacts,
-    acl_interfaces=Acl_interfacesFacts,
-    static_routes=Static_routesFacts,
-    acls=AclsFacts,
-    ospfv2=Ospfv2Facts,
-    ospfv3=Ospfv3Facts,
-    ospf_interfaces=Ospf_interfacesFacts,
-    bgp_global=Bgp_globalFacts,
-    bgp_address_family=Bgp_address_familyFacts,
-    logging_global=Logging_globalFacts,
-    route_maps=Route_mapsFacts,
-    prefix_lists=Prefix_listsFacts,
-    ntp_global=Ntp_globalFacts,
-    service=ServiceFacts,
-    snmp_server=Snmp_serverFacts,
-    hostname=HostnameFacts,
-    vxlan_vtep=Vxlan_vtepFacts,
-    evpn_global=Evpn_globalFacts,
-    evpn_ethernet=Evpn_ethernetFacts,
-    evpn_evi=Evpn_eviFacts,
-    vrf_address_family=Vrf_address_familyFacts,
-    vrf_global=Vrf_globalFacts,
-    vrf_interfaces=Vrf_interfacesFacts,
-    hsrp_interfaces=Hsrp_interfacesFacts,
-    bfd_interfaces=Bfd_interfacesFacts,
-    bfd_templates=Bfd_templatesFacts,
+FACT_RESOURCE_SUBSETS = LazyFactsRegistry(
+    dict(
+        interfaces="InterfacesFacts",
+        l2_interfaces="L2_interfacesFacts",
+        vlans="VlansFacts",
+        lag_interfaces="Lag_interfacesFacts",
+        lacp="LacpFacts",
+        lacp_interfaces="Lacp_InterfacesFacts",
+        lldp_global="Lldp_globalFacts",
+        lldp_interfaces="Lldp_InterfacesFacts",
+        l3_interfaces="L3_InterfacesFacts",
+        acl_interfaces="Acl_interfacesFacts",
+        static_routes="Static_routesFacts",
+        acls="AclsFacts",
+        ospfv2="Ospfv2Facts",
+        ospfv3="Ospfv3Facts",
+        ospf_interfaces="Ospf_interfacesFacts",
+        bgp_global="Bgp_globalFacts",
+        bgp_address_family="Bgp_address_familyFacts",
+        logging_global="Logging_globalFacts",
+        route_maps="Route_mapsFacts",
+        prefix_lists="Prefix_listsFacts",
+        ntp_global="Ntp_globalFacts",
+        service="ServiceFacts",
+        snmp_server="Snmp_serverFacts",
+        hostname="HostnameFacts",
+        vxlan_vtep="Vxlan_vtepFacts",
+        evpn_global="Evpn_globalFacts",
+        evpn_ethernet="Evpn_ethernetFacts",
+        evpn_evi="Evpn_eviFacts",
+        vrf_address_family="Vrf_address_familyFacts",
+        vrf_global="Vrf_globalFacts",
+        vrf_interfaces="Vrf_interfacesFacts",
+        hsrp_interfaces="Hsrp_interfacesFacts",
+        bfd_interfaces="Bfd_interfacesFacts",
+        bfd_templates="Bfd_templatesFacts",
+    ),
 )
 
 
@@ -176,8 +131,14 @@ class Facts(FactsBase):
     VALID_LEGACY_GATHER_SUBSETS = frozenset(FACT_LEGACY_SUBSETS.keys())
     VALID_RESOURCE_SUBSETS = frozenset(FACT_RESOURCE_SUBSETS.keys())
 
-    def __init__(self, module):
+    def __init__(self, module, targets=None):
+        """
+        :param module: The AnsibleModule
+        :param targets: Names of the objects the resource facts are limited
+                        to, for resources whose facts classes take them
+        """
         super(Facts, self).__init__(module)
+        self._targets = targets
 
     def get_facts(self, legacy_facts_type=None, resource_facts_type=None, data=None):
         """Collect the facts for ios
@@ -198,3 +159,99 @@ class Facts(FactsBase):
             self.get_network_legacy_facts(FACT_LEGACY_SUBSETS, legacy_facts_type)
 
         return self.ansible_facts, self._warnings
+
+    def get_network_resources_facts(
+        self,
+        facts_resource_obj_map,
+        resource_facts_type=None,
+        data=None,
+    ):
+        """Gather the resource facts, sharing one running-config fetch when
+        more than one resource is requested, parsing them in worker processes
+        when that is enabled, and limited to the targets the Facts were
+        created with
+        :param facts_resource_obj_map: Map of resource names to facts classes
+        :param resource_facts_type: List of resource fact types
+        :param data: previously collected conf
+        """
+        if self._targets is not None and resource_facts_type:
+            facts_resource_obj_map = dict(
+                (resource, partial(facts_resource_obj_map[resource], targets=self._targets))
+                for resource in resource_facts_type
+                if resource in facts_resource_obj_map
+            )
+        connection = self._connection
+        parsed = {}
+        if connection and not data:
+            runable_subsets = self.gen_runable(
+                resource_facts_type or self._gather_network_resources,
+                frozenset(facts_resource_obj_map.keys()),
+                resource_facts=True,
+            )
+            if len(runable_subsets) > 1:
+                self._connection = RunningConfigSnapshot(connection)
+                parsed = self._populate_facts_parallel(facts_resource_obj_map, runable_subsets)
+        try:
+            if parsed:
+                for resource in sorted(parsed):
+                    self.ansible_facts["ansible_network_resources"].update(parsed[resource])
+                remaining = sorted(runable_subsets.difference(parsed))
+                if remaining:
+                    super(Facts, self).get_network_resources_facts(
+                        facts_resource_obj_map,
+                        remaining,
+                        data,
+                    )
+                self.ansible_facts["ansible_net_gather_network_resources"] = list(runable_subsets)
+            else:
+                super(Facts, self).get_network_resources_facts(
+                    facts_resource_obj_map,
+                    resource_facts_type,
+                    data,
+                )
+        finally:
+            self._connection = connection
+
+    def _populate_facts_parallel(self, facts_resource_obj_map, resources):
+        """Parse the resources in worker processes when parse_workers is set
+        and the running-config is at least as large as parse_parallel_min_size
+        :param facts_resource_obj_map: Map of resource names to facts classes
+        :param resources: The resources to parse
+        :rtype: dict
+        :returns: The ansible_network_resources entries of the resources
+                  parsed, by resource
+        """
+        info = get_parallel_parse_info(self._module)
+        if not info:
+            return {}
+        size = self._connection.prefetch()
+        if size is None or size < info["min_size"]:
+            return {}
+        return populate_facts_parallel(
+            self._module,
+            self._connection,
+            facts_resource_obj_map,
+            resources,
+            info["workers"],
+        )
+
+    def get_network_legacy_facts(self, fact_legacy_obj_map, legacy_facts_type=None):
+        """Gather the legacy facts, running the commands of every requested
+        subset in a single batch
+        :param fact_legacy_obj_map: Map of legacy subset names to facts classes
+        :param legacy_facts_type: List of legacy facts types
+        """
+        runable_subsets = self.gen_runable(
+            legacy_facts_type or self._gather_subset,
+            frozenset(fact_legacy_obj_map.keys()),
+        )
+        if runable_subsets:
+            runable_subsets.add("default")
+            commands = []
+            for key in sorted(runable_subsets):
+                for command in fact_legacy_obj_map[key].COMMANDS:
+                    if command not in commands:
+                        commands.append(command)
+            prefetch_commands(self._module, commands)
+
+        super(Facts, self).get_network_legacy_facts(fact_legacy_obj_map, legacy_facts_type)
@@ -25,6 +25,9 @@ from ansible_collections.cisco.ios.plugins.module_utils.network.ios.argspec.hsrp
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.hsrp_interfaces import (
     Hsrp_interfacesTemplate,
 )
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.interface_blocks import (
+    InterfaceBlockIndex,
+)
 
 
 class Hsrp_interfacesFacts(object):
@@ -77,7 +80,7 @@ class Hsrp_interfacesFacts(object):
 
         # parse native config using the Hsrp_interfaces template
         hsrp_interfaces_parser = Hsrp_interfacesTemplate(
-            lines=data.splitlines(),
+            lines=InterfaceBlockIndex.for_config(data).lines(),
             module=self._module,
         )
         objs = list(hsrp_interfaces_parser.parse().values())
@@ -24,17 +24,22 @@ from ansible_collections.cisco.ios.plugins.module_utils.network.ios.argspec.inte
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.interfaces import (
     InterfacesTemplate,
 )
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.interface_blocks import (
+    InterfaceBlockIndex,
+    get_interfaces_config,
+)
 
 
 class InterfacesFacts(object):
     """The ios interfaces facts class"""
 
-    def __init__(self, module):
+    def __init__(self, module, targets=None):
         self._module = module
+        self._targets = targets
         self.argument_spec = InterfacesArgs.argument_spec
 
     def get_interfaces_data(self, connection):
-        return connection.get("show running-config | section ^interface")
+        return get_interfaces_config(connection, self._targets)
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """Populate the facts for Interfaces network resource
@@ -50,7 +55,10 @@ class InterfacesFacts(object):
             data = self.get_interfaces_data(connection)
 
         # parse native config using the Interfaces template
-        interfaces_parser = InterfacesTemplate(lines=data.splitlines(), module=self._module)
+        interfaces_parser = InterfacesTemplate(
+            lines=InterfaceBlockIndex.for_config(data).lines(self._targets),
+            module=self._module,
+        )
         objs = sorted(list(interfaces_parser.parse().values()), key=lambda k, sk="name": k[sk])
 
         ansible_facts["ansible_network_resources"].pop("interfaces", None)
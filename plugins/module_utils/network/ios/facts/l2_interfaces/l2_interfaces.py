@@ -23,17 +23,22 @@ from ansible_collections.cisco.ios.plugins.module_utils.network.ios.argspec.l2_i
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.l2_interfaces import (
     L2_interfacesTemplate,
 )
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.interface_blocks import (
+    InterfaceBlockIndex,
+    get_interfaces_config,
+)
 
 
 class L2_interfacesFacts(object):
     """The ios l2_interfaces facts class"""
 
-    def __init__(self, module, subspec="config", options="options"):
+    def __init__(self, module, subspec="config", options="options", targets=None):
         self._module = module
+        self._targets = targets
         self.argument_spec = L2_interfacesArgs.argument_spec
 
     def get_l2_interfaces_data(self, connection):
-        return connection.get("show running-config | section ^interface")
+        return get_interfaces_config(connection, self._targets)
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """Populate the facts for L2_interfaces network resource
@@ -52,7 +57,10 @@ class L2_interfacesFacts(object):
             data = self.get_l2_interfaces_data(connection)
 
         # parse native config using the L2_interfaces template
-        l2_interfaces_parser = L2_interfacesTemplate(lines=data.splitlines(), module=self._module)
+        l2_interfaces_parser = L2_interfacesTemplate(
+            lines=InterfaceBlockIndex.for_config(data).lines(self._targets),
+            module=self._module,
+        )
         objs = list(l2_interfaces_parser.parse().values())
 
         def process_mode(obj):
@@ -24,6 +24,13 @@ from ansible_collections.cisco.ios.plugins.module_utils.network.ios.argspec.l3_i
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.l3_interfaces import (
     L3_interfacesTemplate,
 )
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.interface_blocks import (
+    InterfaceBlockIndex,
+    get_interfaces_config,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.spec_walker import (
+    validate_config,
+)
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.utils import (
     netmask_to_cidr,
 )
@@ -32,12 +39,13 @@ from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.utils
 class L3_InterfacesFacts(object):
     """The ios l3 interfaces fact class"""
 
-    def __init__(self, module, subspec="config", options="options"):
+    def __init__(self, module, subspec="config", options="options", targets=None):
         self._module = module
+        self._targets = targets
         self.argument_spec = L3_interfacesArgs.argument_spec
 
     def get_l3_interfaces_data(self, connection):
-        return connection.get("show running-config | section ^interface")
+        return get_interfaces_config(connection, self._targets)
 
     def _set_defaults(self, objs):
         """Set default parameters"""
@@ -101,7 +109,10 @@ class L3_InterfacesFacts(object):
             data = self.get_l3_interfaces_data(connection)
 
         # parse native config using the l3_interfaces template
-        l3_interfaces_parser = L3_interfacesTemplate(lines=data.splitlines())
+        l3_interfaces_parser = L3_interfacesTemplate(
+            lines=InterfaceBlockIndex.for_config(data).lines(self._targets),
+            module=self._module,
+        )
         objs = l3_interfaces_parser.parse()
 
         objs = utils.remove_empties(objs)
@@ -126,7 +137,7 @@ class L3_InterfacesFacts(object):
         facts = {}
         if objs:
             facts["l3_interfaces"] = []
-            params = utils.validate_config(self.argument_spec, {"config": objs})
+            params = validate_config(self.argument_spec, {"config": objs}, self._module)
             for cfg in params["config"]:
                 facts["l3_interfaces"].append(utils.remove_empties(cfg))
             facts["l3_interfaces"] = sorted(facts["l3_interfaces"], key=lambda k, sk="name": k[sk])
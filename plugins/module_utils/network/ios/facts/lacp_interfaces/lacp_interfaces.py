@@ -25,6 +25,12 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.argspec.lacp_interfaces.lacp_interfaces import (
     Lacp_InterfacesArgs,
 )
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.interface_blocks import (
+    InterfaceBlockIndex,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.spec_walker import (
+    validate_config,
+)
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.utils import (
     get_interface_type,
     normalize_interface,
@@ -65,18 +71,16 @@ class Lacp_InterfacesFacts(object):
             data = self.get_lacp_interface_data(connection)
 
         # operate on a collection of resource x
-        config = ("\n" + data).split("\ninterface ")
-
-        for conf in config:
-            if conf:
-                obj = self.render_config(self.generated_spec, conf)
-                if obj:
-                    objs.append(obj)
+        for block in InterfaceBlockIndex.for_config(data):
+            conf = "\n".join([block.lines[0].split(None, 1)[1]] + block.lines[1:])
+            obj = self.render_config(self.generated_spec, conf)
+            if obj:
+                objs.append(obj)
         facts = {}
 
         if objs:
             facts["lacp_interfaces"] = []
-            params = utils.validate_config(self.argument_spec, {"config": objs})
+            params = validate_config(self.argument_spec, {"config": objs}, self._module)
             for cfg in params["config"]:
                 facts["lacp_interfaces"].append(utils.remove_empties(cfg))
         ansible_facts["ansible_network_resources"].update(facts)
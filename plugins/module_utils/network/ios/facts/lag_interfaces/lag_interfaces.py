@@ -25,6 +25,9 @@ from ansible_collections.cisco.ios.plugins.module_utils.network.ios.argspec.lag_
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.lag_interfaces import (
     Lag_interfacesTemplate,
 )
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.interface_blocks import (
+    InterfaceBlockIndex,
+)
 
 
 class Lag_interfacesFacts(object):
@@ -54,7 +57,10 @@ class Lag_interfacesFacts(object):
             data = self.get_lag_interfaces_data(connection)
 
         # parse native config using the Lag_interfaces template
-        lag_interfaces_parser = Lag_interfacesTemplate(lines=data.splitlines(), module=self._module)
+        lag_interfaces_parser = Lag_interfacesTemplate(
+            lines=InterfaceBlockIndex.for_config(data).lines(),
+            module=self._module,
+        )
         objs = self.process_facts(list(lag_interfaces_parser.parse().values()))
         ansible_facts["ansible_network_resources"].pop("lag_interfaces", None)
 
@@ -20,13 +20,30 @@ __metaclass__ = type
 import platform
 import re
 
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import to_list
+
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.ios import (
     get_capabilities,
     normalize_interface,
-    run_commands,
+    run_commands_batch,
 )
 
 
+def prefetch_commands(module, commands):
+    """Run the commands of several legacy subsets in a single batch
+
+    The outputs are kept on the module so that FactsBase.run() serves them
+    without another round of requests to the connection.
+    """
+    responses = getattr(module, "_ios_legacy_responses", {})
+    pending = [cmd for cmd in to_list(commands) if cmd not in responses]
+    if pending:
+        for item in run_commands_batch(module, pending, check_rc=False):
+            responses[item["command"]] = item["output"]
+    module._ios_legacy_responses = responses
+    return responses
+
+
 class FactsBase(object):
     COMMANDS = list()
 
@@ -37,10 +54,12 @@ class FactsBase(object):
         self.responses = None
 
     def populate(self):
-        self.responses = run_commands(self.module, commands=self.COMMANDS, check_rc=False)
+        self.responses = self.run(self.COMMANDS)
 
     def run(self, cmd):
-        return run_commands(self.module, commands=cmd, check_rc=False)
+        commands = to_list(cmd)
+        responses = prefetch_commands(self.module, commands)
+        return [responses[command] for command in commands]
 
 
 class Default(FactsBase):
@@ -23,6 +23,9 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.argspec.lldp_global.lldp_global import (
     Lldp_globalArgs,
 )
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.spec_walker import (
+    validate_config,
+)
 
 
 class Lldp_globalFacts(object):
@@ -66,9 +69,10 @@ class Lldp_globalFacts(object):
         facts = {}
 
         if objs:
-            params = utils.validate_config(
+            params = validate_config(
                 self.argument_spec,
                 {"config": utils.remove_empties(objs)},
+                self._module,
             )
             facts["lldp_global"] = utils.remove_empties(params["config"])
         ansible_facts["ansible_network_resources"].update(facts)
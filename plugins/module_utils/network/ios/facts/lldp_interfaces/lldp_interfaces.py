@@ -25,6 +25,9 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.argspec.lldp_interfaces.lldp_interfaces import (
     Lldp_InterfacesArgs,
 )
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.spec_walker import (
+    validate_config,
+)
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.utils import (
     get_interface_type,
     normalize_interface,
@@ -74,7 +77,7 @@ class Lldp_InterfacesFacts(object):
 
         if objs:
             facts["lldp_interfaces"] = []
-            params = utils.validate_config(self.argument_spec, {"config": objs})
+            params = validate_config(self.argument_spec, {"config": objs}, self._module)
             for cfg in params["config"]:
                 facts["lldp_interfaces"].append(utils.remove_empties(cfg))
         ansible_facts["ansible_network_resources"].update(facts)
@@ -18,9 +18,6 @@ import re
 from copy import deepcopy
 
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import utils
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
-    NetworkTemplate,
-)
 
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.argspec.ospfv3.ospfv3 import (
     Ospfv3Args,
@@ -28,6 +25,9 @@ from ansible_collections.cisco.ios.plugins.module_utils.network.ios.argspec.ospf
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.ospfv3 import (
     Ospfv3Template,
 )
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.network_template import (
+    IosNetworkTemplate,
+)
 
 
 class Ospfv3Facts(object):
@@ -46,7 +46,7 @@ class Ospfv3Facts(object):
         shared = {}
         temp_pid = None
         for line in net_template_obj._lines:
-            for parser in net_template_obj._tmplt.PARSERS:
+            for parser in net_template_obj.parsers_for(line):
                 cap = re.match(parser["getval"], line)
                 if cap:
                     capdict = cap.groupdict()
@@ -119,7 +119,7 @@ class Ospfv3Facts(object):
             data = self.get_ospfv3_data(connection)
 
         ipv4 = {"processes": []}
-        ospfv3_parser = NetworkTemplate(
+        ospfv3_parser = IosNetworkTemplate(
             lines=data.splitlines(),
             tmplt=Ospfv3Template(),
             module=self._module,
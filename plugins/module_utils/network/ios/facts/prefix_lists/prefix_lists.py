@@ -23,16 +23,29 @@ from ansible_collections.cisco.ios.plugins.module_utils.network.ios.argspec.pref
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.prefix_lists import (
     Prefix_listsTemplate,
 )
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.config_sections import (
+    regex_alternation,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.spec_walker import (
+    validate_config,
+)
 
 
 class Prefix_listsFacts(object):
     """The cisco.ios prefix_lists facts class"""
 
-    def __init__(self, module, subspec="config", options="options"):
+    def __init__(self, module, subspec="config", options="options", targets=None):
         self._module = module
+        self._targets = targets
         self.argument_spec = Prefix_listsArgs.argument_spec
 
     def get_prefix_list_data(self, connection):
+        if self._targets is not None:
+            names = regex_alternation(self._targets, " ")
+            return connection.get(
+                "show running-config | section ^ip prefix-list %s|^ipv6 prefix-list %s"
+                % (names, names),
+            )
         return connection.get("show running-config | section ^ip prefix-list|^ipv6 prefix-list")
 
     def populate_facts(self, connection, ansible_facts, data=None):
@@ -52,8 +65,12 @@ class Prefix_listsFacts(object):
             data = self.get_prefix_list_data(connection)
 
         # parse native config using the Prefix_lists template
-        prefix_lists_parser = Prefix_listsTemplate(lines=data.splitlines())
+        prefix_lists_parser = Prefix_listsTemplate(lines=data.splitlines(), module=self._module)
         objs = prefix_lists_parser.parse()
+        if self._targets is not None:
+            objs = dict(
+                (key, obj) for key, obj in objs.items() if str(obj.get("name")) in self._targets
+            )
 
         final_objs = []
 
@@ -72,7 +89,7 @@ class Prefix_listsFacts(object):
             ansible_facts["ansible_network_resources"].pop("prefix_lists", None)
 
         params = utils.remove_empties(
-            utils.validate_config(self.argument_spec, {"config": final_objs}),
+            validate_config(self.argument_spec, {"config": final_objs}, self._module),
         )
 
         facts["prefix_lists"] = params.get("config", [])
@@ -0,0 +1,155 @@
+#
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+The facts classes of every ios resource
+
+Facts looks the resource facts classes up by name in FACT_RESOURCE_SUBSETS.
+Modules that can gather any resource, such as ios_facts, import this file so
+that AnsiballZ ships all of the facts modules with them.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.acl_interfaces.acl_interfaces import (
+    Acl_interfacesFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.acls.acls import AclsFacts
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.bfd_interfaces.bfd_interfaces import (
+    Bfd_interfacesFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.bfd_templates.bfd_templates import (
+    Bfd_templatesFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.bgp_address_family.bgp_address_family import (
+    Bgp_address_familyFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.bgp_global.bgp_global import (
+    Bgp_globalFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.evpn_ethernet.evpn_ethernet import (
+    Evpn_ethernetFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.evpn_evi.evpn_evi import (
+    Evpn_eviFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.evpn_global.evpn_global import (
+    Evpn_globalFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.hostname.hostname import (
+    HostnameFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.hsrp_interfaces.hsrp_interfaces import (
+    Hsrp_interfacesFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.interfaces.interfaces import (
+    InterfacesFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.l2_interfaces.l2_interfaces import (
+    L2_interfacesFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.l3_interfaces.l3_interfaces import (
+    L3_InterfacesFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.lacp.lacp import LacpFacts
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.lacp_interfaces.lacp_interfaces import (
+    Lacp_InterfacesFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.lag_interfaces.lag_interfaces import (
+    Lag_interfacesFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.lldp_global.lldp_global import (
+    Lldp_globalFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.lldp_interfaces.lldp_interfaces import (
+    Lldp_InterfacesFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.logging_global.logging_global import (
+    Logging_globalFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.ntp_global.ntp_global import (
+    Ntp_globalFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.ospf_interfaces.ospf_interfaces import (
+    Ospf_interfacesFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.ospfv2.ospfv2 import (
+    Ospfv2Facts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.ospfv3.ospfv3 import (
+    Ospfv3Facts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.prefix_lists.prefix_lists import (
+    Prefix_listsFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.route_maps.route_maps import (
+    Route_mapsFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.service.service import (
+    ServiceFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.snmp_server.snmp_server import (
+    Snmp_serverFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.static_routes.static_routes import (
+    Static_routesFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.vlans.vlans import (
+    VlansFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.vrf_address_family.vrf_address_family import (
+    Vrf_address_familyFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.vrf_global.vrf_global import (
+    Vrf_globalFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.vrf_interfaces.vrf_interfaces import (
+    Vrf_interfacesFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.vxlan_vtep.vxlan_vtep import (
+    Vxlan_vtepFacts,
+)
+
+
+__all__ = [
+    "Acl_interfacesFacts",
+    "AclsFacts",
+    "Bfd_interfacesFacts",
+    "Bfd_templatesFacts",
+    "Bgp_address_familyFacts",
+    "Bgp_globalFacts",
+    "Evpn_ethernetFacts",
+    "Evpn_eviFacts",
+    "Evpn_globalFacts",
+    "HostnameFacts",
+    "Hsrp_interfacesFacts",
+    "InterfacesFacts",
+    "L2_interfacesFacts",
+    "L3_InterfacesFacts",
+    "LacpFacts",
+    "Lacp_InterfacesFacts",
+    "Lag_interfacesFacts",
+    "Lldp_globalFacts",
+    "Lldp_InterfacesFacts",
+    "Logging_globalFacts",
+    "Ntp_globalFacts",
+    "Ospf_interfacesFacts",
+    "Ospfv2Facts",
+    "Ospfv3Facts",
+    "Prefix_listsFacts",
+    "Route_mapsFacts",
+    "ServiceFacts",
+    "Snmp_serverFacts",
+    "Static_routesFacts",
+    "VlansFacts",
+    "Vrf_address_familyFacts",
+    "Vrf_globalFacts",
+    "Vrf_interfacesFacts",
+    "Vxlan_vtepFacts",
+]
@@ -25,13 +25,20 @@ from ansible_collections.cisco.ios.plugins.module_utils.network.ios.argspec.rout
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.route_maps import (
     Route_mapsTemplate,
 )
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.config_sections import (
+    regex_alternation,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.spec_walker import (
+    validate_config,
+)
 
 
 class Route_mapsFacts(object):
     """The cisco.ios route_maps facts class"""
 
-    def __init__(self, module, subspec="config", options="options"):
+    def __init__(self, module, subspec="config", options="options", targets=None):
         self._module = module
+        self._targets = targets
         self.argument_spec = Route_mapsArgs.argument_spec
         spec = deepcopy(self.argument_spec)
         if subspec:
@@ -45,6 +52,11 @@ class Route_mapsFacts(object):
         self.generated_spec = utils.generate_dict(facts_argument_spec)
 
     def get_route_maps_data(self, connection):
+        if self._targets is not None:
+            return connection.get(
+                "show running-config | section ^route-map %s"
+                % regex_alternation(self._targets, " "),
+            )
         return connection.get("show running-config | section ^route-map")
 
     def populate_facts(self, connection, ansible_facts, data=None):
@@ -63,8 +75,10 @@ class Route_mapsFacts(object):
         if not data:
             data = self.get_route_maps_data(connection)
         # parse native config using the Route_maps template
-        route_maps_parser = Route_mapsTemplate(lines=data.splitlines())
+        route_maps_parser = Route_mapsTemplate(lines=data.splitlines(), module=self._module)
         objs = route_maps_parser.parse()
+        if self._targets is not None:
+            objs = dict((name, obj) for name, obj in objs.items() if str(name) in self._targets)
 
         final_objs = []
         if objs:
@@ -95,7 +109,7 @@ class Route_mapsFacts(object):
             ansible_facts["ansible_network_resources"].pop("route_maps", None)
 
             params = utils.remove_empties(
-                utils.validate_config(self.argument_spec, {"config": final_objs}),
+                validate_config(self.argument_spec, {"config": final_objs}, self._module),
             )
 
             facts["route_maps"] = params["config"]
@@ -15,6 +15,7 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import re
 
 from copy import deepcopy
 
@@ -26,6 +27,28 @@ from ansible_collections.cisco.ios.plugins.module_utils.network.ios.argspec.vlan
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.vlans import (
     VlansTemplate,
 )
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.spec_walker import (
+    validate_config,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.vlan_set import VlanSet
+
+
+# the tables of show vlan, by a text of their header line
+VLAN_TABLES = (
+    ("VLAN Name", "name"),
+    ("VLAN Type", "type"),
+    ("Remote SPAN", "remote_span"),
+    ("VLAN AREHops", "hops"),
+    ("STEHops", "hops"),
+    ("Primary Secondary", "private"),
+)
+VLAN_STATES = {
+    "active": "active",
+    "act": "active",
+    "suspended": "suspend",
+    "sus": "suspend",
+}
+VLAN_LIST_RE = re.compile(r"^\d[\d,-]*$")
 
 
 class VlansFacts(object):
@@ -87,118 +110,16 @@ class VlansFacts(object):
         :returns: facts
         """
 
-        objs = []
-        mtu_objs = []
-        remote_objs = []
-        final_objs = []
-        pvlan_objs = []
         # Determine if we need to collect vlan data or config data
         vlan_data = data if data else self.get_vlans_data(connection)
-        vlan_conf_data = None
         vlan_conf_data = self.populate_vlans_config_facts(connection, data)
-        # operate on a collection of resource x
-        config = vlan_data.split("\n") if vlan_data else []
-
-        vlan_info = ""
-        temp = ""
-        vlan_name = True
-
-        for conf in config:
-            if len(list(filter(None, conf.split(" ")))) <= 2 and vlan_name:
-                temp = temp + conf
-                if len(list(filter(None, temp.split(" ")))) <= 2:
-                    continue
-            if "VLAN Name" in conf:
-                vlan_info = "Name"
-            elif "VLAN Type" in conf:
-                vlan_info = "Type"
-                vlan_name = False
-            elif "Remote SPAN" in conf:
-                vlan_info = "Remote"
-                vlan_name = False
-            elif "VLAN AREHops" in conf or "STEHops" in conf:
-                vlan_info = "Hops"
-                vlan_name = False
-            elif "Primary Secondary" in conf:
-                vlan_info = "Private"
-                vlan_name = False
-            if temp:
-                conf = temp
-                temp = ""
-            if conf and " " not in filter(None, conf.split("-")) and not conf.split(" ")[0] == "":
-                obj = self.render_config(self.generated_spec, conf, vlan_info)
-                if "mtu" in obj:
-                    mtu_objs.append(obj)
-                elif "remote_span" in obj:
-                    remote_objs = obj
-                elif "tmp_pvlans" in obj:
-                    pvlan_objs.append(obj)
-                elif obj:
-                    objs.append(obj)
-
-        # Appending MTU value to the retrieved dictionary
-        for o, m in zip(objs, mtu_objs):
-            o.update(m)
-            final_objs.append(o)
-
-        # Appending Remote Span value to related VLAN
-        if remote_objs:
-            if remote_objs.get("remote_span"):
-                for each in remote_objs.get("remote_span"):
-                    for every in final_objs:
-                        if each == every.get("vlan_id"):
-                            every.update({"remote_span": True})
-                            break
-
-        # Appending private vlan information to related VLAN
-        if pvlan_objs:
-            pvlan_final = {}
-            if len(pvlan_objs) > 0:
-                # Sanitize and structure everything
-                for data in pvlan_objs:
-                    pvdata = data.get("tmp_pvlans")
-                    privlan = pvdata.get("primary")
-                    secvlan = pvdata.get("secondary")
-                    sectype = pvdata.get("sec_type")
-
-                    # Define the secondary VLAN's type
-                    if secvlan and (isinstance(secvlan, int) or secvlan.isnumeric()):
-                        secvlan = int(secvlan)
-                        pvlan_final[secvlan] = {"private_vlan": {"type": sectype}}
-
-                    # Assemble and merge data for primary private VLANs
-                    if privlan and (isinstance(privlan, int) or privlan.isnumeric()):
-                        privlan = int(privlan)
-                        if privlan not in pvlan_final.keys():
-                            pvlan_final[privlan] = {
-                                "private_vlan": {"type": "primary", "associated": []},
-                            }
-                        if secvlan and (isinstance(secvlan, int) or secvlan.isnumeric()):
-                            pvlan_final[privlan]["private_vlan"]["associated"].append(
-                                int(secvlan),
-                            )
-
-                # Associate with the proper VLAN in final_objs
-                for vlan_id, data in pvlan_final.items():
-                    for every in final_objs:
-                        if vlan_id == every.get("vlan_id"):
-                            every.update(data)
+        objs = self.parse_vlans(vlan_data, vlan_conf_data)
 
         facts = {}
 
-        if vlan_conf_data:
-            for vlan in objs:
-                if vlan_conf_data.get(vlan.get("vlan_id")):
-                    member_data = vlan_conf_data.pop(vlan.get("vlan_id"))
-                    vlan.update(member_data)
-
-            if vlan_conf_data:  # if any vlan configuration data is pending add it to facts
-                for vlanid, conf in vlan_conf_data.items():
-                    objs.append(conf)
-
         if objs:
             facts["vlans"] = []
-            params = utils.validate_config(self.argument_spec, {"config": objs})
+            params = validate_config(self.argument_spec, {"config": objs}, self._module)
 
             for cfg in params["config"]:
                 facts["vlans"].append(utils.remove_empties(cfg))
@@ -206,81 +127,107 @@ class VlansFacts(object):
 
         return ansible_facts
 
-    def render_config(self, spec, conf, vlan_info):
+    def parse_vlans(self, data, vlan_conf_data=None):
+        """Parse the tables of show vlan in one pass, joining their rows on
+        the VLAN ID, and merge the vlan configuration facts into the VLANs
+
+        :param data: The show vlan output
+        :param vlan_conf_data: The vlan configuration facts, by VLAN ID
+        :rtype: list
+        :returns: The VLANs, in the order of show vlan, then the vlan
+                  configurations of the VLANs it does not list
         """
-        Render config as dictionary structure and delete keys
-          from spec for null values
+        vlan_conf_data = dict(vlan_conf_data or {})
+        vlans = {}
+        remote_span = VlanSet()
+        private_vlans = {}
+        table = None
+        wrapped = None
+
+        for line in (data or "").split("\n"):
+            header = self._table_header(line)
+            if header:
+                table = header
+                wrapped = None
+                continue
+            indented = line[:1].isspace()
+            if table == "name" and wrapped and indented:
+                # the status of a VLAN with a long name is on the next line
+                tokens = wrapped + line.split()
+                wrapped = None
+            elif indented or not line:
+                # ports of the previous VLAN, or a blank line
+                continue
+            else:
+                tokens = line.split()
 
-        :param spec: The facts tree, generated from the argspec
-        :param conf: The configuration
-        :rtype: dictionary
-        :returns: The generated config
+            if table == "name":
+                if not tokens[0].isdigit():
+                    continue
+                if len(tokens) < 3:
+                    wrapped = tokens
+                    continue
+                vlan = self._parse_name_row(tokens)
+                vlan.update(vlan_conf_data.pop(vlan["vlan_id"], None) or {})
+                vlans[vlan["vlan_id"]] = vlan
+            elif table == "type":
+                if len(tokens) > 3 and tokens[0].isdigit() and tokens[3].isdigit():
+                    vlan = vlans.get(int(tokens[0]))
+                    if vlan is not None:
+                        vlan["mtu"] = int(tokens[3])
+            elif table == "remote_span":
+                if VLAN_LIST_RE.match(line.strip()):
+                    remote_span |= VlanSet.from_ranges(line.strip())
+            elif table == "private" and len(tokens) > 2:
+                self._add_private_vlan(private_vlans, *tokens[:3])
+
+        for vlan_id in remote_span:
+            if vlan_id in vlans:
+                vlans[vlan_id]["remote_span"] = True
+        for vlan_id, private_vlan in private_vlans.items():
+            if vlan_id in vlans:
+                vlans[vlan_id].update(private_vlan)
+
+        # vlan configurations pending for VLANs show vlan does not list
+        return list(vlans.values()) + list(vlan_conf_data.values())
+
+    @staticmethod
+    def _table_header(line):
+        for header, table in VLAN_TABLES:
+            if header in line:
+                return table
+        return None
+
+    @staticmethod
+    def _parse_name_row(tokens):
+        """Return the VLAN of a row of the VLAN Name table, whose name runs
+        up to its status
         """
-        config = deepcopy(spec)
-
-        if vlan_info == "Name" and "VLAN Name" not in conf:
-            conf = list(filter(None, conf.split(" ")))
-            config["vlan_id"] = int(conf[0])
-            config["name"] = conf[1]
-            state_idx = 2
-            for i in range(2, len(conf)):  # check for index where state starts
-                if conf[i] in ["suspended", "active"]:
-                    state_idx = i
-                    break
-                elif conf[i].split("/")[0] in ["sus", "act"]:
-                    state_idx = i
-                    break
-                config["name"] += " " + conf[i]
-            try:
-                if len(conf[state_idx].split("/")) > 1:
-                    _state = conf[state_idx].split("/")[0]
-                    if _state == "sus":
-                        config["state"] = "suspend"
-                    elif _state == "act":
-                        config["state"] = "active"
-                    config["shutdown"] = "enabled"
-                else:
-                    if conf[state_idx] == "suspended":
-                        config["state"] = "suspend"
-                    elif conf[state_idx] == "active":
-                        config["state"] = "active"
-                    config["shutdown"] = "disabled"
-            except IndexError:
-                pass
-        elif vlan_info == "Type" and "VLAN Type" not in conf:
-            conf = list(filter(None, conf.split(" ")))
-            config["mtu"] = int(conf[3])
-        elif vlan_info == "Remote":
-            if len(conf.split(",")) > 1 or conf.isdigit():
-                remote_span_vlan = []
-                if len(conf.split(",")) > 1:
-                    remote_span_vlan = conf.split(",")
-                else:
-                    remote_span_vlan.append(conf)
-                remote_span = []
-                for each in remote_span_vlan:
-                    split_sp_list = each.split("-")
-                    if len(split_sp_list) > 1:  # break range
-                        for r_sp in range(
-                            int(split_sp_list[0]),
-                            int(split_sp_list[1]) + 1,
-                        ):
-                            remote_span.append(r_sp)
-                    else:
-                        remote_span.append(int(each))
-                config["remote_span"] = remote_span
-
-        elif vlan_info == "Private" and "Primary Secondary" not in conf:
-            conf = list(filter(None, conf.split(" ")))
-
-            pri_idx = 0
-            sec_idx = 1
-            priv_type_idx = 2
-
-            config["tmp_pvlans"] = {
-                "primary": conf[pri_idx],
-                "secondary": conf[sec_idx],
-                "sec_type": conf[priv_type_idx],
-            }
-
-        return utils.remove_empties(config)
+        vlan = {"vlan_id": int(tokens[0]), "name": tokens[1]}
+        for token in tokens[2:]:
+            if token in VLAN_STATES:
+                vlan["state"] = VLAN_STATES[token]
+                vlan["shutdown"] = "disabled"
+                break
+            status = token.split("/")
+            if len(status) > 1 and status[0] in VLAN_STATES:
+                # act/lshut, act/unsup and such
+                vlan["state"] = VLAN_STATES[status[0]]
+                vlan["shutdown"] = "enabled"
+                break
+            vlan["name"] += " " + token
+        return vlan
+
+    @staticmethod
+    def _add_private_vlan(private_vlans, primary, secondary, sec_type):
+        """Record a row of the Primary Secondary table"""
+        if secondary.isnumeric():
+            private_vlans[int(secondary)] = {"private_vlan": {"type": sec_type}}
+        if primary.isnumeric():
+            primary = int(primary)
+            if primary not in private_vlans:
+                private_vlans[primary] = {
+                    "private_vlan": {"type": "primary", "associated": []},
+                }
+            if secondary.isnumeric():
+                private_vlans[primary]["private_vlan"]["associated"].append(int(secondary))
@@ -23,6 +23,9 @@ from ansible_collections.cisco.ios.plugins.module_utils.network.ios.argspec.vrf_
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.vrf_interfaces import (
     Vrf_interfacesTemplate,
 )
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.interface_blocks import (
+    InterfaceBlockIndex,
+)
 
 
 class Vrf_interfacesFacts(object):
@@ -58,7 +61,7 @@ class Vrf_interfacesFacts(object):
 
         # Parse native config using the Vrf_interfaces template
         vrf_interfaces_parser = Vrf_interfacesTemplate(
-            lines=data.splitlines(),
+            lines=InterfaceBlockIndex.for_config(data).lines(),
             module=self._module,
         )
 
@@ -77,7 +77,7 @@ def get_config(module, flags=None):
     flags = to_list(flags)
 
     section_filter = False
-    if flags and "section" in flags[-1]:
+    if flags and ("section" in flags[-1] or flags[-1].startswith("interface ")):
         section_filter = True
 
     flag_str = " ".join(flags)
@@ -90,15 +90,37 @@ def get_config(module, flags=None):
             out = connection.get_config(flags=flags)
         except ConnectionError as exc:
             if section_filter:
-                # Some ios devices don't understand `| section foo`
+                # Some ios devices don't understand `| section foo` or
+                # `interface foo`, fall back to the unfiltered config
                 out = get_config(module, flags=flags[:-1])
             else:
                 module.fail_json(msg=to_text(exc, errors="surrogate_then_replace"))
         cfg = to_text(out, errors="surrogate_then_replace").strip()
         _DEVICE_CONFIGS[flag_str] = cfg
+        _record_config_cache(module, connection)
         return cfg
 
 
+def _record_config_cache(module, connection):
+    if not get_capabilities(module).get("config_cache"):
+        return
+    try:
+        hit = connection.get_config_cache_hit()
+    except ConnectionError:
+        return
+    # a module is served from the cache only when all of its fetches were
+    state = getattr(module, "_ios_config_cache", {"hit": True})
+    module._ios_config_cache = {"hit": state["hit"] and bool(hit)}
+
+
+def get_config_cache(module):
+    """Return whether the running-config of the module came from the connection cache
+
+    :returns: A dict with the hit key, or None when the cache is not enabled
+    """
+    return getattr(module, "_ios_config_cache", None)
+
+
 def run_commands(module, commands, check_rc=True):
     connection = get_connection(module)
     try:
@@ -107,6 +129,28 @@ def run_commands(module, commands, check_rc=True):
         module.fail_json(msg=to_text(exc))
 
 
+def run_commands_batch(module, commands, check_rc=True):
+    """Run a list of commands in a single connection call
+
+    :returns: A list of dicts with the command, output, error and elapsed keys
+    """
+    connection = get_connection(module)
+    try:
+        batch = connection.run_commands_batch(commands=commands, check_rc=check_rc)
+    except ConnectionError as exc:
+        module.fail_json(msg=to_text(exc))
+
+    timing = getattr(module, "_ios_command_timing", [])
+    timing.extend(dict(command=item["command"], elapsed=item["elapsed"]) for item in batch)
+    module._ios_command_timing = timing
+    return batch
+
+
+def get_command_timing(module):
+    """Return the per-command timing of every batch run by the module"""
+    return getattr(module, "_ios_command_timing", [])
+
+
 def load_config(module, commands):
     connection = get_connection(module)
 
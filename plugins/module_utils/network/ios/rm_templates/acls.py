@@ -17,8 +17,9 @@ the given network resource.
 import re
 
 from ansible.module_utils.common.text.converters import to_text
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
-    NetworkTemplate,
+
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.network_template import (
+    IosNetworkTemplate,
 )
 
 
@@ -173,9 +174,11 @@ def _tmplt_access_list_entries(aces):
     return command
 
 
-class AclsTemplate(NetworkTemplate):
-    def __init__(self, lines=None):
-        super(AclsTemplate, self).__init__(lines=lines, tmplt=self)
+class AclsTemplate(IosNetworkTemplate):
+    def __init__(self, lines=None, module=None):
+        super(AclsTemplate, self).__init__(lines=lines, tmplt=self, module=module)
+
+    INCREMENTAL_PARSE = True
 
     PARSERS = [
         {
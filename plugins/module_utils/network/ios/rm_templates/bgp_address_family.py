@@ -17,8 +17,8 @@ the given network resource.
 
 import re
 
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
-    NetworkTemplate,
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.network_template import (
+    IosNetworkTemplate,
 )
 
 
@@ -26,7 +26,7 @@ UNIQUE_AFI = "{{ afi|d() + '_' + safi|d() + '_' + vrf|d() }}"
 UNIQUE_NEIB_ADD = "{{ neighbor_address }}"
 
 
-class Bgp_address_familyTemplate(NetworkTemplate):
+class Bgp_address_familyTemplate(IosNetworkTemplate):
     def __init__(self, lines=None, module=None):
         super(Bgp_address_familyTemplate, self).__init__(
             lines=lines,
@@ -34,6 +34,8 @@ class Bgp_address_familyTemplate(NetworkTemplate):
             module=module,
         )
 
+    INCREMENTAL_PARSE = True
+
     PARSERS = [
         {
             "name": "as_number",
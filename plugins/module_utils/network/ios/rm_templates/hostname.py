@@ -17,12 +17,12 @@ the given network resource.
 
 import re
 
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
-    NetworkTemplate,
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.network_template import (
+    IosNetworkTemplate,
 )
 
 
-class HostnameTemplate(NetworkTemplate):
+class HostnameTemplate(IosNetworkTemplate):
     def __init__(self, lines=None, module=None):
         super(HostnameTemplate, self).__init__(lines=lines, tmplt=self, module=module)
 
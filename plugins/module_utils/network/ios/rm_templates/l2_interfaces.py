@@ -17,15 +17,17 @@ the given network resource.
 
 import re
 
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
-    NetworkTemplate,
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.network_template import (
+    IosNetworkTemplate,
 )
 
 
-class L2_interfacesTemplate(NetworkTemplate):
+class L2_interfacesTemplate(IosNetworkTemplate):
     def __init__(self, lines=None, module=None):
         super(L2_interfacesTemplate, self).__init__(lines=lines, tmplt=self, module=module)
 
+    INCREMENTAL_PARSE = True
+
     # fmt: off
     PARSERS = [
         {
@@ -17,8 +17,8 @@ the given network resource.
 
 import re
 
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
-    NetworkTemplate,
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.network_template import (
+    IosNetworkTemplate,
 )
 
 
@@ -59,10 +59,12 @@ def ipv4_dhcp(config_data):
     return cmd
 
 
-class L3_interfacesTemplate(NetworkTemplate):
+class L3_interfacesTemplate(IosNetworkTemplate):
     def __init__(self, lines=None, module=None):
         super(L3_interfacesTemplate, self).__init__(lines=lines, tmplt=self, module=module)
 
+    INCREMENTAL_PARSE = True
+
     # fmt: off
     PARSERS = [
         {
@@ -17,8 +17,8 @@ the given network resource.
 
 import re
 
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
-    NetworkTemplate,
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.network_template import (
+    IosNetworkTemplate,
 )
 
 
@@ -245,7 +245,7 @@ def tmplt_persistent(config_data):
     return cmd
 
 
-class Logging_globalTemplate(NetworkTemplate):
+class Logging_globalTemplate(IosNetworkTemplate):
     def __init__(self, lines=None, module=None):
         super(Logging_globalTemplate, self).__init__(lines=lines, tmplt=self, module=module)
 
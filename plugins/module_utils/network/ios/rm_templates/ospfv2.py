@@ -5,8 +5,8 @@ __metaclass__ = type
 
 import re
 
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
-    NetworkTemplate,
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.network_template import (
+    IosNetworkTemplate,
 )
 
 
@@ -143,9 +143,9 @@ def _tmplt_ospf_passive_interfaces(config_data):
         return cmd
 
 
-class Ospfv2Template(NetworkTemplate):
-    def __init__(self, lines=None):
-        super(Ospfv2Template, self).__init__(lines=lines, tmplt=self)
+class Ospfv2Template(IosNetworkTemplate):
+    def __init__(self, lines=None, module=None):
+        super(Ospfv2Template, self).__init__(lines=lines, tmplt=self, module=module)
 
     PARSERS = [
         {
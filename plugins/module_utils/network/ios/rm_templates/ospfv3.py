@@ -5,8 +5,8 @@ __metaclass__ = type
 
 import re
 
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
-    NetworkTemplate,
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.network_template import (
+    IosNetworkTemplate,
 )
 
 
@@ -513,7 +513,7 @@ def _tmplt_ospf_ttl_security(config_data):
         return command
 
 
-class Ospfv3Template(NetworkTemplate):
+class Ospfv3Template(IosNetworkTemplate):
     def __init__(self, lines=None, module=None):
         super(Ospfv3Template, self).__init__(lines=lines, tmplt=self, module=module)
 
@@ -17,14 +17,14 @@ the given network resource.
 
 import re
 
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
-    NetworkTemplate,
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.network_template import (
+    IosNetworkTemplate,
 )
 
 
-class PingTemplate(NetworkTemplate):
-    def __init__(self, lines=None):
-        super(PingTemplate, self).__init__(lines=lines, tmplt=self)
+class PingTemplate(IosNetworkTemplate):
+    def __init__(self, lines=None, module=None):
+        super(PingTemplate, self).__init__(lines=lines, tmplt=self, module=module)
 
     # fmt: off
     PARSERS = [
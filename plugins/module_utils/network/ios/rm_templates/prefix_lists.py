@@ -17,14 +17,16 @@ the given network resource.
 
 import re
 
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
-    NetworkTemplate,
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.network_template import (
+    IosNetworkTemplate,
 )
 
 
-class Prefix_listsTemplate(NetworkTemplate):
-    def __init__(self, lines=None):
-        super(Prefix_listsTemplate, self).__init__(lines=lines, tmplt=self)
+class Prefix_listsTemplate(IosNetworkTemplate):
+    def __init__(self, lines=None, module=None):
+        super(Prefix_listsTemplate, self).__init__(lines=lines, tmplt=self, module=module)
+
+    INCREMENTAL_PARSE = True
 
     PARSERS = [
         {
@@ -17,8 +17,8 @@ the given network resource.
 
 import re
 
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
-    NetworkTemplate,
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.network_template import (
+    IosNetworkTemplate,
 )
 
 
@@ -647,9 +647,11 @@ def _tmplt_route_map_set_ipv6(config_data):
         return cmd
 
 
-class Route_mapsTemplate(NetworkTemplate):
-    def __init__(self, lines=None):
-        super(Route_mapsTemplate, self).__init__(lines=lines, tmplt=self)
+class Route_mapsTemplate(IosNetworkTemplate):
+    def __init__(self, lines=None, module=None):
+        super(Route_mapsTemplate, self).__init__(lines=lines, tmplt=self, module=module)
+
+    INCREMENTAL_PARSE = True
 
     PARSERS = [
         {
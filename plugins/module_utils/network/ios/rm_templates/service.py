@@ -17,8 +17,8 @@ the given network resource.
 
 import re
 
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
-    NetworkTemplate,
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.network_template import (
+    IosNetworkTemplate,
 )
 
 
@@ -37,7 +37,7 @@ def handleTimestamp(config_data):
     return command
 
 
-class ServiceTemplate(NetworkTemplate):
+class ServiceTemplate(IosNetworkTemplate):
     def __init__(self, lines=None, module=None):
         super(ServiceTemplate, self).__init__(lines=lines, tmplt=self, module=module)
 
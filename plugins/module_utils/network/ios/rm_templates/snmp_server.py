@@ -17,8 +17,8 @@ the given network resource.
 
 import re
 
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
-    NetworkTemplate,
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.network_template import (
+    IosNetworkTemplate,
 )
 
 
@@ -101,10 +101,12 @@ def cmd_option_trap_bgp(config_data):
     return cmd
 
 
-class Snmp_serverTemplate(NetworkTemplate):
+class Snmp_serverTemplate(IosNetworkTemplate):
     def __init__(self, lines=None, module=None):
         super(Snmp_serverTemplate, self).__init__(lines=lines, tmplt=self, module=module)
 
+    INCREMENTAL_PARSE = True
+
     # fmt: off
     PARSERS = [
         {
@@ -17,8 +17,8 @@ the given network resource.
 
 import re
 
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
-    NetworkTemplate,
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.network_template import (
+    IosNetworkTemplate,
 )
 
 
@@ -32,7 +32,7 @@ def vlan_associated_config(config):
     return "private-vlan association " + cmd
 
 
-class VlansTemplate(NetworkTemplate):
+class VlansTemplate(IosNetworkTemplate):
     def __init__(self, lines=None, module=None):
         super(VlansTemplate, self).__init__(
             lines=lines,
@@ -40,6 +40,8 @@ class VlansTemplate(NetworkTemplate):
             module=module,
         )
 
+    INCREMENTAL_PARSE = True
+
     # fmt: off
     PARSERS = [
         {
@@ -0,0 +1,224 @@
+#
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Local emulation of the IOS ``| section`` and ``| include`` output filters
+over a single ``show running-config`` snapshot.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import io
+import re
+
+
+RUNNING_CONFIG_FILTER_RE = re.compile(r"^show running-config \| (section|include) (.+)$")
+REGEX_SPECIAL_CHARS = frozenset(".^$*+?()[]{}|\\")
+
+
+def regex_alternation(names, suffix=""):
+    """Return an IOS filter regex group matching any of the names literally
+
+    :param names: The names, such as ACL or route-map names
+    :param suffix: Regex each name is followed by, kept inside the group so
+                   that a filter ending with it does not end in a blank,
+                   which the IOS command line would trim
+    :rtype: str
+    """
+    escaped = []
+    for name in names:
+        escaped.append("".join("\\" + c if c in REGEX_SPECIAL_CHARS else c for c in name) + suffix)
+    return "(%s)" % "|".join(escaped)
+
+
+def _indent(line):
+    return len(line) - len(line.lstrip(" "))
+
+
+def _top_level_only(pattern):
+    """Check whether every alternative of a filter regex is anchored to a
+    non-blank first column, so that indented lines can never match.
+
+    :param pattern: The IOS filter regex
+    :rtype: bool
+    """
+    if "(" in pattern:
+        return False
+    for branch in pattern.split("|"):
+        if not branch.startswith("^") or branch[1:2] in ("", " ", "\\", "[", ".", "(", "*"):
+            return False
+    return True
+
+
+def split_sections(config):
+    """Split a configuration into top-level sections
+
+    :param config: The configuration text
+    :rtype: list
+    :returns: A list of sections, each a list of lines where the
+              first element is the top-level line
+    """
+    return split_lines(config.splitlines())
+
+
+def split_lines(lines):
+    """Split the lines of a configuration into top-level sections
+
+    :param lines: The configuration lines
+    :rtype: list
+    :returns: The sections, as split_sections returns them
+    """
+    return list(iter_sections(lines))
+
+
+def iter_sections(lines):
+    """Yield the top-level sections of the lines of a configuration one at a
+    time, each once its last line is read
+
+    :param lines: An iterable of the configuration lines
+    """
+    section = None
+    for line in lines:
+        if line[:1] == " " and section:
+            section.append(line)
+        else:
+            if section:
+                yield section
+            section = [line]
+    if section:
+        yield section
+
+
+def iter_lines(text):
+    """Yield the lines of a text one at a time, split as str.splitlines()
+    splits them on \\n, \\r and \\r\\n
+
+    :param text: The text, such as a command output
+    """
+    for line in io.StringIO(text, newline=None):
+        yield line[:-1] if line[-1:] == "\n" else line
+
+
+def filter_section(sections, pattern):
+    """Emulate ``| section <pattern>``: every matching line is returned along
+    with the lines indented beneath it.
+
+    :param sections: Output of split_sections
+    :param pattern: The IOS filter regex
+    :rtype: list
+    """
+    regex = re.compile(pattern)
+    top_level_only = _top_level_only(pattern)
+    result = []
+    for section in sections:
+        if regex.search(section[0]):
+            result.extend(section)
+            continue
+        if top_level_only:
+            continue
+        idx = 1
+        while idx < len(section):
+            line = section[idx]
+            idx += 1
+            if regex.search(line):
+                indent = _indent(line)
+                result.append(line)
+                while idx < len(section) and _indent(section[idx]) > indent:
+                    result.append(section[idx])
+                    idx += 1
+    return result
+
+
+def filter_include(sections, pattern):
+    """Emulate ``| include <pattern>``
+
+    :param sections: Output of split_sections
+    :param pattern: The IOS filter regex
+    :rtype: list
+    """
+    regex = re.compile(pattern)
+    top_level_only = _top_level_only(pattern)
+    result = []
+    for section in sections:
+        lines = section[:1] if top_level_only else section
+        result.extend(line for line in lines if regex.search(line))
+    return result
+
+
+class RunningConfigSnapshot(object):
+    """Connection proxy shared by the resource facts classes of one facts run.
+
+    The first ``show running-config | section ...`` or ``| include ...``
+    request fetches the whole running-config once; it and every later filter
+    request are answered locally from that snapshot.  Any other call (for
+    example operational ``show`` commands) is passed to the real connection.
+    """
+
+    def __init__(self, connection):
+        self._connection = connection
+        self._sections = None
+        self._fetch_failed = False
+        self.size = None
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+    def _get_sections(self):
+        if self._sections is None and not self._fetch_failed:
+            try:
+                config = self._connection.get("show running-config")
+            except Exception:
+                self._fetch_failed = True
+            else:
+                self._sections = split_sections(config)
+                self.size = len(config)
+        return self._sections
+
+    def prefetch(self):
+        """Fetch the running-config now rather than on the first filter request
+
+        :rtype: int
+        :returns: The size of the running-config in characters, or None when
+                  it could not be fetched
+        """
+        if self._get_sections() is None:
+            return None
+        return self.size
+
+    def get_local(self, command):
+        """Answer a filter request from the snapshot
+
+        :param command: The command, such as
+                        ``show running-config | section ^interface``
+        :rtype: str
+        :returns: The filtered configuration, or None when the command is not
+                  a filter request or the snapshot cannot answer it
+        """
+        match = RUNNING_CONFIG_FILTER_RE.match(command or "")
+        if not match:
+            return None
+        sections = self._get_sections()
+        if sections is None:
+            return None
+        filter_type, pattern = match.groups()
+        try:
+            if filter_type == "section":
+                lines = filter_section(sections, pattern)
+            else:
+                lines = filter_include(sections, pattern)
+        except re.error:
+            return None
+        return "\n".join(lines)
+
+    def get(self, command=None, *args, **kwargs):
+        if not args and not kwargs:
+            output = self.get_local(command)
+            if output is not None:
+                return output
+        return self._connection.get(command, *args, **kwargs)
@@ -0,0 +1,277 @@
+#
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+IOS configuration tree with hash indexed diffing.
+
+IosNetworkConfig is a drop-in NetworkConfig whose line lookups are done with
+dictionaries and sets keyed by the line text of each entry and its parents,
+instead of list scans that compare every pair of lines.  The generated diff
+is the same as NetworkConfig.difference().
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import re
+
+from ansible.module_utils.common.text.converters import to_native
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.config import (
+    DEFAULT_COMMENT_TOKENS,
+    ConfigLine,
+    NetworkConfig,
+)
+
+
+DEFAULT_IGNORE_LINES = [
+    r"Using \d+ out of \d+ bytes",
+    r"Building configuration",
+    r"Current configuration : \d+ bytes",
+]
+
+TOPLEVEL_RE = re.compile(r"\S")
+CHILDLINE_RE = re.compile(r"^\s*(.+)$")
+ENTRY_RE = re.compile(r"([{};])")
+
+
+def compile_ignore_lines(ignore_lines=None):
+    """Compile the default and the given ignore patterns into as few regexes
+    as possible
+
+    :param ignore_lines: List of regex strings or compiled patterns
+    :rtype: list
+    :returns: A single alternation when every pattern can be combined without
+              changing its meaning, the individual patterns otherwise
+    """
+    patterns = [re.compile(item) for item in DEFAULT_IGNORE_LINES]
+    for item in ignore_lines or []:
+        patterns.append(item if hasattr(item, "match") else re.compile(item))
+
+    # groups could be back-referenced and flags apply to the whole pattern,
+    # keep such patterns separate
+    if all(p.groups == 0 and p.flags == re.compile("").flags for p in patterns):
+        return [re.compile("|".join("(?:%s)" % p.pattern for p in patterns))]
+    return patterns
+
+
+def line_key(obj):
+    """The text of a config line and its parents, as compared by ConfigLine"""
+    if obj._parents:
+        return " ".join([p.text for p in obj._parents] + [obj.text])
+    return obj.text
+
+
+class IosNetworkConfig(NetworkConfig):
+    """NetworkConfig with hash lookups for the line, block and add paths
+
+    Unlike NetworkConfig, ignore_lines only apply to the instance they are
+    given to instead of being added to a module wide set.
+    """
+
+    def __init__(self, indent=1, contents=None, comment_tokens=None, ignore_lines=None):
+        self._ignore_re = compile_ignore_lines(ignore_lines)
+        self._comment_tokens = tuple(comment_tokens or DEFAULT_COMMENT_TOKENS)
+        super(IosNetworkConfig, self).__init__(
+            indent=indent,
+            contents=contents,
+            comment_tokens=comment_tokens,
+        )
+
+    def ignore_line(self, text):
+        if text.startswith(self._comment_tokens):
+            return True
+        for regex in self._ignore_re:
+            if regex.match(text):
+                return True
+        return False
+
+    def parse(self, lines):
+        ancestors = list()
+        config = list()
+
+        indents = [0]
+
+        for line in to_native(lines, errors="surrogate_or_strict").split("\n"):
+            text = ENTRY_RE.sub("", line).strip()
+
+            if not text or self.ignore_line(text):
+                continue
+
+            cfg = ConfigLine(line)
+
+            # handle top level commands
+            if TOPLEVEL_RE.match(line):
+                ancestors = [cfg]
+                indents = [0]
+
+            # handle sub level commands
+            else:
+                line_indent = CHILDLINE_RE.match(line).start(1)
+
+                if line_indent < indents[-1]:
+                    while indents[-1] > line_indent:
+                        indents.pop()
+
+                if line_indent > indents[-1]:
+                    indents.append(line_indent)
+
+                curlevel = len(indents) - 1
+                parent_level = curlevel - 1
+
+                cfg._parents = ancestors[:curlevel]
+
+                if curlevel > len(ancestors):
+                    config.append(cfg)
+                    continue
+
+                del ancestors[curlevel:]
+
+                ancestors.append(cfg)
+                ancestors[parent_level].add_child(cfg)
+
+            config.append(cfg)
+
+        return config
+
+    def _expand_block(self, configobj, S=None):
+        if S is None:
+            S = list()
+        self._expand_block_into(configobj, S, set(line_key(obj) for obj in S))
+        return S
+
+    def _expand_block_into(self, configobj, S, seen):
+        S.append(configobj)
+        seen.add(line_key(configobj))
+        for child in configobj._children:
+            if line_key(child) in seen:
+                continue
+            self._expand_block_into(child, S, seen)
+
+    def _diff_line(self, other):
+        other_lines = set(line_key(item) for item in other)
+        return [item for item in self.items if line_key(item) not in other_lines]
+
+    def difference(self, other, match="line", path=None, replace=None):
+        """Perform a config diff against another network config
+
+        :param other: instance of NetworkConfig to diff against
+        :param match: type of diff to perform, one of line, strict, exact
+        :param path: context in the network config to filter the diff
+        :param replace: the method used to generate the replacement lines,
+            one of block, line
+        :returns: the list of ConfigLine objects that are different
+        """
+        if path and match != "line":
+            try:
+                other = other.get_block(path)
+            except ValueError:
+                other = list()
+        else:
+            other = other.items
+
+        meth = getattr(self, "_diff_%s" % match)
+        updates = meth(other)
+
+        if replace == "block":
+            parents = list()
+            parent_lines = set()
+            for item in updates:
+                for p in item._parents if item.has_parents else [item]:
+                    key = line_key(p)
+                    if item.has_parents and key in parent_lines:
+                        continue
+                    parent_lines.add(key)
+                    parents.append(p)
+
+            updates = list()
+            for item in parents:
+                updates.extend(self._expand_block(item))
+
+        visited = set()
+        expanded = list()
+
+        for curr_elem in updates:
+            add_parents = False
+            if expanded:
+                last_elem = expanded[-1]
+                # If parent of current line not added in expanded list flag it
+                # to be added later on
+                if (
+                    curr_elem._parents
+                    and last_elem._parents
+                    and curr_elem._parents[0].text != last_elem._parents[0].text
+                ):
+                    add_parents = True
+                # check if parent of current line is already added, if added don't
+                # add again
+                if last_elem._children and last_elem._children[0].text != curr_elem.text:
+                    add_parents = True
+            for p in curr_elem._parents:
+                key = line_key(p)
+                if key not in visited or add_parents:
+                    visited.add(key)
+                    expanded.append(p)
+            expanded.append(curr_elem)
+            visited.add(line_key(curr_elem))
+
+        return expanded
+
+    def add(self, lines, parents=None):
+        ancestors = list()
+        offset = 0
+        obj = None
+
+        # global config command
+        if not parents:
+            existing = set(line_key(item) for item in self.items)
+            for line in lines:
+                # handle ignore lines
+                if self.ignore_line(line):
+                    continue
+
+                item = ConfigLine(line)
+                item.raw = line
+                if item.text not in existing:
+                    existing.add(item.text)
+                    self.items.append(item)
+
+        else:
+            for index, p in enumerate(parents):
+                try:
+                    i = index + 1
+                    obj = self.get_block(parents[:i])[0]
+                    ancestors.append(obj)
+
+                except ValueError:
+                    # add parent to config
+                    offset = index * self._indent
+                    obj = ConfigLine(p)
+                    obj.raw = p.rjust(len(p) + offset)
+                    if ancestors:
+                        obj._parents = list(ancestors)
+                        ancestors[-1]._children.append(obj)
+                    self.items.append(obj)
+                    ancestors.append(obj)
+
+            # add child objects
+            children = set(child.text for child in ancestors[-1]._children)
+            for line in lines:
+                # handle ignore lines
+                if self.ignore_line(line):
+                    continue
+
+                # check if child already exists
+                if line in children:
+                    continue
+                offset = len(parents) * self._indent
+                item = ConfigLine(line)
+                children.add(item.text)
+                item.raw = line.rjust(len(line) + offset)
+                item._parents = ancestors
+                ancestors[-1]._children.append(item)
+                self.items.append(item)
@@ -0,0 +1,168 @@
+#
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+The interface blocks of a configuration, split once and shared by the facts
+classes of the interface-scoped resources.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import re
+
+from ansible.module_utils.connection import ConnectionError
+
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.utils import (
+    normalize_interface,
+)
+
+
+NUMBER_RE = re.compile(r"\d+")
+
+# top-level lines closing an interface block, "end" closes the output of
+# show running-config interface
+BLOCK_ENDS = ("!", "end")
+
+# interfaces fetched one at a time at most, more are fetched with the whole
+# interface section
+MAX_TARGETED_INTERFACES = 16
+
+
+def get_interfaces_config(connection, names=None):
+    """Return the interface configuration of a device
+
+    :param connection: The device connection
+    :param names: The interfaces to fetch, all of them when None or when
+                  there are more than MAX_TARGETED_INTERFACES
+    :rtype: str
+    """
+    if names is None or len(names) > MAX_TARGETED_INTERFACES:
+        return connection.get("show running-config | section ^interface")
+    configs = []
+    for name in names:
+        try:
+            configs.append(connection.get("show running-config interface %s" % name))
+        except ConnectionError:
+            # interfaces that are not created yet
+            continue
+    return "\n".join(configs)
+
+
+def interface_sort_key(name):
+    """Return a key sorting interface names by type, then by the numbers in
+    them, so that GigabitEthernet1/0/10 comes after GigabitEthernet1/0/9
+    """
+    type_end = NUMBER_RE.search(name)
+    type_end = type_end.start() if type_end else len(name)
+    return (name[:type_end], tuple(int(n) for n in NUMBER_RE.findall(name, type_end)), name)
+
+
+class InterfaceBlock(object):
+    """The lines of one interface
+
+    :ivar name: The normalized interface name
+    :ivar lines: The lines of the block, starting with the interface line
+    :ivar sort_key: The interface_sort_key of the name
+    """
+
+    __slots__ = ("name", "lines", "sort_key")
+
+    def __init__(self, name, lines):
+        self.name = name
+        self.lines = lines
+        self.sort_key = interface_sort_key(name)
+
+
+class InterfaceBlockIndex(object):
+    """The interface blocks of a configuration, by normalized name
+
+    The blocks are kept in configuration order. A block holds every line
+    from its interface line up to the next interface line, indented or
+    not, so that configurations given without indentation split the same
+    way. A "!" or "end" line closes a block, the lines outside of blocks
+    are left out.
+    """
+
+    # configurations split last, the interface-scoped facts classes of one
+    # facts run are usually given the same one
+    _indexes = []
+    MAX_INDEXES = 2
+
+    def __init__(self, config):
+        """
+        :param config: The configuration text
+        """
+        self._blocks = {}
+        block = None
+        for line in config.splitlines():
+            if line.startswith("interface "):
+                words = line.split()
+                if len(words) >= 2:
+                    name = normalize_interface(words[1])
+                    block = self._blocks.get(name)
+                    if block is None:
+                        block = self._blocks[name] = InterfaceBlock(name, [line])
+                    continue
+            if line.rstrip() in BLOCK_ENDS:
+                block = None
+            elif block is not None:
+                block.lines.append(line)
+
+    @classmethod
+    def for_config(cls, config):
+        """Return the index of a configuration, reusing the index of one of
+        the last configurations split when it is the same text
+        """
+        for text, index in cls._indexes:
+            if text == config:
+                return index
+        index = cls(config)
+        cls._indexes = [(config, index)] + cls._indexes[: cls.MAX_INDEXES - 1]
+        return index
+
+    def __iter__(self):
+        return iter(self._blocks.values())
+
+    def __len__(self):
+        return len(self._blocks)
+
+    def __contains__(self, name):
+        return normalize_interface(name) in self._blocks
+
+    def get(self, name):
+        """Return the block of an interface, or None
+
+        :param name: The interface name, in any form normalize_interface
+                     accepts
+        """
+        return self._blocks.get(normalize_interface(name))
+
+    def blocks(self, names=None):
+        """Return the blocks of the named interfaces, or of all of them, in
+        configuration order
+
+        :param names: Interface names, the interfaces not configured are left
+                      out
+        :rtype: list
+        """
+        if names is None:
+            return list(self._blocks.values())
+        names = set(normalize_interface(name) for name in names)
+        return [block for block in self._blocks.values() if block.name in names]
+
+    def lines(self, names=None):
+        """Return the lines of the named interfaces, or of all of them
+
+        :param names: Interface names, as blocks() takes them
+        :rtype: list
+        """
+        lines = []
+        for block in self.blocks(names):
+            lines.extend(block.lines)
+        return lines
@@ -0,0 +1,551 @@
+#
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+The parser template base class for the ios resource modules.
+
+IosNetworkTemplate parses like NetworkTemplate but tries each line only
+against the parsers that can match it. The first word of every match of a
+getval regex is read from the regex itself, and the parsers are grouped by
+that word once per template class.
+
+The Jinja expressions of the result and setval templates are compiled once
+per process instead of once per rendering, and those that only substitute
+variables into text are rendered without Jinja.
+
+Templates that set INCREMENTAL_PARSE merge the result of each matched line
+into the facts in place with ResultBuilder, instead of copying all the facts
+parsed so far for every line as dict_merge does.
+
+When the parse_cache_path option of the connection is set, the results of
+the lines of each top-level block are kept on disk and the blocks already
+parsed by an earlier task are not parsed again.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import ast
+import json
+import re
+
+from collections.abc import Mapping
+from copy import deepcopy
+from itertools import chain
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
+    NetworkTemplate,
+)
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
+    JinjaTemplate,
+    dict_merge,
+    sort_list,
+)
+
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.config_sections import (
+    iter_sections,
+    split_lines,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.parse_cache import (
+    get_parse_cache,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.spec_walker import (
+    validate_config,
+)
+
+
+try:
+    from re import _constants as sre_constants
+    from re import _parser as sre_parse
+except ImportError:  # python < 3.11
+    import sre_constants
+    import sre_parse
+
+try:
+    from ansible.module_utils.common.parameters import _list_no_log_values as list_no_log_values
+except ImportError:
+    from ansible.module_utils.common.parameters import list_no_log_values
+
+try:
+    from jinja2 import nodes
+    from jinja2.exceptions import UndefinedError
+except ImportError:
+    # JinjaTemplate fails with the error to report
+    pass
+
+
+def _is_space(item):
+    """True if the regex item can only match whitespace characters"""
+    op, av = item
+    if op is sre_constants.LITERAL:
+        return chr(av).isspace()
+    if op is sre_constants.IN:
+        return all(
+            (o is sre_constants.CATEGORY and a is sre_constants.CATEGORY_SPACE)
+            or (o is sre_constants.LITERAL and chr(a).isspace())
+            for o, a in av
+        )
+    if op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+        return all(_is_space(sub) for sub in av[2])
+    return False
+
+
+def _requires_space(item):
+    """True if the regex item matches at least one whitespace character and
+    nothing else
+    """
+    op, av = item
+    if op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+        return av[0] > 0 and _is_space(item)
+    return _is_space(item)
+
+
+def _first_words(items, word=""):
+    """Return the set of words a match of the regex items can start with,
+    ignoring leading whitespace, or None when it can't be told
+
+    :param items: The parsed regex items left to match
+    :param word: The part of the first word matched so far
+    """
+    if not items:
+        return None
+    op, av = items[0]
+    rest = items[1:]
+    if not word and (
+        op is sre_constants.AT and av is sre_constants.AT_BEGINNING or _is_space(items[0])
+    ):
+        return _first_words(rest)
+    if op is sre_constants.LITERAL and not chr(av).isspace():
+        return _first_words(rest, word + chr(av))
+    if word and (
+        op is sre_constants.AT and av is sre_constants.AT_END or _requires_space(items[0])
+    ):
+        return set([word])
+    if op is sre_constants.SUBPATTERN:
+        if av[1] & re.IGNORECASE:
+            return None
+        return _first_words(list(av[-1].data) + rest, word)
+    alternatives = None
+    if op is sre_constants.BRANCH:
+        alternatives = [list(branch.data) + rest for branch in av[1]]
+    elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT) and av[0] == 0:
+        if av[1] == 1:
+            alternatives = [list(av[2].data) + rest, rest]
+        elif word and _is_space(items[0]):
+            # zero or more spaces either end the word or are not there
+            alternatives = [[(sre_constants.AT, sre_constants.AT_END)], rest]
+    if alternatives is None:
+        return None
+    words = set()
+    for alternative in alternatives:
+        found = _first_words(alternative, word)
+        if found is None:
+            return None
+        words.update(found)
+    return words
+
+
+def first_words(regex):
+    """Return the set of first words of the lines a getval regex can match,
+    or None when the regex has to be tried on every line
+
+    :param regex: A compiled regex or a pattern string
+    """
+    if isinstance(regex, str):
+        regex = re.compile(regex)
+    if regex.flags & re.IGNORECASE:
+        return None
+    try:
+        return _first_words(list(sre_parse.parse(regex.pattern, regex.flags).data))
+    except Exception:
+        return None
+
+
+class ParserIndex(object):
+    """The parsers of a template grouped by the first word they can match"""
+
+    def __init__(self, parsers):
+        self._by_word = {}
+        self._any = []
+        self._by_name = {}
+        for position, parser in enumerate(parsers):
+            self._by_name.setdefault(parser["name"], parser)
+            words = first_words(parser["getval"])
+            if words is None:
+                self._any.append((position, parser))
+            else:
+                for word in words:
+                    self._by_word.setdefault(word, []).append((position, parser))
+        self._candidates = {}
+
+    def get_parser(self, name):
+        try:
+            return self._by_name[name]
+        except KeyError:
+            # NetworkTemplate.get_parser fails the same way
+            raise IndexError("no parser named %s" % name)
+
+    def candidates(self, line):
+        """Return the parsers that can match the line, in PARSERS order"""
+        words = line.split(None, 1)
+        word = words[0] if words else ""
+        try:
+            return self._candidates[word]
+        except KeyError:
+            merged = sorted(self._by_word.get(word, []) + self._any, key=lambda item: item[0])
+            self._candidates[word] = [parser for position, parser in merged]
+            return self._candidates[word]
+
+
+def _substitution(env, value):
+    """Return the text and variable name parts of a template that only
+    substitutes variables into text, or None for any other template
+    """
+    body = env.parse(value).body
+    if len(body) != 1 or not isinstance(body[0], nodes.Output):
+        return None
+    parts = []
+    for node in body[0].nodes:
+        if isinstance(node, nodes.TemplateData):
+            parts.append((False, node.data))
+        elif isinstance(node, nodes.Name) and node.name not in env.globals:
+            parts.append((True, node.name))
+        else:
+            return None
+    return parts
+
+
+def _render_substitution(parts):
+    def render(variables):
+        out = []
+        for is_name, part in parts:
+            if not is_name:
+                out.append(part)
+            elif part in variables:
+                out.append(str(variables[part]))
+            else:
+                raise UndefinedError("'%s' is undefined" % part)
+        return "".join(out)
+
+    return render
+
+
+class CompiledTemplate(object):
+    """A drop-in for JinjaTemplate that keeps the compiled templates
+
+    Each template string is compiled once per process, by a single Jinja
+    environment, and the renderers are shared by all the instances. The
+    rendered values are converted the same way as JinjaTemplate does.
+    """
+
+    _jinja = None
+    _renderers = {}
+
+    def __init__(self):
+        if CompiledTemplate._jinja is None:
+            CompiledTemplate._jinja = JinjaTemplate()
+        self.env = self._jinja.env
+
+    def renderer(self, value):
+        """Return the callable rendering a template string, or None when the
+        string has no Jinja markup
+        """
+        try:
+            return self._renderers[value]
+        except KeyError:
+            pass
+        if not self._jinja.contains_vars(value):
+            renderer = None
+        else:
+            parts = _substitution(self.env, value)
+            if parts is None:
+                renderer = self.env.from_string(value).render
+            else:
+                renderer = _render_substitution(parts)
+        self._renderers[value] = renderer
+        return renderer
+
+    def __call__(self, value, variables=None, fail_on_undefined=True):
+        if not isinstance(value, str):
+            return value
+        renderer = self.renderer(value)
+        if renderer is None:
+            return value
+
+        try:
+            value = renderer(variables or {})
+        except UndefinedError:
+            if not fail_on_undefined:
+                return None
+            raise
+
+        if value:
+            try:
+                return ast.literal_eval(value)
+            except Exception:
+                return str(value)
+        else:
+            return None
+
+    def contains_vars(self, data):
+        return self._jinja.contains_vars(data)
+
+
+def _freeze(value):
+    """Return a hashable value that is equal for equal values, raises
+    TypeError for values that can't be hashed
+    """
+    if isinstance(value, dict):
+        return (dict, frozenset((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return (list, tuple(_freeze(v) for v in value))
+    hash(value)
+    return value
+
+
+class ResultBuilder(object):
+    """Build the facts of a template by merging the result of each matched
+    line into them in place
+
+    The facts are the same as the ones dict_merge returns when it is given
+    the facts built so far and the next result, but every merge only walks
+    down the keys of the result. The items of the lists that dict_merge
+    compares one by one, such as ACEs or neighbors, are looked up in a set
+    instead. The results are owned by the builder once merged.
+    """
+
+    def __init__(self):
+        self.result = {}
+        self._lists = {}
+
+    def merge(self, other):
+        """Merge the result of a line into the facts"""
+        self._merge(self.result, other)
+        return self.result
+
+    def _merge(self, base, other):
+        for key, item in other.items():
+            if key not in base:
+                base[key] = item
+                continue
+            value = base[key]
+            if item is None:
+                base[key] = None
+            elif isinstance(value, dict):
+                if isinstance(item, Mapping):
+                    self._merge(value, item)
+                else:
+                    base[key] = item
+            elif isinstance(value, list):
+                try:
+                    base[key] = list(set(chain(value, item)))
+                except TypeError:
+                    self._extend(value, item)
+            elif sort_list(value) != sort_list(item):
+                base[key] = item
+
+    def _extend(self, value, items):
+        """Add the items not in a list yet, like dict_merge does for lists of
+        unhashable items
+        """
+        try:
+            seen = self._lists[id(value)][1]
+        except KeyError:
+            try:
+                seen = set(_freeze(i) for i in value)
+            except TypeError:
+                seen = None
+            # the list is kept so that its id is not reused
+            self._lists[id(value)] = (value, seen)
+        if seen is not None:
+            try:
+                frozen = [(_freeze(i), i) for i in items]
+            except TypeError:
+                self._lists[id(value)] = (value, None)
+            else:
+                value.extend([i for key, i in frozen if key not in seen])
+                seen.update(key for key, i in frozen)
+                return
+        value.extend([i for i in items if i not in value])
+
+
+class IosNetworkTemplate(NetworkTemplate):
+    """NetworkTemplate with parsers looked up by the first word of each line
+
+    The lookup index is built once per template class, the first time one of
+    its instances parses or renders. Parsers are tried in PARSERS order and
+    the shared values are carried over the same way as NetworkTemplate does.
+    The setval and result templates are rendered with CompiledTemplate, and
+    the parsed facts are validated with the spec_walker validate_config.
+
+    Set INCREMENTAL_PARSE on a template to build its facts with
+    ResultBuilder, for templates parsing many entries such as ACEs.
+    """
+
+    INCREMENTAL_PARSE = False
+
+    _parser_indexes = {}
+
+    def __init__(self, lines=None, tmplt=None, prefix=None, module=None):
+        super(IosNetworkTemplate, self).__init__(
+            lines=lines,
+            tmplt=tmplt,
+            prefix=prefix,
+            module=module,
+        )
+        self._template = CompiledTemplate()
+
+    def _parser_index(self):
+        tmplt = type(self._tmplt)
+        try:
+            return IosNetworkTemplate._parser_indexes[tmplt]
+        except KeyError:
+            index = IosNetworkTemplate._parser_indexes[tmplt] = ParserIndex(self._tmplt.PARSERS)
+            return index
+
+    def parsers_for(self, line):
+        """Return the parsers to try on a line, in PARSERS order"""
+        return self._parser_index().candidates(line)
+
+    def _deepformat(self, tmplt, data):
+        # same as NetworkTemplate._deepformat, without copying the
+        # templates that are rendered to new values anyway
+        if isinstance(tmplt, str):
+            return self._template(value=tmplt, variables=data, fail_on_undefined=False)
+        if not isinstance(tmplt, dict):
+            return deepcopy(tmplt)
+        wtmplt = dict(
+            (tkey, tval if isinstance(tval, (str, dict, list)) else deepcopy(tval))
+            for tkey, tval in tmplt.items()
+        )
+        for tkey, tval in tmplt.items():
+            ftkey = self._template(tkey, data)
+            if ftkey != tkey:
+                wtmplt.pop(tkey)
+            if isinstance(tval, dict):
+                wtmplt[ftkey] = self._deepformat(tval, data)
+            elif isinstance(tval, list):
+                wtmplt[ftkey] = [self._deepformat(x, data) for x in tval]
+            elif isinstance(tval, str):
+                wtmplt[ftkey] = self._deepformat(tval, data)
+                if wtmplt[ftkey] is None:
+                    wtmplt.pop(ftkey)
+        return wtmplt
+
+    def _match(self, line):
+        """Return the parser matching a line and its match, or None"""
+        for parser in self.parsers_for(line):
+            cap = re.match(parser["getval"], line)
+            if cap:
+                return parser, cap
+        return None
+
+    def _parse_lines(self, lines, shared):
+        """Return the result of every matched line and the shared values
+        after the last line"""
+        results = []
+        for line in lines:
+            match = self._match(line)
+            if match:
+                parser, cap = match
+                capdict = cap.groupdict()
+                capdict = dict((k, v) for k, v in capdict.items() if v is not None)
+                if parser.get("shared"):
+                    shared = capdict
+                vals = dict_merge(capdict, shared)
+                results.append(self._deepformat(parser["result"], vals))
+        return results, shared
+
+    def _parse_cached(self, cache):
+        """Return the result of every matched line, reusing the results of
+        the top-level blocks found in the parse cache
+        """
+        results = []
+        shared = {}
+        for block in split_lines(self._lines):
+            block_results, shared = self._parse_block(block, shared, cache)
+            results.extend(block_results)
+        return results
+
+    def _parse_block(self, block, shared, cache):
+        """Return the result of every matched line of a top-level block and
+        the shared values after its last line, through the parse cache when
+        there is one
+
+        A block is keyed by its text and by the shared values it starts with,
+        unless its first line sets them.
+        """
+        if cache is None:
+            return self._parse_lines(block, shared)
+        resource = "%s.%s" % (type(self._tmplt).__module__, type(self._tmplt).__name__)
+        match = self._match(block[0])
+        if match and match[0].get("shared"):
+            start = ""
+        else:
+            start = json.dumps(shared, sort_keys=True)
+        key = cache.key(resource, start, "\n".join(block))
+        entry = cache.get(key)
+        if entry is None:
+            block_results, shared = self._parse_lines(block, shared)
+            cache.set(key, {"results": block_results, "shared": shared})
+            return block_results, shared
+        return entry["results"], entry["shared"]
+
+    def _merge_results(self, results):
+        """Merge the results of the matched lines into the facts"""
+        result = {}
+        builder = ResultBuilder() if self._tmplt.INCREMENTAL_PARSE else None
+        for res in results:
+            if builder is not None:
+                result = builder.merge(res)
+            else:
+                result = dict_merge(result, res)
+        return result
+
+    def parse(self):
+        """parse"""
+        cache = get_parse_cache(self._module) if self._lines else None
+        if cache is not None:
+            results = self._parse_cached(cache)
+        else:
+            results = self._parse_lines(self._lines, {})[0]
+        return self._merge_results(results)
+
+    def parse_blocks(self):
+        """Parse the lines one group of top-level blocks at a time, starting a
+        group at every top-level line matched by a shared parser, such as the
+        header of an ACL, and yield the facts of each group once its last line
+        is parsed
+
+        The lines may be any iterable, only the lines and results of one group
+        are held at a time. The facts of a group are the ones parse() builds
+        from its lines, so the groups give the facts of the whole
+        configuration as long as no two of them build the same entries.
+        """
+        cache = get_parse_cache(self._module)
+        shared = {}
+        results = []
+        for block in iter_sections(self._lines):
+            match = self._match(block[0])
+            if results and match and match[0].get("shared"):
+                yield self._merge_results(results)
+                results = []
+            block_results, shared = self._parse_block(block, shared, cache)
+            results.extend(block_results)
+        if results:
+            yield self._merge_results(results)
+
+    def get_parser(self, name):
+        """get_parsers"""
+        return self._parser_index().get_parser(name)
+
+    def validate_config(self, spec, data, redact=False):
+        validated_data = validate_config(spec, data, self._module)
+        if redact:
+            self._module.no_log_values.update(list_no_log_values(spec, validated_data))
+        return validated_data
@@ -0,0 +1,139 @@
+#
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Parsing of the facts of several resources in a pool of worker processes.
+
+The mode is enabled by the parse_workers option of the cliconf plugin, which
+reports its settings in the connection capabilities. The running-config is
+fetched once in the module process, the workers are forked from it and
+answer the ``| section`` and ``| include`` requests of the facts classes from
+that snapshot, so the only data sent between the processes are the resource
+names and the parsed facts. A resource whose facts class needs anything else
+from the device is parsed again in the module process.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import io
+import json
+import multiprocessing
+import multiprocessing.pool
+import os
+
+from contextlib import redirect_stdout
+
+from ansible.module_utils.connection import Connection
+
+
+# state inherited by the forked workers
+_WORKER_STATE = {}
+
+
+class DeviceAccessRequired(Exception):
+    """Raised in a worker by a request the snapshot cannot answer"""
+
+
+class SnapshotConnection(object):
+    """Connection of the workers, limited to the running-config snapshot"""
+
+    def __init__(self, snapshot):
+        self._snapshot = snapshot
+
+    def get(self, command=None, *args, **kwargs):
+        output = None if args or kwargs else self._snapshot.get_local(command)
+        if output is None:
+            raise DeviceAccessRequired(command)
+        return output
+
+    def __getattr__(self, name):
+        raise DeviceAccessRequired(name)
+
+
+def get_parallel_parse_info(module):
+    """Return the parallel parsing settings of a module run
+
+    :param module: The AnsibleModule
+    :rtype: dict
+    :returns: The number of workers and the size of the running-config from
+              which they are used, or None when parse_workers is not set or
+              the module has no persistent connection
+    """
+    socket_path = getattr(module, "_socket_path", None)
+    if not isinstance(socket_path, str):
+        return None
+    capabilities = getattr(module, "_ios_capabilities", None)
+    try:
+        if not isinstance(capabilities, dict):
+            capabilities = json.loads(Connection(socket_path).get_capabilities())
+            module._ios_capabilities = capabilities
+    except Exception:
+        return None
+    return capabilities.get("parallel_parse")
+
+
+def _populate_facts(resource):
+    """Parse the facts of one resource in a worker
+
+    :returns: The resource and its ansible_network_resources entries, or None
+              in place of them when the resource has to be parsed in the
+              module process
+    """
+    ansible_facts = {"ansible_network_resources": {}}
+    fact_cls = _WORKER_STATE["facts_resource_obj_map"][resource]
+    try:
+        # AnsibleModule.fail_json prints the module result, which is for the
+        # module process to do once it parses the resource again
+        with redirect_stdout(io.StringIO()):
+            fact_cls(_WORKER_STATE["module"]).populate_facts(
+                _WORKER_STATE["connection"],
+                ansible_facts,
+            )
+    except BaseException:
+        return resource, None
+    return resource, ansible_facts["ansible_network_resources"]
+
+
+def populate_facts_parallel(module, snapshot, facts_resource_obj_map, resources, workers):
+    """Parse the facts of resources in a pool of forked workers
+
+    :param module: The AnsibleModule
+    :param snapshot: The RunningConfigSnapshot of the facts run, prefetched
+    :param facts_resource_obj_map: Map of resource names to facts classes
+    :param resources: The resources to parse
+    :param workers: The maximum number of worker processes
+    :rtype: dict
+    :returns: The ansible_network_resources entries of every resource parsed,
+              by resource. The resources left out are to be parsed serially.
+    """
+    resources = sorted(resources)
+    workers = min(workers, len(resources), os.cpu_count() or 1)
+    if workers < 2:
+        return {}
+    try:
+        context = multiprocessing.get_context("fork")
+    except ValueError:
+        return {}
+    _WORKER_STATE.update(
+        module=module,
+        connection=SnapshotConnection(snapshot),
+        facts_resource_obj_map=facts_resource_obj_map,
+    )
+    try:
+        pool = context.Pool(workers)
+        try:
+            results = pool.map(_populate_facts, resources, chunksize=1)
+        finally:
+            pool.terminate()
+            pool.join()
+    except (OSError, multiprocessing.ProcessError, multiprocessing.pool.MaybeEncodingError):
+        return {}
+    finally:
+        _WORKER_STATE.clear()
+    return dict((resource, facts) for resource, facts in results if facts is not None)
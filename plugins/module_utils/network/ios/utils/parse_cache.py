@@ -0,0 +1,230 @@
+#
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+On-disk cache of the facts parsed from each top-level block of a
+configuration.
+
+The cache is enabled by the parse_cache_path option of the cliconf plugin,
+which reports its settings in the connection capabilities. Every entry is a
+JSON file named by the hash of its key, the files are spread over 256
+subdirectories. The modification time of a file is its last use, the least
+recently used files are removed as soon as a write takes the entries over the
+size cap. The size of the entries is kept up to date by every write in a file
+of the directory, and measured again by a scan of the directory from time to
+time.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import fcntl
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+from ansible.module_utils.connection import Connection
+
+
+# files left by writers that did not get to rename them
+TEMP_PREFIX = ".tmp"
+# the size in bytes of the entries, updated by every write
+SIZE_FILE = ".size"
+# the modification time of this file is the last scan of the directory
+SCAN_FILE = ".evicted"
+
+
+class ParseCache(object):
+    """The parse cache directory of one module run"""
+
+    # seconds between two scans of the directory for the size of the entries
+    EVICT_INTERVAL = 300
+
+    def __init__(self, path, max_size, version):
+        """
+        :param path: The cache directory
+        :param max_size: The size in bytes the entries are kept under
+        :param version: The collection version, part of every key
+        """
+        self.path = path
+        self.max_size = max_size
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, *parts):
+        """Return the key of an entry
+
+        :param parts: Strings telling the entry apart, such as the resource
+                      and the text of the block
+        """
+        digest = hashlib.sha256(self.version.encode("utf-8"))
+        for part in parts:
+            digest.update(b"\0")
+            digest.update(part.encode("utf-8", "surrogateescape"))
+        return digest.hexdigest()
+
+    def _entry_path(self, key):
+        return os.path.join(self.path, key[:2], key[2:] + ".json")
+
+    def get(self, key):
+        """Return the value of an entry, or None when it is not cached"""
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path) as f:
+                value = json.load(f)
+            os.utime(entry_path, None)
+        except (IOError, OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def set(self, key, value):
+        """Store an entry, values that do not come back the same from JSON
+        are not stored"""
+        try:
+            data = json.dumps(value, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return
+        if json.loads(data) != value:
+            return
+        entry_path = self._entry_path(key)
+        directory = os.path.dirname(entry_path)
+        try:
+            if not os.path.isdir(directory):
+                os.makedirs(directory)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=TEMP_PREFIX)
+            with os.fdopen(fd, "w") as f:
+                f.write(data)
+            try:
+                replaced = os.path.getsize(entry_path)
+            except OSError:
+                replaced = 0
+            os.rename(tmp_path, entry_path)
+        except (IOError, OSError):
+            return
+        self._add_size(len(data) - replaced)
+
+    def _add_size(self, delta):
+        """Add the size of a write to the size of the entries, and remove the
+        least recently used entries when it goes over max_size"""
+        try:
+            fd = os.open(os.path.join(self.path, SIZE_FILE), os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError:
+            return
+        with os.fdopen(fd, "r+") as f:
+            try:
+                # one writer at a time, so that no write goes uncounted
+                fcntl.lockf(f, fcntl.LOCK_EX)
+                try:
+                    size = int(f.read()) + delta
+                except ValueError:
+                    size = None
+                if size is not None and size > self.max_size:
+                    # leave room for the next writes before the next eviction
+                    size = self.evict(self.max_size * 9 // 10)
+                elif size is None or self._scan_due():
+                    size = self.evict()
+                f.seek(0)
+                f.truncate()
+                f.write("%d" % size)
+            except (IOError, OSError):
+                return
+
+    def _scan_due(self):
+        """Tell whether the last scan is over EVICT_INTERVAL seconds old, the
+        scan measures again the entries changed outside of the cache"""
+        marker = os.path.join(self.path, SCAN_FILE)
+        try:
+            if time.time() - os.path.getmtime(marker) < self.EVICT_INTERVAL:
+                return False
+        except OSError:
+            pass
+        try:
+            with open(marker, "w"):
+                pass
+        except (IOError, OSError):
+            return False
+        return True
+
+    def evict(self, max_size=None):
+        """Remove the least recently used entries until they fit in a size
+
+        :param max_size: The size in bytes to fit in, max_size of the cache
+                         by default
+        :rtype: int
+        :returns: The size in bytes of the entries left
+        """
+        if max_size is None:
+            max_size = self.max_size
+        now = time.time()
+        entries = []
+        total = 0
+        try:
+            directories = os.listdir(self.path)
+        except OSError:
+            return 0
+        for directory in directories:
+            directory = os.path.join(self.path, directory)
+            if not os.path.isdir(directory):
+                continue
+            for name in os.listdir(directory):
+                entry_path = os.path.join(directory, name)
+                try:
+                    stat = os.stat(entry_path)
+                except OSError:
+                    continue
+                if name.startswith(TEMP_PREFIX) and now - stat.st_mtime > self.EVICT_INTERVAL:
+                    entries.append((0, stat.st_size, entry_path))
+                else:
+                    entries.append((stat.st_mtime, stat.st_size, entry_path))
+                total += stat.st_size
+        entries.sort()
+        for mtime, size, entry_path in entries:
+            if total <= max_size and mtime:
+                break
+            try:
+                os.remove(entry_path)
+            except OSError:
+                continue
+            total -= size
+        return total
+
+
+def get_parse_cache(module):
+    """Return the parse cache of a module run
+
+    :param module: The AnsibleModule
+    :rtype: ParseCache
+    :returns: The cache, or None when parse_cache_path is not set or the
+              module has no persistent connection
+    """
+    cache = getattr(module, "_ios_parse_cache", False)
+    if cache is None or isinstance(cache, ParseCache):
+        return cache
+    cache = None
+    socket_path = getattr(module, "_socket_path", None)
+    if isinstance(socket_path, str):
+        capabilities = getattr(module, "_ios_capabilities", None)
+        try:
+            if not isinstance(capabilities, dict):
+                capabilities = json.loads(Connection(socket_path).get_capabilities())
+            info = capabilities.get("parse_cache")
+            if info:
+                cache = ParseCache(info["path"], info["max_size"], info["version"])
+        except Exception:
+            # the cache is only an optimization, parse without it
+            cache = None
+    try:
+        module._ios_parse_cache = cache
+    except AttributeError:
+        pass
+    return cache
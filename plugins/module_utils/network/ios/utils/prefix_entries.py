@@ -0,0 +1,218 @@
+#
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+The entries of a prefix list held as columns of packed records, compared by
+a merge of their sequence numbers and rendered without the entry template.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import ipaddress
+
+from array import array
+
+
+ENTRY_KEYS = frozenset(["afi", "name", "sequence", "action", "prefix", "ge", "le"])
+REQUIRED_KEYS = frozenset(["afi", "name", "sequence", "action", "prefix"])
+ACTIONS = ("deny", "permit")
+# flag of the records of an IPv6 prefix written in upper case, as IOS does
+UPPER_CASE = 2
+MAX_SEQUENCE = 2**31 - 1
+MAX_LENGTH = 2**15 - 1
+# ge and le of the entries that have none
+NO_LENGTH = -1
+LOW_BITS = 2**64 - 1
+
+
+def _pack_ipv4(prefix):
+    address, length = prefix.split("/")
+    value = 0
+    octets = address.split(".")
+    if len(octets) != 4:
+        raise ValueError(prefix)
+    for octet in octets:
+        value = value << 8 | int(octet)
+    return value, int(length)
+
+
+def _format_ipv4(value, length):
+    return "%d.%d.%d.%d/%d" % (
+        value >> 24,
+        value >> 16 & 255,
+        value >> 8 & 255,
+        value & 255,
+        length,
+    )
+
+
+def _pack_ipv6(prefix):
+    address, length = prefix.split("/")
+    return int(ipaddress.IPv6Address(address)), int(length)
+
+
+def _format_ipv6(value, length):
+    return "%s/%d" % (ipaddress.IPv6Address(value), length)
+
+
+PACKERS = {
+    "ipv4": (_pack_ipv4, _format_ipv4),
+    "ipv6": (_pack_ipv6, _format_ipv6),
+}
+
+
+class PrefixEntries(object):
+    """The entries of a prefix list, in ascending sequence order
+
+    Every entry is a (sequence, action, prefix, length, ge, le) record spread
+    over arrays, the prefix being the integer value of its address, and the
+    action a flag next to the letter case of an IPv6 address. Only the
+    entries that pack back to the very same dict are held, so that two
+    records are equal exactly when the entry dicts they come from are, and
+    a record renders the command the entry template renders for its dict.
+    """
+
+    __slots__ = (
+        "afi",
+        "name",
+        "sequences",
+        "flags",
+        "high",
+        "low",
+        "lengths",
+        "ge",
+        "le",
+        "_format",
+    )
+
+    def __init__(self, afi, name):
+        self.afi = afi
+        self.name = name
+        self.sequences = array("l")
+        self.flags = bytearray()
+        self.high = array("Q")
+        self.low = array("Q")
+        self.lengths = bytearray()
+        self.ge = array("h")
+        self.le = array("h")
+        self._format = PACKERS[afi][1]
+
+    @classmethod
+    def from_entries(cls, afi, name, entries):
+        """Return the entries of a prefix list
+
+        :param afi: The afi of the prefix list, ipv4 or ipv6
+        :param name: The name of the prefix list
+        :param entries: The entry dicts, in their order
+        :rtype: PrefixEntries
+        :returns: The entries, or None when one does not pack back to its
+                  dict, or when they are not in ascending sequence order
+        """
+        if afi not in PACKERS:
+            return None
+        pack = PACKERS[afi][0]
+        packed = cls(afi, name)
+        last = 0
+        for entry in entries:
+            keys = frozenset(entry)
+            if not REQUIRED_KEYS <= keys <= ENTRY_KEYS:
+                return None
+            if entry["afi"] != afi or entry["name"] != name:
+                return None
+            sequence = entry["sequence"]
+            if type(sequence) is not int or not last < sequence <= MAX_SEQUENCE:
+                return None
+            if entry["action"] not in ACTIONS or not isinstance(entry["prefix"], str):
+                return None
+            lengths = []
+            for key in ("ge", "le"):
+                length = entry.get(key, NO_LENGTH)
+                if key in entry and (type(length) is not int or not 0 <= length <= MAX_LENGTH):
+                    return None
+                lengths.append(length)
+            try:
+                value, length = pack(entry["prefix"])
+            except ValueError:
+                return None
+            if value < 0 or not 0 <= length <= 255:
+                return None
+            flags = ACTIONS.index(entry["action"])
+            text = packed._format(value, length)
+            if text != entry["prefix"]:
+                if text.upper() != entry["prefix"]:
+                    return None
+                flags |= UPPER_CASE
+            last = sequence
+            packed.sequences.append(sequence)
+            packed.flags.append(flags)
+            packed.high.append(value >> 64)
+            packed.low.append(value & LOW_BITS)
+            packed.lengths.append(length)
+            packed.ge.append(lengths[0])
+            packed.le.append(lengths[1])
+        return packed
+
+    def __len__(self):
+        return len(self.sequences)
+
+    def same_record(self, index, other, other_index):
+        """Tell whether a record is equal to a record of other entries"""
+        return (
+            self.sequences[index] == other.sequences[other_index]
+            and self.flags[index] == other.flags[other_index]
+            and self.low[index] == other.low[other_index]
+            and self.high[index] == other.high[other_index]
+            and self.lengths[index] == other.lengths[other_index]
+            and self.ge[index] == other.ge[other_index]
+            and self.le[index] == other.le[other_index]
+        )
+
+    def diff(self, have):
+        """Merge the records with the current ones by sequence
+
+        :param have: The current entries of the prefix list
+        :rtype: tuple
+        :returns: The (index, have index) pairs of the records to configure,
+                  in order, the have index being -1 for a new sequence, and
+                  the indexes of the current records of no wanted sequence
+        """
+        changed = []
+        removed = []
+        other = have.sequences
+        count = len(other)
+        position = 0
+        for index, sequence in enumerate(self.sequences):
+            while position < count and other[position] < sequence:
+                removed.append(position)
+                position += 1
+            if position < count and other[position] == sequence:
+                if not self.same_record(index, have, position):
+                    changed.append((index, position))
+                position += 1
+            else:
+                changed.append((index, -1))
+        removed.extend(range(position, count))
+        return changed, removed
+
+    def command(self, index, negate=False):
+        """Return the command of a record, as the entry template renders it"""
+        ge = self.ge[index]
+        le = self.le[index]
+        flags = self.flags[index]
+        prefix = self._format(self.high[index] << 64 | self.low[index], self.lengths[index])
+        return "%s%s prefix-list %s seq %d %s %s%s%s" % (
+            "no " if negate else "",
+            "ip" if self.afi == "ipv4" else self.afi,
+            self.name,
+            self.sequences[index],
+            ACTIONS[flags & 1],
+            prefix.upper() if flags & UPPER_CASE else prefix,
+            " ge %d" % ge if ge > 0 else "",
+            " le %d" % le if le > 0 else "",
+        )
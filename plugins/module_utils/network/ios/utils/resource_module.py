@@ -0,0 +1,123 @@
+#
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+The ResourceModule of the ios resource modules, which only runs the parsers
+of the options that differ between want and have.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+from ansible.module_utils.common.collections import is_string
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.resource_module import (
+    ResourceModule,
+)
+
+
+def diverging_paths(want, have, prefix="", paths=None):
+    """Return the dotted paths at which two dicts differ
+
+    Dicts found under the same key on both sides are walked into, any other
+    pair of values is compared as a whole. A key missing on one side is the
+    same as a None value, as get_from_dict finds it, except in two dicts
+    that differ only by such keys, which differ at their own path.
+
+    :param want: A dict
+    :param have: A dict
+    :rtype: set
+    """
+    if paths is None:
+        paths = set()
+    for key in set(want).union(have):
+        inw = want.get(key)
+        inh = have.get(key)
+        if inw == inh:
+            continue
+        path = "%s%s" % (prefix, key)
+        if isinstance(inw, dict) and isinstance(inh, dict):
+            found = len(paths)
+            diverging_paths(inw, inh, path + ".", paths)
+            if len(paths) != found:
+                continue
+        paths.add(path)
+    return paths
+
+
+class IosResourceModule(ResourceModule):
+    """ResourceModule whose compare() skips the parsers of the options that
+    are the same in want and have
+
+    ResourceModule.compare() renders a parser only when the value at its
+    compval differs between want and have. The paths at which they differ
+    are found once per call instead, so that the parsers of the unchanged
+    options are not looked at, and nothing at all is done for identical
+    entries. The commands and their order are the same.
+    """
+
+    # compval of every parser, by template class
+    _compvals = {}
+
+    def _compval(self, parser):
+        key = (type(self._tmplt), parser)
+        try:
+            return IosResourceModule._compvals[key]
+        except KeyError:
+            compval = self._tmplt.get_parser(parser).get("compval") or parser
+            IosResourceModule._compvals[key] = compval
+            return compval
+
+    def changed_parsers(self, parsers, want, have):
+        """Return the parsers whose compval is at, under or above a path at
+        which want and have differ, in the order they are given
+
+        :param parsers: The parser names
+        :param want: The wanted entry, a dict
+        :param have: The current entry, a dict
+        :rtype: list
+        """
+        paths = diverging_paths(want, have)
+        prefixes = set()
+        for path in paths:
+            words = path.split(".")
+            for idx in range(1, len(words) + 1):
+                prefixes.add(".".join(words[:idx]))
+        changed = []
+        for parser in parsers:
+            compval = self._compval(parser)
+            if compval in prefixes:
+                changed.append(parser)
+                continue
+            words = compval.split(".")
+            for idx in range(1, len(words)):
+                if ".".join(words[:idx]) in paths:
+                    changed.append(parser)
+                    break
+        return changed
+
+    def compare(self, parsers, want=None, have=None):
+        """Run the parsers of the options that differ between want and have,
+        as ResourceModule.compare() does for all of them
+
+        :param parsers: A parser name or a list of them
+        :param want: The wanted entry, self.want when None
+        :param have: The current entry, self.have when None
+        """
+        if want is None:
+            want = self.want
+        if have is None:
+            have = self.have
+        if isinstance(want, dict) and isinstance(have, dict):
+            if want == have:
+                return
+            if is_string(parsers):
+                parsers = [parsers]
+            parsers = self.changed_parsers(parsers, want, have)
+            if not parsers:
+                return
+        super(IosResourceModule, self).compare(parsers=parsers, want=want, have=have)
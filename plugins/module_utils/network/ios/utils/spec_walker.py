@@ -0,0 +1,168 @@
+#
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Validation of parsed facts against a resource argspec.
+
+The facts classes validate what they parsed from the device against the
+argspec of their resource, which builds a whole AnsibleModule each time.
+SpecWalker compiles an argspec once and only applies what changes the
+parsed data: the type conversions, the defaults and the None values of the
+options that were not parsed. Anything it can't handle the same way, such as
+an unknown key, an alias or a failed conversion, makes validate_config fall
+back to the full validation, which reports the same errors as before.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+from collections.abc import Sequence
+from copy import deepcopy
+
+from ansible.module_utils.common.parameters import DEFAULT_TYPE_VALIDATORS
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import utils
+
+
+# values of these types are returned as they are by their type checker
+NATIVE_TYPES = {
+    "str": (str,),
+    "int": (int,),
+    "bool": (bool,),
+    "float": (float,),
+    "list": (list,),
+    "dict": (dict,),
+}
+
+
+class _Fallback(Exception):
+    """Raised when the data needs the full validation"""
+
+
+def _type_checker(wanted):
+    """Return the type checker of a spec type and the types it leaves alone"""
+    if callable(wanted):
+        return wanted, ()
+    wanted = wanted or "str"
+    if wanted == "raw":
+        return None, ()
+    return DEFAULT_TYPE_VALIDATORS[wanted], NATIVE_TYPES.get(wanted, ())
+
+
+def _convert(value, checker, native):
+    if checker is None or isinstance(value, native):
+        return value
+    try:
+        return checker(value)
+    except (TypeError, ValueError):
+        raise _Fallback()
+
+
+class _Option(object):
+    def __init__(self, name, spec):
+        self.name = name
+        self.default = spec.get("default")
+        self.required = spec.get("required", False)
+        self.apply_defaults = spec.get("apply_defaults", False)
+        self.checker, self.native = _type_checker(spec.get("type"))
+        self.elements = None
+        if spec.get("elements"):
+            self.elements = _type_checker(spec["elements"])
+        wanted = spec.get("type")
+        self.options = None
+        if spec.get("options") is not None and (
+            wanted == "dict" or (wanted == "list" and spec.get("elements") == "dict")
+        ):
+            self.options = SpecWalker(spec["options"])
+
+    def validate(self, value):
+        if value is None and self.default is None and not self.required:
+            if self.options is not None and self.apply_defaults:
+                return self.options.validate({})
+            return None
+        value = _convert(value, self.checker, self.native)
+        if self.elements is not None:
+            if not isinstance(value, list):
+                raise _Fallback()
+            value = [_convert(item, *self.elements) for item in value]
+        if self.options is not None:
+            if not isinstance(value, Sequence) or isinstance(value, str):
+                return self.options.validate(value)
+            return [self.options.validate(item) for item in value]
+        if self.elements is None and isinstance(value, (dict, list)):
+            return deepcopy(value)
+        return value
+
+
+class SpecWalker(object):
+    """An argspec compiled for validating trusted data
+
+    validate() returns the same parameters as the AnsibleModule validation
+    for data it accepts, with the keys in the same order. The required and
+    choices checks and the checks between options are left out, the data is
+    expected to come from a parser. It raises _Fallback for data it does not
+    accept.
+    """
+
+    _walkers = {}
+
+    def __init__(self, spec):
+        self.spec = spec
+        self._options = dict((name, _Option(name, option)) for name, option in spec.items())
+        self._defaults = [o for o in self._options.values() if o.default is not None]
+
+    @classmethod
+    def for_spec(cls, spec):
+        """Return the walker of an argspec, compiled once per process"""
+        try:
+            return cls._walkers[id(spec)][1]
+        except KeyError:
+            walker = cls(spec)
+            # the spec is kept so that its id is not reused
+            cls._walkers[id(spec)] = (spec, walker)
+            return walker
+
+    def validate(self, params):
+        """Return a validated copy of the parameters"""
+        if not isinstance(params, dict):
+            raise _Fallback()
+        validated = {}
+        for name, value in params.items():
+            try:
+                option = self._options[name]
+            except KeyError:
+                # unknown options and aliases
+                raise _Fallback()
+            validated[name] = option.validate(value)
+        if len(validated) < len(self._options):
+            # the defaults are set before the options left out are set to None
+            for option in self._defaults:
+                if option.name not in validated:
+                    validated[option.name] = option.validate(option.default)
+            for option in self._options.values():
+                if option.name not in validated:
+                    if option.required:
+                        raise _Fallback()
+                    validated[option.name] = option.validate(None)
+        return validated
+
+
+def validate_config(spec, data, module=None):
+    """Validate parsed facts against an argspec
+
+    :param spec: The argument spec of the resource
+    :param data: The parsed facts, such as {"config": [...]}
+    :param module: The AnsibleModule, when it runs in debug mode the data
+                   gets the full validation
+    :returns: The validated data, as netcommon's validate_config returns
+    """
+    if not getattr(module, "_debug", False):
+        try:
+            return SpecWalker.for_spec(spec).validate(data)
+        except _Fallback:
+            pass
+    return utils.validate_config(spec, data)
@@ -17,6 +17,11 @@ from itertools import count, groupby
 
 from ansible.module_utils.common.network import is_masklen, to_netmask
 
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.vlan_set import (
+    MAX_VLANS_LEXEME,
+    VlanSet,
+)
+
 
 def remove_command_from_config_list(interface, cmd, commands):
     # To delete the passed config
@@ -442,27 +447,13 @@ def vlan_list_to_range(cmd):
     Converts a comma separated list of vlan IDs
     into ranges.
     """
-    ranges = []
-    for v in get_ranges(cmd):
-        ranges.append("-".join(map(str, (v[0], v[-1])[: len(v)])))
-    return ",".join(ranges)
+    if not isinstance(cmd, VlanSet):
+        cmd = VlanSet(cmd)
+    return cmd.to_range()
 
 
 def vlan_range_to_list(vlans):
-    result = []
-    if vlans:
-        for part in vlans:
-            if part == "none":
-                break
-            if "-" in part:
-                a, b = part.split("-")
-                a, b = int(a), int(b)
-                result.extend(range(a, b + 1))
-            else:
-                a = int(part)
-                result.append(a)
-        return numerical_sort(result)
-    return result
+    return list(VlanSet.from_ranges(vlans))
 
 
 def sort_dict(dictionary):
@@ -479,29 +470,47 @@ def generate_switchport_trunk(type, add, vlans_range):
     """
     Generates a list of switchport commands based on the trunk type and VLANs range.
     Ensures that the length of VLANs lexeme in a command does not exceed 220 characters.
+    The VLANs are a VlanSet or a comma separated list of ranges.
     """
+    if not isinstance(vlans_range, VlanSet):
+        vlans_range = VlanSet.from_ranges(vlans_range)
 
-    def append_command():
+    commands = []
+    for chunk in vlans_range.chunks(MAX_VLANS_LEXEME):
         command_prefix = f"switchport trunk {type} vlan "
         if add or commands:
             command_prefix += "add "
-        commands.append(command_prefix + ",".join(current_chunk))
+        commands.append(command_prefix + chunk)
 
-    commands = []
-    current_chunk = []
-    current_length = 0
-
-    for vrange in vlans_range.split(","):
-        next_addition = vrange if not current_chunk else "," + vrange
-        if current_length + len(next_addition) <= 220:
-            current_chunk.append(vrange)
-            current_length += len(next_addition)
-        else:
-            append_command()
-            current_chunk = [vrange]
-            current_length = len(vrange)
+    return commands
 
-    if current_chunk:
-        append_command()
 
-    return commands
+def get_facts_targets(module, key, nested=None):
+    """
+    Returns the names of the objects a task configures, so that only their
+    facts are gathered to build `have`.
+    Returns None when all the facts are needed: in the overridden, gathered,
+    parsed and rendered states, without config, or when an entry has no name.
+    Also returns None for a name that cannot be typed in a device command,
+    with a "?" or with blanks around it.
+    :param module: The AnsibleModule of the resource
+    :param key: The option holding the name of an object
+    :param nested: The option of each config entry holding the objects, for
+                   resources grouping them by afi
+    """
+    config = module.params.get("config")
+    if module.params.get("state") not in ("merged", "replaced", "deleted") or not config:
+        return None
+    names = []
+    for entry in config:
+        items = entry.get(nested) if nested else [entry]
+        if not items:
+            return None
+        for item in items:
+            if not item.get(key):
+                return None
+            name = str(item[key])
+            if "?" in name or name != name.strip():
+                return None
+            names.append(name)
+    return names
@@ -0,0 +1,182 @@
+#
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+A set of VLAN IDs held as the bits of an integer, for the trunk allowed and
+pruning VLAN lists.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+from collections.abc import Set
+
+
+# longest VLAN list in a switchport trunk command
+MAX_VLANS_LEXEME = 220
+
+
+class VlanSet(Set):
+    """An immutable set of VLAN IDs
+
+    The VLAN ID n is bit n of an integer, so that the 4094 VLANs of a switch
+    take 512 bytes, and the union, intersection and difference of two sets are
+    single integer operations. Iterating over a set yields its VLAN IDs in
+    ascending order.
+    """
+
+    __slots__ = ("_bits",)
+
+    def __init__(self, vlans=()):
+        bits = 0
+        for vlan in vlans:
+            bits |= 1 << int(vlan)
+        self._bits = bits
+
+    @classmethod
+    def _from_bits(cls, bits):
+        vlans = cls()
+        vlans._bits = bits
+        return vlans
+
+    @classmethod
+    def from_ranges(cls, ranges):
+        """Return the VLANs of a list of ranges
+
+        Parsing stops at "none", as in `switchport trunk allowed vlan none`.
+
+        :param ranges: Ranges such as ["1-10", "20"], or "1-10,20"
+        :rtype: VlanSet
+        """
+        if isinstance(ranges, str):
+            ranges = ranges.split(",")
+        bits = 0
+        for part in ranges or []:
+            for vrange in str(part).split(","):
+                if vrange == "none":
+                    return cls._from_bits(bits)
+                if "-" in vrange:
+                    first, last = vrange.split("-")
+                    first, last = int(first), int(last)
+                    if last >= first:
+                        bits |= ((1 << (last - first + 1)) - 1) << first
+                else:
+                    bits |= 1 << int(vrange)
+        return cls._from_bits(bits)
+
+    def ranges(self):
+        """Yield the first and the last VLAN of every run of consecutive VLANs"""
+        bits = self._bits
+        while bits:
+            first = (bits & -bits).bit_length() - 1
+            run = bits >> first
+            length = ((run + 1) & ~run).bit_length() - 1
+            yield first, first + length - 1
+            bits &= ~(((1 << length) - 1) << first)
+
+    def range_strings(self):
+        """Yield the runs of consecutive VLANs, as "1-10" or "20" """
+        for first, last in self.ranges():
+            if first == last:
+                yield str(first)
+            else:
+                yield "%d-%d" % (first, last)
+
+    def to_range(self):
+        """Return the VLANs as a comma separated list of ranges, "1-10,20"
+
+        :rtype: str
+        """
+        return ",".join(self.range_strings())
+
+    def chunks(self, limit=MAX_VLANS_LEXEME):
+        """Yield the VLANs as comma separated lists of ranges of at most limit
+        characters, a range longer than limit being a chunk of its own
+        """
+        chunk = []
+        length = 0
+        for vrange in self.range_strings():
+            addition = len(vrange) + 1 if chunk else len(vrange)
+            if chunk and length + addition > limit:
+                yield ",".join(chunk)
+                chunk = []
+                addition = len(vrange)
+                length = 0
+            chunk.append(vrange)
+            length += addition
+        if chunk:
+            yield ",".join(chunk)
+
+    def __contains__(self, vlan):
+        try:
+            return vlan >= 0 and bool(self._bits >> vlan & 1)
+        except TypeError:
+            return False
+
+    def __iter__(self):
+        for first, last in self.ranges():
+            for vlan in range(first, last + 1):
+                yield vlan
+
+    def __len__(self):
+        return bin(self._bits).count("1")
+
+    def __bool__(self):
+        return self._bits != 0
+
+    __nonzero__ = __bool__
+
+    def __eq__(self, other):
+        if isinstance(other, VlanSet):
+            return self._bits == other._bits
+        return Set.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self._bits)
+
+    def __or__(self, other):
+        if isinstance(other, VlanSet):
+            return self._from_bits(self._bits | other._bits)
+        return Set.__or__(self, other)
+
+    def __and__(self, other):
+        if isinstance(other, VlanSet):
+            return self._from_bits(self._bits & other._bits)
+        return Set.__and__(self, other)
+
+    def __sub__(self, other):
+        if isinstance(other, VlanSet):
+            return self._from_bits(self._bits & ~other._bits)
+        return Set.__sub__(self, other)
+
+    def __xor__(self, other):
+        if isinstance(other, VlanSet):
+            return self._from_bits(self._bits ^ other._bits)
+        return Set.__xor__(self, other)
+
+    def __le__(self, other):
+        if isinstance(other, VlanSet):
+            return self._bits & ~other._bits == 0
+        return Set.__le__(self, other)
+
+    def __ge__(self, other):
+        if isinstance(other, VlanSet):
+            return other._bits & ~self._bits == 0
+        return Set.__ge__(self, other)
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __copy__(self):
+        return self
+
+    def __repr__(self):
+        return "VlanSet(%r)" % self.to_range()
@@ -355,6 +355,15 @@ failed_conditions:
   returned: failed
   type: list
   sample: ['...', '...']
+command_timing:
+  description:
+    - The seconds spent waiting for the output of each command of the
+      final attempt, in the order the commands were given.
+  returned: always apart from low level errors (such as action plugin)
+  type: list
+  elements: dict
+  sample: [{"command": "show version", "elapsed": 0.412}]
+  version_added: 11.6.0
 """
 import time
 
@@ -369,7 +378,9 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
     transform_commands,
 )
 
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.ios import run_commands
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.ios import (
+    run_commands_batch,
+)
 
 
 def parse_commands(module, warnings):
@@ -408,7 +419,8 @@ def main():
     interval = module.params["interval"]
     match = module.params["match"]
     while retries >= 0:
-        responses = run_commands(module, commands)
+        batch = run_commands_batch(module, commands)
+        responses = [item["output"] for item in batch]
         for item in list(conditionals):
             if item(responses):
                 if match == "any":
@@ -424,6 +436,9 @@ def main():
         msg = "One or more conditional statements have not been satisfied"
         module.fail_json(msg=msg, failed_conditions=failed_conditions)
     result.update({"stdout": responses, "stdout_lines": list(to_lines(responses))})
+    result["command_timing"] = [
+        {"command": item["command"], "elapsed": item["elapsed"]} for item in batch
+    ]
     emit_warnings(module, result)
     module.exit_json(**result)
 
@@ -70,6 +70,9 @@ options:
       - The ordered set of parents that uniquely identify the section or hierarchy the
         commands should be checked against.  If the parents argument is omitted, the
         commands are checked against the set of top level or global commands.
+      - When I(running_config) is not given, only the section of the first parent is read from
+        the device, using C(show running-config interface) for interfaces and C(| section)
+        otherwise. The full running-config is read if the device rejects the filter.
     type: list
     elements: str
   src:
@@ -451,6 +454,14 @@ time:
   returned: when backup is yes
   type: str
   sample: "22:28:34"
+config_cache:
+  description:
+    - Whether the running-config the module worked on was served from the
+      running-config cache of the persistent connection.
+  returned: when the config_cache_ttl connection option is set
+  type: dict
+  sample: {"hit": true}
+  version_added: 11.6.0
 """
 import json
 import re
@@ -458,20 +469,22 @@ import re
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.common.text.converters import to_text
 from ansible.module_utils.connection import ConnectionError
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.config import (
-    NetworkConfig,
-    dumps,
-)
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.config import dumps
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     emit_warnings,
+    to_list,
 )
 
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.ios import (
     get_config,
+    get_config_cache,
     get_connection,
     get_defaults_flag,
     run_commands,
 )
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.config_tree import (
+    IosNetworkConfig,
+)
 
 
 def check_args(module, warnings):
@@ -494,6 +507,8 @@ def edit_config_or_macro(connection, commands, config_prompt_lines):
 INTERFACE_RANGE_RE = re.compile(r"^interface\s+range\s+(.+)$", re.I)
 INTERFACE_TOKEN_RE = re.compile(r"^([A-Za-z][A-Za-z\d.-]*)\s*(\d.*)$")
 IDENTIFIER_SUFFIX_RE = re.compile(r"^(.*?)(\d+)$")
+INTERFACE_PARENT_RE = re.compile(r"^interface\s+(\S+)$", re.I)
+SCOPE_PARENT_RE = re.compile(r"^[\w./:-]+(?: [\w./:-]+)*$")
 
 
 def normalize_parents(parents):
@@ -533,7 +548,7 @@ def get_candidate_config(module, parents=None, lines=None):
         candidate = module.params["src"]
     elif module.params["lines"]:
         candidate_lines = lines if lines is not None else extract_lines(module)
-        candidate_obj = NetworkConfig(indent=1)
+        candidate_obj = IosNetworkConfig(indent=1)
         candidate_obj.add(
             lines=candidate_lines,
             parents=parents if parents is not None else (module.params["parents"] or []),
@@ -607,18 +622,39 @@ def expand_interface_range_parent(parent):
 
 def build_expanded_range_candidate(expanded_parents, lines):
     """Build a candidate config that applies `lines` under each expanded `interface ...` parent (for idempotency only)."""
-    candidate_obj = NetworkConfig(indent=1)
+    candidate_obj = IosNetworkConfig(indent=1)
     for parent in expanded_parents:
         candidate_obj.add(lines=lines, parents=[parent])
     return dumps(candidate_obj, "raw")
 
 
-def get_running_config(module, current_config=None, flags=None):
-    """Return running-config text from params, cached content, or live device (optionally with `flags`)."""
+def get_running_config_scope(parents, flags=None):
+    """Return the `show running-config` filter limiting the output to the section of the top level parent, or None."""
+    if not parents:
+        return None
+    parent = parents[0].strip()
+    # interface range parents are checked against the individual interfaces
+    # and parents with regex or CLI special characters can't be used in a filter
+    if INTERFACE_RANGE_RE.match(parent) or not SCOPE_PARENT_RE.match(parent):
+        return None
+    match = INTERFACE_PARENT_RE.match(parent)
+    if match and not flags:
+        return "interface %s" % match.group(1)
+    return "| section ^%s" % parent
+
+
+def get_running_config(module, current_config=None, flags=None, scope=None):
+    """Return running-config text from params, cached content, or live device (optionally with `flags`).
+
+    When `scope` is given only that part of the running-config is fetched from the device,
+    falling back to the full running-config if the device rejects the filter.
+    """
     running = module.params["running_config"]
     if not running:
         if not module.params["defaults"] and current_config:
             running = current_config
+        elif scope:
+            running = get_config(module, flags=to_list(flags) + [scope])
         else:
             running = get_config(module, flags=flags)
     return running
@@ -691,7 +727,7 @@ def main():
     connection = get_connection(module)
     if module.params["backup"] or module._diff and module.params["diff_against"] == "running":
         contents = get_config(module, flags=flags)
-        config = NetworkConfig(indent=1, contents=contents)
+        config = IosNetworkConfig(indent=1, contents=contents)
         if module.params["backup"]:
             result["__backup__"] = contents
     if any((module.params["lines"], module.params["src"], module.params["content"])):
@@ -700,7 +736,10 @@ def main():
         path = normalize_parents(module.params["parents"])
         lines = extract_lines(module)
         candidate = get_candidate_config(module, parents=path, lines=lines)
-        running = get_running_config(module, contents, flags=flags)
+        # the diff of lines under parents only depends on the section of the
+        # top level parent, src and content are diffed against the full config
+        scope = get_running_config_scope(path, flags) if module.params["lines"] else None
+        running = get_running_config(module, contents, flags=flags, scope=scope)
         expanded_range_parents = []
         use_expanded_idempotency = False
         if (
@@ -786,8 +825,16 @@ def main():
         save_config(module, result)
     elif module.params["save_when"] == "modified":
         output = run_commands(module, ["show running-config", "show startup-config"])
-        running_config = NetworkConfig(indent=1, contents=output[0], ignore_lines=diff_ignore_lines)
-        startup_config = NetworkConfig(indent=1, contents=output[1], ignore_lines=diff_ignore_lines)
+        running_config = IosNetworkConfig(
+            indent=1,
+            contents=output[0],
+            ignore_lines=diff_ignore_lines,
+        )
+        startup_config = IosNetworkConfig(
+            indent=1,
+            contents=output[1],
+            ignore_lines=diff_ignore_lines,
+        )
         if running_config.sha1 != startup_config.sha1:
             save_config(module, result)
     elif module.params["save_when"] == "changed" and result["changed"]:
@@ -799,7 +846,11 @@ def main():
         else:
             contents = running_config
 
-        running_config = NetworkConfig(indent=1, contents=contents, ignore_lines=diff_ignore_lines)
+        running_config = IosNetworkConfig(
+            indent=1,
+            contents=contents,
+            ignore_lines=diff_ignore_lines,
+        )
         if module.params["diff_against"] == "running":
             if module.check_mode:
                 module.warn("unable to perform diff against running-config due to check mode")
@@ -815,7 +866,11 @@ def main():
         elif module.params["diff_against"] == "intended":
             contents = module.params["intended_config"]
         if contents is not None:
-            base_config = NetworkConfig(indent=1, contents=contents, ignore_lines=diff_ignore_lines)
+            base_config = IosNetworkConfig(
+                indent=1,
+                contents=contents,
+                ignore_lines=diff_ignore_lines,
+            )
             if running_config.sha1 != base_config.sha1:
                 before, after = "", ""
                 if module.params["diff_against"] == "intended":
@@ -843,6 +898,10 @@ def main():
         else:
             result["warnings"] = [msg]
 
+    config_cache = get_config_cache(module)
+    if config_cache:
+        result["config_cache"] = config_cache
+
     emit_warnings(module, result)
 
     module.exit_json(**result)
@@ -214,6 +214,16 @@ ansible_net_neighbors:
       CDP and LLDP neighbor data is present on one port, CDP is preferred.
   returned: when interfaces is configured
   type: dict
+
+command_timing:
+  description:
+    - The commands run on the device to gather the legacy facts and the
+      seconds spent waiting for the output of each of them.
+  returned: when legacy facts are gathered
+  type: list
+  elements: dict
+  sample: [{"command": "show version", "elapsed": 0.412}]
+  version_added: 11.6.0
 """
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
@@ -223,10 +233,18 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.argspec.facts.facts import (
     FactsArgs,
 )
+
+# Facts imports the resource facts classes by name, this ships all of them
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts import (  # noqa: F401
+    resources,
+)
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.facts import (
     FACT_RESOURCE_SUBSETS,
     Facts,
 )
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.ios import (
+    get_command_timing,
+)
 
 
 def main():
@@ -247,6 +265,9 @@ def main():
     ansible_facts.update(additional_facts)
     warnings.extend(additional_warnings)
     result = {"ansible_facts": ansible_facts, "warnings": warnings}
+    command_timing = get_command_timing(module)
+    if command_timing:
+        result["command_timing"] = command_timing
     emit_warnings(module, result)
     module.exit_json(**result)
 
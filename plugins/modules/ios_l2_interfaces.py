@@ -905,14 +905,20 @@ EXAMPLES = """
 
 RETURN = """
 before:
-  description: The configuration prior to the module execution.
+  description:
+    - The configuration prior to the module execution.
+    - When I(state) is C(merged), C(replaced) or C(deleted) and every entry of I(config) is named,
+      only the interfaces named in I(config) are included.
   returned: when I(state) is C(merged), C(replaced), C(overridden), C(deleted) or C(purged)
   type: dict
   sample: >
     This output will always be in the same format as the
     module argspec.
 after:
-  description: The resulting configuration after module execution.
+  description:
+    - The resulting configuration after module execution.
+    - When I(state) is C(merged), C(replaced) or C(deleted) and every entry of I(config) is named,
+      only the interfaces named in I(config) are included.
   returned: when changed
   type: dict
   sample: >
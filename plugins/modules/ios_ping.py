@@ -129,6 +129,13 @@ commands:
   returned: always
   type: list
   sample: ["ping vrf prod 198.51.100.251 count 20 source loopback0"]
+command_timing:
+  description: The seconds spent waiting for the output of the ping command.
+  returned: always
+  type: list
+  elements: dict
+  sample: [{"command": "ping 198.51.100.251 count 20", "elapsed": 4.127}]
+  version_added: 11.6.0
 packet_loss:
   description: Percentage of packets lost.
   returned: always
@@ -996,14 +996,20 @@ EXAMPLES = """
 
 RETURN = """
 before:
-  description: The configuration prior to the model invocation.
+  description:
+    - The configuration prior to the model invocation.
+    - When I(state) is C(merged), C(replaced) or C(deleted) and every entry of I(config) is named,
+      only the prefix lists named in I(config) are included.
   returned: always
   sample: >
     The configuration returned will always be in the same format
      of the parameters above.
   type: list
 after:
-  description: The resulting configuration model invocation.
+  description:
+    - The resulting configuration model invocation.
+    - When I(state) is C(merged), C(replaced) or C(deleted) and every entry of I(config) is named,
+      only the prefix lists named in I(config) are included.
   returned: when changed
   sample: >
     The configuration returned will always be in the same format
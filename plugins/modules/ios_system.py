@@ -118,6 +118,14 @@ commands:
   sample:
     - hostname ios01
     - ip domain name test.example.com
+config_cache:
+  description:
+    - Whether the running-config the module worked on was served from the
+      running-config cache of the persistent connection.
+  returned: when the config_cache_ttl connection option is set
+  type: dict
+  sample: {"hit": true}
+  version_added: 11.6.0
 """
 import re
 
@@ -129,6 +137,7 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
 
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.ios import (
     get_config,
+    get_config_cache,
     load_config,
 )
 
@@ -345,6 +354,9 @@ def main():
         if not module.check_mode:
             load_config(module, commands)
         result["changed"] = True
+    config_cache = get_config_cache(module)
+    if config_cache:
+        result["config_cache"] = config_cache
     emit_warnings(module, result)
     module.exit_json(**result)
 
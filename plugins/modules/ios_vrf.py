@@ -342,6 +342,14 @@ delta:
   returned: always
   type: str
   sample: "0:00:10.469466"
+config_cache:
+  description:
+    - Whether the running-config the module worked on was served from the
+      running-config cache of the persistent connection.
+  returned: when the config_cache_ttl connection option is set
+  type: dict
+  sample: {"hit": true}
+  version_added: 11.6.0
 """
 import re
 import time
@@ -359,6 +367,7 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
 
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.ios import (
     get_config,
+    get_config_cache,
     load_config,
 )
 
@@ -982,6 +991,9 @@ def main():
             load_config(module, commands)
         result["changed"] = True
     check_declarative_intent_params(want, module, result)
+    config_cache = get_config_cache(module)
+    if config_cache:
+        result["config_cache"] = config_cache
     emit_warnings(module, result)
     module.exit_json(**result)
 
@@ -33,6 +33,36 @@ from ansible_collections.ansible.netcommon.plugins.plugin_utils.terminal_base im
 display = Display()
 
 
+class StderrMatcher(object):
+    """Stand-in for a list of error regexes in terminal_stderr_re.
+
+    network_cli searches every receive window with each regex of the list in
+    turn. This matcher lower-cases the window once and runs only the regexes
+    whose required literal occurs in it, returning the same first match the
+    list would in the same order. ``pattern`` is the pattern of the regex
+    that matched last, for the connection logs.
+    """
+
+    def __init__(self, patterns):
+        """
+        :param patterns: List of (literal, regex) pairs, the literal being a
+                         lower-cased substring of every match of the regex or
+                         None when the regex must always run
+        """
+        self._patterns = patterns
+        self.pattern = b"|".join(regex.pattern for literal, regex in patterns)
+
+    def search(self, data):
+        lowered = data.lower()
+        for literal, regex in self._patterns:
+            if literal is None or literal in lowered:
+                match = regex.search(data)
+                if match:
+                    self.pattern = regex.pattern
+                    return match
+        return None
+
+
 class TerminalModule(TerminalBase):
     terminal_stdout_re = [
         re.compile(rb"[\r\n]?[\w\+\-\.:\/\[\]]+(?:\([^\)]+\)){0,3}(?:[>#]) ?$"),
@@ -40,39 +70,57 @@ class TerminalModule(TerminalBase):
 
     privilege_level_re = re.compile(r"Current privilege level is (\d+)$")
 
-    terminal_stderr_re = [
-        re.compile(rb"% ?Error"),
-        # re.compile(rb"^% \w+", re.M),
-        re.compile(rb"ERROR:", re.IGNORECASE),
-        re.compile(rb"% ?Bad secret"),
-        re.compile(rb"[\r\n%] Bad passwords"),
-        re.compile(rb"invalid input", re.I),
-        re.compile(rb"(?:incomplete|ambiguous) command", re.I),
-        re.compile(rb"connection timed out", re.I),
-        re.compile(rb"[^\r\n]+ not found"),
-        re.compile(rb"'[^']' +returned error code: ?\d+"),
-        re.compile(rb"Bad mask", re.I),
-        re.compile(rb"% ?(\S+) ?overlaps with ?(\S+)", re.I),
-        re.compile(rb"% ?(\S+) ?Error: ?[\s]+", re.I),
-        re.compile(rb"% ?(\S+) ?Informational: ?[\s]+", re.I),
-        re.compile(rb"Command authorization failed"),
-        re.compile(rb"Command Rejected(\s*\([^)]*\))?\s*: ?[\s]+", re.I),
-        re.compile(
-            rb"% General session commands not allowed under the address family",
-            re.I,
+    # each error regex is paired with a lower-cased literal that every match
+    # of it must contain, used to skip the regex on windows without the literal
+    terminal_stderr_patterns = [
+        (b"error", re.compile(rb"% ?Error")),
+        # (None, re.compile(rb"^% \w+", re.M)),
+        (b"error:", re.compile(rb"ERROR:", re.IGNORECASE)),
+        (b"bad secret", re.compile(rb"% ?Bad secret")),
+        (b" bad passwords", re.compile(rb"[\r\n%] Bad passwords")),
+        (b"invalid input", re.compile(rb"invalid input", re.I)),
+        (b" command", re.compile(rb"(?:incomplete|ambiguous) command", re.I)),
+        (b"connection timed out", re.compile(rb"connection timed out", re.I)),
+        (b" not found", re.compile(rb"[^\r\n]+ not found")),
+        (b"returned error code", re.compile(rb"'[^']' +returned error code: ?\d+")),
+        (b"bad mask", re.compile(rb"Bad mask", re.I)),
+        (b"overlaps with", re.compile(rb"% ?(\S+) ?overlaps with ?(\S+)", re.I)),
+        (b"error:", re.compile(rb"% ?(\S+) ?Error: ?[\s]+", re.I)),
+        (b"informational:", re.compile(rb"% ?(\S+) ?Informational: ?[\s]+", re.I)),
+        (b"command authorization failed", re.compile(rb"Command authorization failed")),
+        (b"command rejected", re.compile(rb"Command Rejected(\s*\([^)]*\))?\s*: ?[\s]+", re.I)),
+        (
+            b"% general session commands not allowed under the address family",
+            re.compile(
+                rb"% General session commands not allowed under the address family",
+                re.I,
+            ),
+        ),
+        (
+            b"% bgp: error initializing topology",
+            re.compile(rb"% BGP: Error initializing topology", re.I),
         ),
-        re.compile(rb"% BGP: Error initializing topology", re.I),
-        re.compile(rb"%SNMP agent not enabled", re.I),
-        re.compile(rb"% ?IPv6 routing not enabled", re.I),
-        re.compile(rb"% Invalid", re.I),
-        re.compile(
-            rb"%You must disable VTPv1 and VTPv2 or switch to VTPv3 before configuring a VLAN name longer than 32 characters",
-            re.I,
+        (b"%snmp agent not enabled", re.compile(rb"%SNMP agent not enabled", re.I)),
+        (b"ipv6 routing not enabled", re.compile(rb"% ?IPv6 routing not enabled", re.I)),
+        (b"% invalid", re.compile(rb"% Invalid", re.I)),
+        (
+            b"%you must disable vtpv1 and vtpv2 or switch to vtpv3",
+            re.compile(
+                rb"%You must disable VTPv1 and VTPv2 or switch to VTPv3 before configuring a VLAN name longer than 32 characters",
+                re.I,
+            ),
         ),
     ]
 
+    terminal_stderr_re = [regex for literal, regex in terminal_stderr_patterns]
+
     terminal_config_prompt = re.compile(r"^.+\(config(-.*)?\)#$")
 
+    def __init__(self, *args, **kwargs):
+        super(TerminalModule, self).__init__(*args, **kwargs)
+        # network_cli reads terminal_stderr_re from the instance
+        self.terminal_stderr_re = [StderrMatcher(self.terminal_stderr_patterns)]
+
     def get_privilege_level(self):
         try:
             cmd = {"command": "show privilege"}
@@ -0,0 +1,128 @@
+#
+# (c) 2026 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Compare the time and the peak memory the ACL facts take to be built from the
+running-config of an edge router with --aces ACEs, when the configuration is
+sanitized and parsed as a whole before every ACL is post-processed, and when
+each ACL is sanitized, parsed and post-processed as its lines are read. Both
+must build the same facts.
+
+Run from a collections tree:
+    python -m ansible_collections.cisco.ios.tests.benchmarks.bench_acls_facts --aces 1000 10000 100000
+"""
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import argparse
+import time
+import tracemalloc
+
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.acls.acls import (
+    AclsFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.acls import (
+    AclsTemplate,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.config_sections import (
+    iter_lines,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.network_template import (
+    IosNetworkTemplate,
+)
+
+
+ACES_PER_ACL = 500
+
+
+def acl_config(aces):
+    lines = []
+    for index in range(aces):
+        sequence = index % ACES_PER_ACL * 10 + 10
+        if index % ACES_PER_ACL == 0:
+            lines.append("ip access-list extended EDGE-%d" % (index // ACES_PER_ACL))
+        if index % 25 == 0:
+            lines.append(" %d remark block %d" % (sequence, index // 25))
+        lines.append(
+            " %d %s tcp 10.%d.%d.0 0.0.0.255 host 192.0.2.%d eq %d (%d matches)"
+            % (
+                sequence,
+                "deny" if index % 7 == 0 else "permit",
+                index // 65536,
+                index // 256 % 256,
+                index % 250 + 1,
+                1024 + index % 30000,
+                index,
+            ),
+        )
+    return "\n".join(lines)
+
+
+def whole(facts, data):
+    temp_v4 = []
+    temp_v6 = []
+    lines = facts.sanitize_data(data).splitlines()
+    raw_acls = IosNetworkTemplate(lines=lines, tmplt=AclsTemplate()).parse()
+    for acl in raw_acls.get("acls", {}).values():
+        facts.process_acl(acl, temp_v4, temp_v6)
+    return sorted(temp_v4, key=lambda i: str(i["name"]))
+
+
+def streamed(facts, data):
+    temp_v4 = []
+    temp_v6 = []
+    lines = facts.iter_sanitized(iter_lines(data))
+    for raw_acls in IosNetworkTemplate(lines=lines, tmplt=AclsTemplate()).parse_blocks():
+        for acl in raw_acls.get("acls", {}).values():
+            facts.process_acl(acl, temp_v4, temp_v6)
+    return sorted(temp_v4, key=lambda i: str(i["name"]))
+
+
+def measure(function, facts, data):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function(facts, data)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--aces", type=int, nargs="+", default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    facts = AclsFacts(None)
+    print("%8s %10s %10s %10s %10s" % ("aces", "whole", "peak", "streamed", "peak"))
+    for aces in args.aces:
+        data = acl_config(aces)
+        whole_time, whole_peak, expected = measure(whole, facts, data)
+        stream_time, stream_peak, result = measure(streamed, facts, data)
+        if result != expected:
+            raise AssertionError("the facts of %d ACEs differ" % aces)
+        print(
+            "%8d %9.2fs %8.1fMB %9.2fs %8.1fMB"
+            % (aces, whole_time, whole_peak / 1e6, stream_time, stream_peak / 1e6),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#
+# (c) 2026 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Compare IosNetworkConfig with the netcommon NetworkConfig it replaces in
+ios_config and Cliconf.get_diff.
+
+Every pair of configuration fixtures under tests/unit is diffed with both
+engines for each match, replace and path combination ios_config accepts and
+the generated commands must be identical. The timing run diffs a generated
+candidate against a much larger generated running-config.
+
+Run from a collections tree:
+    python -m ansible_collections.cisco.ios.tests.benchmarks.bench_config_diff --lines 60000
+"""
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import argparse
+import os
+import time
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.config import (
+    NetworkConfig,
+    dumps,
+)
+
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.config_tree import (
+    IosNetworkConfig,
+)
+
+
+FIXTURES = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "unit",
+    "modules",
+    "network",
+    "ios",
+    "fixtures",
+)
+
+MODES = [
+    ("line", "line"),
+    ("line", "block"),
+    ("strict", "line"),
+    ("strict", "block"),
+    ("exact", "line"),
+    ("exact", "block"),
+]
+
+
+def load_fixtures():
+    configs = []
+    for name in sorted(os.listdir(FIXTURES)):
+        if name.endswith(".cfg"):
+            with open(os.path.join(FIXTURES, name)) as f:
+                configs.append((name, f.read()))
+    return configs
+
+
+def diff(engine, candidate, running, match, replace, path=None):
+    candidate_obj = engine(indent=1, contents=candidate)
+    running_obj = engine(indent=1, contents=running)
+    return dumps(
+        candidate_obj.difference(running_obj, match=match, replace=replace, path=path),
+        "commands",
+    )
+
+
+def check_fixtures():
+    configs = load_fixtures()
+    checked = 0
+    for candidate_name, candidate in configs:
+        paths = [None]
+        for item in NetworkConfig(indent=1, contents=candidate).items:
+            if item.has_children:
+                paths.append(item.parents + [item.text])
+                if len(paths) > 3:
+                    break
+        for running_name, running in configs:
+            for match, replace in MODES:
+                for path in paths:
+                    expected = diff(NetworkConfig, candidate, running, match, replace, path)
+                    result = diff(IosNetworkConfig, candidate, running, match, replace, path)
+                    if result != expected:
+                        raise AssertionError(
+                            "%s against %s differs for match=%s replace=%s path=%s"
+                            % (candidate_name, running_name, match, replace, path),
+                        )
+                    checked += 1
+    return len(configs), checked
+
+
+def build_config(lines, seed=0):
+    blocks = []
+    count = 0
+    index = seed
+    while count < lines:
+        blocks.append(
+            "interface GigabitEthernet1/0/%d\n"
+            " description access port %d\n"
+            " switchport access vlan %d\n"
+            " switchport mode access\n"
+            " spanning-tree portfast\n"
+            "!\n" % (index, index, index % 4000 + 1),
+        )
+        count += 6
+        index += 1
+    return "".join(blocks)
+
+
+def measure(engine, candidate, running, match, replace, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = diff(engine, candidate, running, match, replace)
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=60000, help="running-config lines")
+    parser.add_argument("--src-lines", type=int, default=10000, help="candidate lines")
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    count, checked = check_fixtures()
+    print("%d fixtures, %d diffs identical" % (count, checked))
+
+    running = build_config(args.lines)
+    # half of the candidate is already configured
+    candidate = build_config(args.src_lines, seed=args.lines // 12)
+    print("%12s %12s %12s %9s" % ("match", "netcommon", "ios", "speedup"))
+    for match, replace in [("line", "line"), ("line", "block")]:
+        before, expected = measure(NetworkConfig, candidate, running, match, replace, args.repeat)
+        after, result = measure(IosNetworkConfig, candidate, running, match, replace, args.repeat)
+        if result != expected:
+            raise AssertionError("generated diff differs for replace=%s" % replace)
+        print(
+            "%12s %11.3fs %11.3fs %8.1fx"
+            % ("%s/%s" % (match, replace), before, after, before / after),
+        )
+
+
+if __name__ == "__main__":
+    main()
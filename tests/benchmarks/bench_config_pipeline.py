@@ -0,0 +1,81 @@
+#
+# (c) 2026 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Compare line-by-line and pipelined Cliconf.edit_config pushes against a
+fake IOS connection that charges a fixed latency per prompt round trip.
+
+Run from a collections tree:
+    python -m ansible_collections.cisco.ios.tests.benchmarks.bench_config_pipeline --lines 2000
+"""
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import argparse
+import time
+
+from ansible_collections.cisco.ios.plugins.cliconf.ios import Cliconf
+from ansible_collections.cisco.ios.tests.unit.plugins.cliconf.fake_ios import FakeIosConnection
+
+
+def build_candidate(lines):
+    candidate = [
+        "ip prefix-list BENCH seq %d permit 10.%d.%d.0/24" % ((i + 1) * 5, i // 256, i % 256)
+        for i in range(lines)
+    ]
+    return candidate
+
+
+def push(candidate, window, latency):
+    connection = FakeIosConnection(latency=latency)
+    cliconf = Cliconf(connection)
+    cliconf._options.update(
+        {
+            "commit_confirm_immediate": False,
+            "commit_confirm_timeout": None,
+            "config_pipeline_window": window,
+        },
+    )
+    start = time.perf_counter()
+    result = cliconf.edit_config(candidate=list(candidate))
+    return time.perf_counter() - start, connection.round_trips, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.01, help="round trip in seconds")
+    parser.add_argument("--windows", type=int, nargs="+", default=[0, 10, 50, 200])
+    args = parser.parse_args()
+
+    candidate = build_candidate(args.lines)
+    baseline = None
+    print("%8s %12s %10s %9s" % ("window", "round trips", "seconds", "speedup"))
+    for window in args.windows:
+        elapsed, round_trips, result = push(candidate, window, args.latency)
+        if baseline is None:
+            baseline = (elapsed, result)
+        elif result != baseline[1]:
+            raise AssertionError("window %d returned a different result" % window)
+        print("%8d %12d %10.3f %8.1fx" % (window, round_trips, elapsed, baseline[0] / elapsed))
+
+
+if __name__ == "__main__":
+    main()
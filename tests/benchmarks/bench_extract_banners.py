@@ -0,0 +1,126 @@
+#
+# (c) 2026 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Compare the single pass Cliconf._extract_banners with the regex and
+str.replace implementation it replaced, on a large running-config.
+
+The previous implementation is kept below as the reference. It does not
+recognise hyphenated banner types, so the equivalence check runs on a
+configuration with the motd, exec, login and incoming banners; the slip-ppp
+banner is added for the timing run only.
+
+Run from a collections tree:
+    python -m ansible_collections.cisco.ios.tests.benchmarks.bench_extract_banners --megabytes 5
+"""
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import argparse
+import re
+import time
+
+from ansible_collections.cisco.ios.plugins.cliconf.ios import Cliconf
+
+
+BANNER_TYPES = ["motd", "exec", "login", "incoming"]
+
+
+def reference_extract_banners(config):
+    banners = {}
+    banner_cmds = re.findall(r"^banner (\w+)", config, re.M)
+    for cmd in banner_cmds:
+        regex = r"banner %s \^C(.+?)(?=\^C)" % cmd
+        match = re.search(regex, config, re.S)
+        if match:
+            key = "banner %s" % cmd
+            banners[key] = match.group(1).strip()
+
+    for cmd in banner_cmds:
+        regex = r"banner %s \^C(.+?)(?=\^C)" % cmd
+        match = re.search(regex, config, re.S)
+        if match:
+            config = config.replace(str(match.group(1)), "")
+
+    config = re.sub(r"banner \w+ \^C\^C", "!! banner removed", config)
+    return config, banners
+
+
+def build_config(megabytes, banner_types, banner_lines=20):
+    blocks = []
+    size = 0
+    index = 0
+    while size < megabytes * 1024 * 1024:
+        block = (
+            "interface GigabitEthernet1/0/%d\n"
+            " description access port %d\n"
+            " switchport access vlan %d\n"
+            " switchport mode access\n"
+            " spanning-tree portfast\n"
+            "!\n" % (index, index, index % 4000 + 1)
+        )
+        blocks.append(block)
+        size += len(block)
+        index += 1
+
+    # IOS prints the banners near the end of the running-config
+    for banner in banner_types:
+        body = "\n".join(
+            "%s banner line %d: authorized access only" % (banner, line)
+            for line in range(banner_lines)
+        )
+        blocks.insert(len(blocks) - 10, "banner %s ^C\n%s\n^C\n" % (banner, body))
+    return "".join(blocks) + "line con 0\nline vty 0 4\n login local\nend\n"
+
+
+def measure(extract, config, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = extract(config)
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--megabytes", type=float, default=5)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    cliconf = Cliconf(None)
+
+    config = build_config(args.megabytes, BANNER_TYPES)
+    before, expected = measure(reference_extract_banners, config, args.repeat)
+    after, result = measure(cliconf._extract_banners, config, args.repeat)
+    if result != expected:
+        raise AssertionError("single pass extraction differs from the reference")
+    print(
+        "%.1f MB, %d banners: reference %.3fs, single pass %.3fs, %.1fx"
+        % (len(config) / 1048576.0, len(expected[1]), before, after, before / after),
+    )
+
+    config = build_config(args.megabytes, BANNER_TYPES + ["slip-ppp"])
+    after, result = measure(cliconf._extract_banners, config, args.repeat)
+    if "banner slip-ppp" not in result[1]:
+        raise AssertionError("slip-ppp banner was not extracted")
+    print("with slip-ppp, %d banners: single pass %.3fs" % (len(result[1]), after))
+
+
+if __name__ == "__main__":
+    main()
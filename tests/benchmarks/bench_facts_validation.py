@@ -0,0 +1,125 @@
+#
+# (c) 2026 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Compare the time the facts of every resource take to be validated against
+its argspec with the spec_walker fast path and with the full AnsibleModule
+validation.
+
+The facts are generated from the argspec: every option is set, with --entries
+entries in every list of dicts, and the values are strings where the option
+wants an int or a bool so that both have to convert them. Both must return
+the same parameters.
+
+Run from a collections tree:
+    python -m ansible_collections.cisco.ios.tests.benchmarks.bench_facts_validation --entries 1 10
+"""
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import argparse
+import importlib
+import pkgutil
+import time
+
+from copy import deepcopy
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import utils
+
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios import argspec
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.spec_walker import (
+    SpecWalker,
+)
+
+
+VALUES = {"int": "10", "bool": "yes", "float": "1.5", "str": "value", None: "value"}
+
+
+def resource_specs():
+    for module in pkgutil.iter_modules(argspec.__path__):
+        if not module.ispkg:
+            continue
+        name = module.name
+        try:
+            module = importlib.import_module("%s.%s.%s" % (argspec.__name__, name, name))
+        except ImportError:
+            continue
+        for attr, value in vars(module).items():
+            if attr.endswith("Args") and "config" in getattr(value, "argument_spec", {}):
+                yield name, value.argument_spec
+
+
+def option_value(spec, entries):
+    if spec.get("choices"):
+        value = spec["choices"][0]
+    elif spec.get("options") is not None:
+        value = options_value(spec["options"], spec.get("mutually_exclusive", []), entries)
+    else:
+        value = VALUES.get(spec.get("type"), VALUES.get(spec.get("elements")))
+    if spec.get("type") == "list":
+        if spec.get("elements") == "dict":
+            return [deepcopy(value) for dummy in range(entries)]
+        return [value]
+    return value
+
+
+def options_value(options, mutually_exclusive, entries):
+    excluded = set()
+    for group in mutually_exclusive:
+        excluded.update(group[1:])
+    return dict(
+        (name, option_value(spec, entries))
+        for name, spec in options.items()
+        if name not in excluded and spec.get("type") != "raw"
+    )
+
+
+def measure(function, spec, data, repeat):
+    start = time.perf_counter()
+    for dummy in range(repeat):
+        result = function(spec, deepcopy(data))
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, nargs="+", default=[1, 10])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    def walk(spec, data):
+        return SpecWalker.for_spec(spec).validate(data)
+
+    print("%-20s %8s %12s %12s %8s" % ("resource", "entries", "spec_walker", "argspec", "ratio"))
+    for name, spec in sorted(resource_specs()):
+        for entries in args.entries:
+            data = {"config": option_value(spec["config"], entries)}
+            fast, result = measure(walk, spec, data, args.repeat)
+            full, expected = measure(utils.validate_config, spec, data, args.repeat)
+            if result != expected:
+                raise AssertionError("%s facts differ for %d entries" % (name, entries))
+            print(
+                "%-20s %8d %10.2fms %10.2fms %7.1fx"
+                % (name, entries, fast * 1e3, full * 1e3, full / fast),
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#
+# (c) 2026 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Compare the time the interface-scoped templates take to parse the
+interface section of a large chassis when each of them splits the whole
+text, when they share one InterfaceBlockIndex, and when only --targeted
+interfaces are looked up in the index.
+
+Run from a collections tree:
+    python -m ansible_collections.cisco.ios.tests.benchmarks.bench_interface_blocks --interfaces 700 --targeted 4
+"""
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import argparse
+import time
+
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.bfd_interfaces import (
+    Bfd_interfacesTemplate,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.hsrp_interfaces import (
+    Hsrp_interfacesTemplate,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.interfaces import (
+    InterfacesTemplate,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.l2_interfaces import (
+    L2_interfacesTemplate,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.l3_interfaces import (
+    L3_interfacesTemplate,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.lag_interfaces import (
+    Lag_interfacesTemplate,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.ospf_interfaces import (
+    Ospf_interfacesTemplate,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.vrf_interfaces import (
+    Vrf_interfacesTemplate,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.interface_blocks import (
+    InterfaceBlockIndex,
+)
+
+
+TEMPLATES = [
+    InterfacesTemplate,
+    L2_interfacesTemplate,
+    L3_interfacesTemplate,
+    Lag_interfacesTemplate,
+    Ospf_interfacesTemplate,
+    Hsrp_interfacesTemplate,
+    Bfd_interfacesTemplate,
+    Vrf_interfacesTemplate,
+]
+
+
+def interface_config(count):
+    lines = []
+    for index in range(count):
+        lines.extend(
+            [
+                "interface GigabitEthernet%d/0/%d" % (index // 48 + 1, index % 48 + 1),
+                " description access port %d" % index,
+                " switchport access vlan %d" % (index % 100 + 10),
+                " switchport mode access",
+                " channel-group %d mode active" % (index % 64 + 1),
+                " ip ospf cost %d" % (index % 50 + 1),
+                " spanning-tree portfast",
+            ],
+        )
+    return "\n".join(lines)
+
+
+def measure(lines_for):
+    start = time.perf_counter()
+    for template in TEMPLATES:
+        template(lines=lines_for()).parse()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--interfaces", type=int, nargs="+", default=[100, 700])
+    parser.add_argument("--targeted", type=int, default=4)
+    args = parser.parse_args()
+
+    print("%10s %12s %12s %12s" % ("interfaces", "splitlines", "shared index", "targeted"))
+    for count in args.interfaces:
+        config = interface_config(count)
+        names = ["GigabitEthernet1/0/%d" % (n + 1) for n in range(args.targeted)]
+        full = measure(config.splitlines)
+        InterfaceBlockIndex._indexes = []
+        shared = measure(lambda: InterfaceBlockIndex.for_config(config).lines())
+        targeted = measure(lambda: InterfaceBlockIndex.for_config(config).lines(names))
+        print("%10d %11.3fs %11.3fs %11.3fs" % (count, full, shared, targeted))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+#
+# (c) 2026 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Report the collection code AnsiballZ ships with each module and the time the
+module takes to import, for this tree and optionally for a git revision.
+
+The payload is found the way AnsiballZ finds it: every import of an
+ansible_collections package anywhere in a file is followed, together with the
+__init__.py of its parent packages. ansible.module_utils is the same for every
+module and is left out. The size is given raw and deflated as in the zip.
+
+The import time is the best of several fresh interpreters importing the
+module after ansible.module_utils.basic, so it covers the collection code only.
+
+Run from a collections tree:
+    python -m ansible_collections.cisco.ios.tests.benchmarks.bench_module_payload --baseline HEAD~1
+"""
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import argparse
+import ast
+import importlib.util
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+import zipfile
+
+
+COLLECTION = ("ansible_collections", "cisco", "ios")
+TREE = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+IMPORT_TIME = """
+import importlib, time
+import ansible.module_utils.basic
+start = time.perf_counter()
+importlib.import_module(%r)
+print(time.perf_counter() - start)
+"""
+
+
+def installed_collections():
+    spec = importlib.util.find_spec("ansible_collections.ansible.netcommon")
+    return os.path.dirname(os.path.dirname(spec.submodule_search_locations[0]))
+
+
+def resolve(parts, tree, installed):
+    """Return the file of a dotted module name, or None"""
+    if tuple(parts[:3]) == COLLECTION:
+        base = os.path.join(tree, *parts[3:])
+    else:
+        base = os.path.join(installed, *parts[1:])
+    for path in (base + ".py", os.path.join(base, "__init__.py")):
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def imported_names(path):
+    with open(path, "rb") as f:
+        tree = ast.parse(f.read())
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                yield alias.name.split("."), None
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            for alias in node.names:
+                yield node.module.split("."), alias.name
+
+
+def find_payload(module_path, tree, installed):
+    """Return the files AnsiballZ ships for a module"""
+    files = set()
+    pending = [module_path]
+    while pending:
+        path = pending.pop()
+        for parts, name in imported_names(path):
+            if parts[0] != COLLECTION[0]:
+                continue
+            if name and resolve(parts + [name], tree, installed):
+                parts = parts + [name]
+            for end in range(2, len(parts) + 1):
+                found = resolve(parts[:end], tree, installed)
+                if found and found not in files:
+                    files.add(found)
+                    pending.append(found)
+    return files
+
+
+def payload_size(files):
+    raw = 0
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        for path in sorted(files):
+            with open(path, "rb") as f:
+                data = f.read()
+            raw += len(data)
+            zf.writestr(path, data)
+    return raw, len(buf.getvalue())
+
+
+def import_time(root, module, repeat):
+    # leave out other checkouts of the collection, such as the one running this
+    paths = [p for p in sys.path if not os.path.isdir(os.path.join(p, *COLLECTION))]
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([root] + paths))
+    name = ".".join(COLLECTION + ("plugins", "modules", module))
+    times = []
+    # the first run writes the byte code cache
+    for _ in range(repeat + 1):
+        out = subprocess.check_output(
+            [sys.executable, "-c", IMPORT_TIME % name],
+            cwd=root,
+            env=env,
+        )
+        times.append(float(out))
+    return min(times[1:])
+
+
+def make_root(tmp, name, source=None, revision=None):
+    """Lay out ansible_collections/cisco/ios for the tree or a git revision"""
+    root = os.path.join(tmp, name)
+    target = os.path.join(root, *COLLECTION)
+    os.makedirs(os.path.dirname(target))
+    if revision is None:
+        os.symlink(source, target)
+    else:
+        archive = subprocess.check_output(["git", "-C", source, "archive", revision])
+        with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+            tar.extractall(target)
+    return root, target
+
+
+def measure(root, tree, installed, modules, repeat):
+    results = {}
+    for module in modules:
+        path = os.path.join(tree, "plugins", "modules", module + ".py")
+        if not os.path.isfile(path):
+            continue
+        files = find_payload(path, tree, installed)
+        files.add(path)
+        raw, zipped = payload_size(files)
+        results[module] = (len(files), raw, zipped, import_time(root, module, repeat))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--baseline", help="git revision to compare with")
+    parser.add_argument("--modules", nargs="+", help="modules to measure, all by default")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    modules = args.modules or sorted(
+        name[:-3]
+        for name in os.listdir(os.path.join(TREE, "plugins", "modules"))
+        if name.endswith(".py") and name != "__init__.py"
+    )
+    installed = installed_collections()
+    tmp = tempfile.mkdtemp()
+    try:
+        root, tree = make_root(tmp, "current", source=TREE)
+        current = measure(root, tree, installed, modules, args.repeat)
+        baseline = {}
+        if args.baseline:
+            root, tree = make_root(tmp, "baseline", source=TREE, revision=args.baseline)
+            baseline = measure(root, tree, installed, modules, args.repeat)
+    finally:
+        shutil.rmtree(tmp)
+
+    print(
+        "%-24s %6s %10s %10s %9s   %s"
+        % ("module", "files", "bytes", "zipped", "import", "baseline files/zipped/import"),
+    )
+    for module in modules:
+        if module not in current:
+            continue
+        files, raw, zipped, elapsed = current[module]
+        line = "%-24s %6d %10d %10d %8.1fms" % (module, files, raw, zipped, elapsed * 1000)
+        if module in baseline:
+            b_files, b_raw, b_zipped, b_elapsed = baseline[module]
+            line += "   %d / %d / %.1fms" % (b_files, b_zipped, b_elapsed * 1000)
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
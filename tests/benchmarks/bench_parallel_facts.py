@@ -0,0 +1,155 @@
+#
+# (c) 2026 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Compare the wall time the facts of every resource take to be parsed from the
+running-config of a large route reflector one after another and in pools of
+--workers processes. Every pool must return the same facts as the serial
+parse.
+
+Run from a collections tree:
+    python -m ansible_collections.cisco.ios.tests.benchmarks.bench_parallel_facts --neighbors 10000 --workers 2 4 8
+"""
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import argparse
+import time
+
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.facts import (
+    FACT_RESOURCE_SUBSETS,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.config_sections import (
+    RunningConfigSnapshot,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.parallel_facts import (
+    SnapshotConnection,
+    populate_facts_parallel,
+)
+
+
+class Module(object):
+    params = {}
+    _ios_parse_cache = None
+
+
+class Connection(object):
+    def __init__(self, config):
+        self.config = config
+
+    def get(self, command):
+        return self.config
+
+
+def running_config(neighbors):
+    lines = ["hostname rr-01"]
+    for index in range(neighbors // 40):
+        lines.extend(
+            [
+                "interface GigabitEthernet%d/0/%d" % (index // 48 + 1, index % 48 + 1),
+                " description uplink %d" % index,
+                " ip address 10.%d.%d.1 255.255.255.0" % (index // 256, index % 256),
+                " ip ospf cost %d" % (index % 50 + 1),
+            ],
+        )
+    for index in range(neighbors // 10):
+        lines.extend(
+            [
+                "ip access-list extended ACL-%d" % (index // 20),
+                " %d permit tcp any host 192.0.2.%d eq 443" % (index % 20 * 10 + 10, index % 250),
+                "ip prefix-list PL-%d seq %d permit 10.%d.0.0/16 le 24"
+                % (index // 20, index % 20 * 5 + 5, index % 256),
+                "route-map RM-%d permit %d" % (index // 20, index % 20 * 10 + 10),
+                " match ip address prefix-list PL-%d" % (index // 20),
+                " set local-preference %d" % (index % 200 + 100),
+            ],
+        )
+    lines.append("router bgp 65000")
+    for index in range(neighbors):
+        address = "10.%d.%d.%d" % (index // 65536, index // 256 % 256, index % 256)
+        lines.extend(
+            [
+                " neighbor %s remote-as %d" % (address, 65001 + index % 1000),
+                " neighbor %s description client %d" % (address, index),
+            ],
+        )
+    lines.append(" address-family ipv4")
+    for index in range(neighbors):
+        address = "10.%d.%d.%d" % (index // 65536, index // 256 % 256, index % 256)
+        lines.extend(
+            [
+                "  neighbor %s activate" % address,
+                "  neighbor %s route-reflector-client" % address,
+            ],
+        )
+    lines.append(" exit-address-family")
+    return "\n".join(lines)
+
+
+def serial(module, snapshot, resources):
+    connection = SnapshotConnection(snapshot)
+    parsed = {}
+    for resource in resources:
+        ansible_facts = {"ansible_network_resources": {}}
+        try:
+            FACT_RESOURCE_SUBSETS[resource](module).populate_facts(connection, ansible_facts)
+        except Exception:
+            continue
+        parsed[resource] = ansible_facts["ansible_network_resources"]
+    return parsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--neighbors", type=int, nargs="+", default=[2000, 10000])
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4, 8])
+    args = parser.parse_args()
+
+    module = Module()
+    resources = sorted(FACT_RESOURCE_SUBSETS)
+    print("%10s %10s %8s %12s %8s" % ("neighbors", "size", "workers", "wall time", "speedup"))
+    for neighbors in args.neighbors:
+        config = running_config(neighbors)
+        snapshot = RunningConfigSnapshot(Connection(config))
+        size = snapshot.prefetch()
+        start = time.perf_counter()
+        expected = serial(module, snapshot, resources)
+        base = time.perf_counter() - start
+        print("%10d %9dk %8s %11.2fs %7.1fx" % (neighbors, size // 1024, "serial", base, 1.0))
+        for workers in args.workers:
+            start = time.perf_counter()
+            parsed = populate_facts_parallel(
+                module,
+                snapshot,
+                FACT_RESOURCE_SUBSETS,
+                resources,
+                workers,
+            )
+            elapsed = time.perf_counter() - start
+            if parsed != expected:
+                raise AssertionError("%d workers parsed different facts" % workers)
+            print(
+                "%10d %9dk %8d %11.2fs %7.1fx"
+                % (neighbors, size // 1024, workers, elapsed, base / elapsed),
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#
+# (c) 2026 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Compare the parse time of the interfaces, l3_interfaces and route_maps
+templates without the parse cache and with a warm parse cache, when
+--changed percent of the top-level blocks changed since they were cached.
+
+Run from a collections tree:
+    python -m ansible_collections.cisco.ios.tests.benchmarks.bench_parse_cache --blocks 1000 --changed 0 5 50
+"""
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import argparse
+import tempfile
+import time
+
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.interfaces import (
+    InterfacesTemplate,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.l3_interfaces import (
+    L3_interfacesTemplate,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.route_maps import (
+    Route_mapsTemplate,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.parse_cache import (
+    ParseCache,
+)
+
+
+def interface_lines(count, changed):
+    lines = []
+    for index in range(count):
+        mtu = 9000 if index * 100 < count * changed else 1500
+        lines.extend(
+            [
+                "interface GigabitEthernet1/0/%d" % index,
+                " description port %d" % index,
+                " mtu %d" % mtu,
+                " ip address 10.%d.%d.1 255.255.255.0" % (index // 256 % 256, index % 256),
+                " ipv6 address 2001:db8:%x::1/64" % index,
+                " no shutdown",
+            ],
+        )
+    return lines
+
+
+def route_map_lines(count, changed):
+    lines = []
+    for index in range(count):
+        metric = 200 if index * 100 < count * changed else 100
+        lines.extend(
+            [
+                "route-map map%d permit 10" % index,
+                " description entry %d" % index,
+                " match ip address prefix-list pl%d" % index,
+                " set metric %d" % metric,
+                " set local-preference %d" % (index % 500),
+            ],
+        )
+    return lines
+
+
+TEMPLATES = [
+    ("interfaces", InterfacesTemplate, interface_lines),
+    ("l3_interfaces", L3_interfacesTemplate, interface_lines),
+    ("route_maps", Route_mapsTemplate, route_map_lines),
+]
+
+
+def measure(template, lines, module=None):
+    start = time.perf_counter()
+    result = template(lines=lines, module=module).parse()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--blocks", type=int, nargs="+", default=[1000])
+    parser.add_argument("--changed", type=int, nargs="+", default=[0, 5, 50])
+    args = parser.parse_args()
+
+    print(
+        "%-16s %8s %8s %10s %10s %10s %8s"
+        % ("template", "blocks", "changed", "no cache", "cold", "warm", "speedup"),
+    )
+    for name, template, build in TEMPLATES:
+        for count in args.blocks:
+            for changed in args.changed:
+                with tempfile.TemporaryDirectory() as tmpdir:
+                    cache = ParseCache(tmpdir, 1024 * 1024 * 1024, "bench")
+                    module = type("Module", (object,), {"_ios_parse_cache": cache})()
+                    base = measure(template, build(count, 0))[0]
+                    cold = measure(template, build(count, 0), module)[0]
+                    lines = build(count, changed)
+                    warm, result = measure(template, lines, module)
+                    if result != measure(template, lines)[1]:
+                        raise AssertionError("%s facts differ for %d blocks" % (name, count))
+                print(
+                    "%-16s %8d %7d%% %9.3fs %9.3fs %9.3fs %7.1fx"
+                    % (name, count, changed, base, cold, warm, base / warm),
+                )
+
+
+if __name__ == "__main__":
+    main()
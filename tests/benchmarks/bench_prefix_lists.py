@@ -0,0 +1,101 @@
+#
+# (c) 2026 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Compare the time the sequences of a prefix list with --entries entries take
+to be compared in a replaced run, where one entry in --every changes, one is
+added and one is removed, when the entry dicts are compared sequence by
+sequence and rendered through the entry template, and when they are packed
+and merged by sequence. Both must generate the same commands.
+
+Run from a collections tree:
+    python -m ansible_collections.cisco.ios.tests.benchmarks.bench_prefix_lists --entries 1000 10000 200000
+"""
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import argparse
+import copy
+import time
+
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.config.prefix_lists.prefix_lists import (
+    Prefix_lists,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.prefix_lists import (
+    Prefix_listsTemplate,
+)
+
+
+def entries(count, every):
+    want = {}
+    have = {}
+    for index in range(count):
+        sequence = (index + 1) * 5
+        entry = {
+            "afi": "ipv4",
+            "name": "BOGONS",
+            "sequence": sequence,
+            "action": "deny",
+            "prefix": "%d.%d.%d.0/24" % (index // 65536 + 1, index // 256 % 256, index % 256),
+            "le": 32,
+        }
+        if index % every != 1:
+            have[sequence] = entry
+        if index % every != 2:
+            want[sequence] = dict(entry)
+        if index % every == 0:
+            want[sequence]["action"] = "permit"
+    return want, have
+
+
+def compare(packed, want, have):
+    module = Prefix_lists.__new__(Prefix_lists)
+    module._tmplt = Prefix_listsTemplate()
+    module.state = "replaced"
+    module.commands = []
+    if not packed:
+        module._compare_packed_seqs = lambda want, have: False
+    want = copy.deepcopy(want)
+    have = copy.deepcopy(have)
+    start = time.perf_counter()
+    module._compare_seqs(want, have)
+    return time.perf_counter() - start, module.commands
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, nargs="+", default=[1000, 10000, 100000, 200000])
+    parser.add_argument("--every", type=int, default=100)
+    args = parser.parse_args()
+
+    print("%8s %10s %10s %10s %8s" % ("entries", "commands", "dicts", "packed", "speedup"))
+    for count in args.entries:
+        want, have = entries(count, args.every)
+        base, expected = compare(False, want, have)
+        elapsed, commands = compare(True, want, have)
+        if commands != expected:
+            raise AssertionError("the commands of %d entries differ" % count)
+        print(
+            "%8d %10d %9.2fs %9.2fs %7.1fx" % (count, len(commands), base, elapsed, base / elapsed),
+        )
+
+
+if __name__ == "__main__":
+    main()
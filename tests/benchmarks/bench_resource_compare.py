@@ -0,0 +1,113 @@
+#
+# (c) 2026 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Compare the time the ios_bgp_global neighbors of a mostly idempotent run take
+to be compared when every parser is run for every neighbor, as
+ResourceModule.compare() does, and when only the parsers of the options that
+changed are run. One neighbor in --every has its description changed. Both
+must generate the same commands.
+
+Run from a collections tree:
+    python -m ansible_collections.cisco.ios.tests.benchmarks.bench_resource_compare --neighbors 2000 10000
+"""
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import argparse
+import copy
+import functools
+import time
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.resource_module import (
+    ResourceModule,
+)
+
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.config.bgp_global.bgp_global import (
+    Bgp_global,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.bgp_global import (
+    Bgp_globalTemplate,
+)
+
+
+def neighbors(count, every):
+    have = {}
+    want = {}
+    for index in range(count):
+        address = "10.%d.%d.%d" % (index // 65536, index // 256 % 256, index % 256)
+        neighbor = {
+            "neighbor_address": address,
+            "remote_as": 65001 + index % 1000,
+            "description": "client %d" % index,
+            "update_source": "Loopback0",
+            "password_options": {"encryption": 7, "pass_key": "0822455D0A16"},
+            "send_community": {"both": True},
+            "route_reflector_client": True,
+        }
+        have[address] = neighbor
+        want[address] = copy.deepcopy(neighbor)
+        if every and index % every == 0:
+            want[address]["description"] = "client %d moved" % index
+    return want, have
+
+
+def config_module(filtered):
+    module = Bgp_global.__new__(Bgp_global)
+    module._tmplt = Bgp_globalTemplate()
+    module.state = "merged"
+    module.commands = []
+    if not filtered:
+        module.compare = functools.partial(ResourceModule.compare, module)
+    return module
+
+
+def measure(filtered, want, have):
+    module = config_module(filtered)
+    want = copy.deepcopy(want)
+    have = copy.deepcopy(have)
+    start = time.perf_counter()
+    module._compare_neighbor_lists(want, have)
+    return time.perf_counter() - start, module.commands
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--neighbors", type=int, nargs="+", default=[2000, 10000])
+    parser.add_argument("--every", type=int, default=100)
+    args = parser.parse_args()
+
+    print(
+        "%10s %10s %12s %12s %8s" % ("neighbors", "commands", "all parsers", "changed", "speedup"),
+    )
+    for count in args.neighbors:
+        want, have = neighbors(count, args.every)
+        base, expected = measure(False, want, have)
+        elapsed, commands = measure(True, want, have)
+        if commands != expected:
+            raise AssertionError("the commands of %d neighbors differ" % count)
+        print(
+            "%10d %10d %11.3fs %11.3fs %7.1fx"
+            % (count, len(commands), base, elapsed, base / elapsed),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#
+# (c) 2026 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Show how the parse time of the acls, route_maps and bgp_address_family
+templates grows with the size of the configuration, when the facts are built
+in place by ResultBuilder and when they are built with dict_merge.
+
+dict_merge copies all the facts parsed so far for every matched line, so it
+is only run up to --dict-merge-lines; both must give the same facts. The
+time per line stays flat when the parse time grows linearly.
+
+Run from a collections tree:
+    python -m ansible_collections.cisco.ios.tests.benchmarks.bench_template_merge --lines 1000 10000 100000
+"""
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import argparse
+import time
+
+from unittest.mock import patch
+
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.acls import (
+    AclsTemplate,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.bgp_address_family import (
+    Bgp_address_familyTemplate,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.route_maps import (
+    Route_mapsTemplate,
+)
+
+
+def acl_lines(count, per_acl=200):
+    lines = []
+    index = 0
+    while len(lines) < count:
+        if index % per_acl == 0:
+            lines.append("ip access-list extended acl%d" % (index // per_acl))
+        lines.append(
+            " %d permit tcp 192.0.2.0 0.0.0.255 host 198.51.100.%d eq %d"
+            % ((index % per_acl + 1) * 10, index % 254 + 1, index % 1000 + 1024),
+        )
+        index += 1
+    return lines[:count]
+
+
+def route_map_lines(count, per_map=50):
+    lines = []
+    index = 0
+    while len(lines) < count:
+        lines.extend(
+            [
+                "route-map map%d permit %d" % (index // per_map, (index % per_map + 1) * 10),
+                " description entry %d" % index,
+                " match ip address prefix-list pl%d" % index,
+                " set metric %d" % index,
+            ],
+        )
+        index += 1
+    return lines[:count]
+
+
+def bgp_address_family_lines(count, per_vrf=100):
+    lines = ["router bgp 65000"]
+    index = 0
+    while len(lines) < count:
+        if index % per_vrf == 0:
+            lines.append(" address-family ipv4 vrf vrf%d" % (index // per_vrf))
+        neighbor = "10.%d.%d.%d" % (index // 65536 % 256, index // 256 % 256, index % 256)
+        lines.extend(
+            [
+                "  neighbor %s remote-as %d" % (neighbor, 65001 + index % 100),
+                "  neighbor %s activate" % neighbor,
+                "  neighbor %s route-map rm-in in" % neighbor,
+                "  network 172.%d.%d.0 mask 255.255.255.0" % (index // 256 % 16 + 16, index % 256),
+            ],
+        )
+        index += 1
+    return lines[:count]
+
+
+TEMPLATES = [
+    ("acls", AclsTemplate, acl_lines),
+    ("route_maps", Route_mapsTemplate, route_map_lines),
+    ("bgp_address_family", Bgp_address_familyTemplate, bgp_address_family_lines),
+]
+
+
+def measure(template, lines, incremental):
+    with patch.object(template, "INCREMENTAL_PARSE", incremental):
+        start = time.perf_counter()
+        result = template(lines=lines).parse()
+        return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--dict-merge-lines", type=int, default=10000)
+    args = parser.parse_args()
+
+    print(
+        "%-20s %8s %10s %10s %12s %12s"
+        % ("template", "lines", "builder", "us/line", "dict_merge", "us/line"),
+    )
+    for name, template, build in TEMPLATES:
+        for count in args.lines:
+            lines = build(count)
+            elapsed, result = measure(template, lines, True)
+            line = "%-20s %8d %9.3fs %10.1f" % (name, count, elapsed, elapsed / count * 1e6)
+            if count <= args.dict_merge_lines:
+                before, expected = measure(template, lines, False)
+                if result != expected:
+                    raise AssertionError("%s facts differ for %d lines" % (name, count))
+                line += " %11.3fs %12.1f" % (before, before / count * 1e6)
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
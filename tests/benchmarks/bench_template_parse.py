@@ -0,0 +1,155 @@
+#
+# (c) 2026 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Compare the keyword indexed IosNetworkTemplate.parse with the netcommon
+NetworkTemplate.parse, template by template.
+
+The configuration of each template is made of the running-config samples in
+its unit tests, repeated up to the requested number of lines. The parsed
+facts must be identical. The regex attempts are the parsers tried on each line
+until the first match, or all of them when no parser matches; the dispatch
+time is the time taken by these attempts alone, while the parse time also
+covers building the facts from the matches.
+
+Run from a collections tree:
+    python -m ansible_collections.cisco.ios.tests.benchmarks.bench_template_parse --lines 5000
+"""
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import argparse
+import ast
+import importlib
+import os
+import pkgutil
+import re
+import textwrap
+import time
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
+    NetworkTemplate,
+)
+
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios import rm_templates
+
+
+TESTS = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "unit",
+    "modules",
+    "network",
+    "ios",
+)
+
+
+def templates():
+    for module in pkgutil.iter_modules(rm_templates.__path__):
+        module = importlib.import_module("%s.%s" % (rm_templates.__name__, module.name))
+        for name, template in sorted(vars(module).items()):
+            if name.endswith("Template") and template.__module__ == module.__name__:
+                yield module.__name__.split(".")[-1], template
+
+
+def sample_lines(resource):
+    """Return the multi-line strings of the unit tests of a resource, as lines"""
+    path = os.path.join(TESTS, "test_ios_%s.py" % resource)
+    if not os.path.isfile(path):
+        return []
+    with open(path) as f:
+        tree = ast.parse(f.read())
+    lines = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            if "\n" in node.value.strip():
+                sample = textwrap.dedent(node.value)
+                lines.extend(line for line in sample.splitlines() if line.strip())
+    return lines
+
+
+def build_lines(samples, count):
+    lines = []
+    while len(lines) < count:
+        lines.extend(samples)
+    return lines[:count]
+
+
+def dispatch(parsers_for, lines):
+    """Return the regex attempts made on the lines and the time they took"""
+    total = 0
+    start = time.perf_counter()
+    for line in lines:
+        tried = 0
+        for tried, parser in enumerate(parsers_for(line), 1):
+            if re.match(parser["getval"], line):
+                break
+        total += tried
+    return total, time.perf_counter() - start
+
+
+def measure(parse, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = parse()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=5000, help="config lines per template")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(
+        "%-28s %8s %19s %19s %19s"
+        % ("template", "parsers", "regex attempts", "dispatch time", "parse time"),
+    )
+    for resource, template in templates():
+        samples = sample_lines(resource)
+        if not samples:
+            continue
+        tmplt = template(lines=build_lines(samples, args.lines))
+        try:
+            before, expected = measure(lambda: NetworkTemplate.parse(tmplt), args.repeat)
+        except Exception:
+            # the template only parses after the resource facts split the config
+            continue
+        after, result = measure(tmplt.parse, args.repeat)
+        if result != expected:
+            raise AssertionError("%s parses differently" % template.__name__)
+        tried_before, dispatch_before = dispatch(lambda line: template.PARSERS, tmplt._lines)
+        tried_after, dispatch_after = dispatch(tmplt.parsers_for, tmplt._lines)
+        print(
+            "%-28s %8d %9d %9d %8.3fs %8.3fs %8.3fs %8.3fs"
+            % (
+                template.__name__,
+                len(template.PARSERS),
+                tried_before,
+                tried_after,
+                dispatch_before,
+                dispatch_after,
+                before,
+                after,
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+#
+# (c) 2026 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Compare the acls and route_maps facts when the templates are rendered with
+the compiled template cache and when they are rendered by the netcommon
+JinjaTemplate, which compiles each template again every time.
+
+The netcommon rendering is obtained by swapping CompiledTemplate and
+IosNetworkTemplate._deepformat back for their netcommon counterparts. The
+facts must be identical. The facts time includes merging the results of the
+matched lines, the templating time covers rendering the result templates of
+the matched lines only.
+
+Run from a collections tree:
+    python -m ansible_collections.cisco.ios.tests.benchmarks.bench_template_render --aces 300
+"""
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import argparse
+import re
+import time
+
+from copy import deepcopy
+from unittest.mock import patch
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
+    NetworkTemplate,
+)
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
+    JinjaTemplate,
+)
+
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.acls.acls import (
+    AclsFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.route_maps.route_maps import (
+    Route_mapsFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.acls import (
+    AclsTemplate,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.route_maps import (
+    Route_mapsTemplate,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils import network_template
+
+
+def build_acls(aces, per_acl=50):
+    lines = []
+    for index in range(aces):
+        if index % per_acl == 0:
+            lines.append("ip access-list extended acl%d" % (index // per_acl))
+        seq = (index % per_acl + 1) * 10
+        if index % 10 == 0:
+            lines.append(" %d remark entry %d" % (seq, index))
+        lines.append(
+            " %d permit tcp 192.0.2.0 0.0.0.255 host 198.51.100.%d eq %d"
+            % (seq, index % 254 + 1, index % 1000 + 1024),
+        )
+    return "\n".join(lines)
+
+
+def build_route_maps(entries, per_map=20):
+    lines = []
+    for index in range(entries):
+        lines.extend(
+            [
+                "route-map map%d permit %d" % (index // per_map, (index % per_map + 1) * 10),
+                " description entry %d" % index,
+                " match ip address prefix-list pl%d" % index,
+                " match community %d" % (index % 500 + 1),
+                " set metric %d" % index,
+                " set local-preference %d" % (index % 300 + 100),
+            ],
+        )
+    return "\n".join(lines)
+
+
+def gather(facts_class, data):
+    ansible_facts = {"ansible_network_resources": {}}
+    facts_class(None).populate_facts(None, ansible_facts, data=data)
+    return ansible_facts["ansible_network_resources"]
+
+
+def matches(tmplt):
+    """Return the result template and variables of every matched line"""
+    found = []
+    shared = {}
+    for line in tmplt._lines:
+        for parser in tmplt.parsers_for(line):
+            cap = re.match(parser["getval"], line)
+            if cap:
+                capdict = dict((k, v) for k, v in cap.groupdict().items() if v is not None)
+                if parser.get("shared"):
+                    shared = capdict
+                vals = dict(shared)
+                vals.update(capdict)
+                found.append((parser["result"], vals))
+                break
+    return found
+
+
+def templating(template, lines):
+    """Time rendering the results of the matched lines, both ways"""
+    tmplt = template(lines=lines)
+    found = matches(tmplt)
+    plain = NetworkTemplate(lines=lines, tmplt=template())
+
+    start = time.perf_counter()
+    expected = [plain._deepformat(deepcopy(result), vals) for result, vals in found]
+    before = time.perf_counter() - start
+
+    start = time.perf_counter()
+    rendered = [tmplt._deepformat(result, vals) for result, vals in found]
+    after = time.perf_counter() - start
+    if rendered != expected:
+        raise AssertionError("%s renders differently" % template.__name__)
+    return before, after
+
+
+def measure(facts_class, data, repeat, netcommon=False):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        if netcommon:
+            with patch.object(network_template, "CompiledTemplate", JinjaTemplate):
+                with patch.object(
+                    network_template.IosNetworkTemplate,
+                    "_deepformat",
+                    NetworkTemplate._deepformat,
+                ):
+                    result = gather(facts_class, data)
+        else:
+            result = gather(facts_class, data)
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--aces", type=int, default=300)
+    parser.add_argument("--route-map-entries", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    acls = build_acls(args.aces)
+    runs = [
+        ("acls", AclsFacts, acls, AclsTemplate, AclsFacts(None).sanitize_data(acls)),
+        (
+            "route_maps",
+            Route_mapsFacts,
+            build_route_maps(args.route_map_entries),
+            Route_mapsTemplate,
+            None,
+        ),
+    ]
+    print(
+        "%-12s %8s %28s %28s"
+        % ("resource", "lines", "facts netcommon/compiled", "templating netcommon/compiled"),
+    )
+    for name, facts_class, data, template, lines in runs:
+        before, expected = measure(facts_class, data, args.repeat, netcommon=True)
+        after, result = measure(facts_class, data, args.repeat)
+        if result != expected:
+            raise AssertionError("%s facts differ" % name)
+        render_before, render_after = templating(template, (lines or data).splitlines())
+        print(
+            "%-12s %8d %8.3fs %8.3fs %6.1fx %8.3fs %8.3fs %6.1fx"
+            % (
+                name,
+                data.count("\n") + 1,
+                before,
+                after,
+                before / after,
+                render_before,
+                render_after,
+                render_before / render_after,
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main()
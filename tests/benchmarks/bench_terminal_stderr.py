@@ -0,0 +1,147 @@
+#
+# (c) 2026 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Compare the list of terminal_stderr_re regexes with the StderrMatcher the
+ios terminal plugin hands to network_cli.
+
+The captured outputs under tests/unit are repeated up to the requested size
+and cut into receive windows the way network_cli does: after every read the
+last 256 bytes of the buffer are searched. Every window must give the
+same first match with both matchers.
+
+Run from a collections tree:
+    python -m ansible_collections.cisco.ios.tests.benchmarks.bench_terminal_stderr --megabytes 5
+"""
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import argparse
+import os
+import random
+import time
+
+from ansible_collections.cisco.ios.plugins.terminal.ios import StderrMatcher, TerminalModule
+
+
+FIXTURES = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "unit",
+    "modules",
+    "network",
+    "ios",
+    "fixtures",
+)
+
+ERRORS = [
+    b"% Invalid input detected at '^' marker.",
+    b"% Incomplete command.",
+    b'% Ambiguous command:  "sh int"',
+    b"%SNMP agent not enabled",
+    b"% 10.0.0.1 overlaps with GigabitEthernet1",
+]
+
+
+def build_output(megabytes, errors, seed=0):
+    captured = []
+    for name in sorted(os.listdir(FIXTURES)):
+        path = os.path.join(FIXTURES, name)
+        if name.startswith("ios_") and os.path.isfile(path):
+            with open(path, "rb") as f:
+                captured.append(f.read())
+    blob = b"\n".join(captured)
+    size = int(megabytes * 1024 * 1024)
+    lines = (blob * (size // len(blob) + 1))[:size].splitlines()
+
+    rng = random.Random(seed)
+    for _ in range(errors):
+        lines.insert(rng.randrange(len(lines)), rng.choice(ERRORS))
+    return b"\n".join(lines)
+
+
+def windows(output, read_size=256):
+    """Yield the windows network_cli searches while receiving output"""
+    for end in range(read_size, len(output) + read_size, read_size):
+        end = min(end, len(output))
+        start = max(0, end - 256)
+        yield output[start:end]
+
+
+def first_match(patterns, window):
+    for regex in patterns:
+        match = regex.search(window)
+        if match:
+            return regex.pattern, match.span()
+    return None
+
+
+def scan(search, output, read_size):
+    results = []
+    start = time.perf_counter()
+    for window in windows(output, read_size):
+        results.append(search(window))
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--megabytes", type=float, nargs="+", default=[1, 5])
+    parser.add_argument("--errors", type=int, default=20, help="error lines to inject")
+    parser.add_argument("--read-size", type=int, default=256, help="bytes per socket read")
+    args = parser.parse_args()
+
+    regexes = TerminalModule.terminal_stderr_re
+    matcher = StderrMatcher(TerminalModule.terminal_stderr_patterns)
+
+    def combined(window):
+        match = matcher.search(window)
+        if match:
+            return matcher.pattern, match.span()
+        return None
+
+    print(
+        "%8s %9s %8s %12s %12s %9s"
+        % ("MB", "windows", "matches", "regex list", "matcher", "speedup")
+    )
+    for megabytes in args.megabytes:
+        output = build_output(megabytes, args.errors)
+        baseline, expected = scan(
+            lambda window: first_match(regexes, window),
+            output,
+            args.read_size,
+        )
+        elapsed, results = scan(combined, output, args.read_size)
+        if results != expected:
+            raise AssertionError("StderrMatcher disagrees with terminal_stderr_re")
+        print(
+            "%8.1f %9d %8d %11.3fs %11.3fs %8.1fx"
+            % (
+                megabytes,
+                len(results),
+                len([r for r in results if r]),
+                baseline,
+                elapsed,
+                baseline / elapsed,
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#
+# (c) 2026 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Compare the time the trunk VLAN lists of --ports ports, each allowing about
+--vlans VLANs, take to be compared in an overridden ios_l2_interfaces run when
+they are expanded to lists of integers, as they were, and when they are held
+as VlanSet bitmaps. Both must generate the same commands.
+
+Run from a collections tree:
+    python -m ansible_collections.cisco.ios.tests.benchmarks.bench_trunk_vlans --ports 700 --vlans 4000
+"""
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import argparse
+import time
+
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.config.l2_interfaces.l2_interfaces import (
+    L2_interfaces,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.utils import (
+    generate_switchport_trunk,
+    get_ranges,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.vlan_set import VlanSet
+
+
+def ports(count, vlans):
+    wanted = []
+    current = []
+    for index in range(count):
+        first = index % 50 + 1
+        wanted.append(
+            {"allowed_vlans": ["%d-%d" % (first, first + vlans - 1)], "pruning_vlans": ["1-100"]},
+        )
+        current.append(
+            {
+                "allowed_vlans": [
+                    "%d-%d" % (first + 10, first + vlans // 2),
+                    "%d-%d" % (first + vlans // 2 + 2, first + vlans + 20),
+                ],
+                "pruning_vlans": ["1-100"],
+            },
+        )
+    return wanted, current
+
+
+def to_list(ranges):
+    result = []
+    for part in ranges:
+        if "-" in part:
+            first, last = part.split("-")
+            result.extend(range(int(first), int(last) + 1))
+        else:
+            result.append(int(part))
+    return sorted(result)
+
+
+def to_range(vlans):
+    return ",".join(
+        "-".join(map(str, (vrange[0], vrange[-1])[: len(vrange)])) for vrange in get_ranges(vlans)
+    )
+
+
+def lists(wanted, current):
+    commands = []
+    for want, have in zip(wanted, current):
+        for vlan in ["allowed_vlans", "pruning_vlans"]:
+            want_vlans = to_list(want[vlan])
+            have_vlans = to_list(have[vlan])
+            cmd_always = list(set(want_vlans) - set(have_vlans))
+            rem_vlan = []
+            for vl_no in have_vlans:
+                if vl_no not in cmd_always and vl_no not in want_vlans:
+                    rem_vlan.append(vl_no)
+            if rem_vlan:
+                commands.append(
+                    "switchport trunk {0} vlan remove {1}".format(
+                        vlan.split("_", maxsplit=1)[0],
+                        to_range(sorted(rem_vlan)),
+                    ),
+                )
+            if cmd_always:
+                commands.extend(
+                    generate_switchport_trunk(
+                        vlan.split("_", maxsplit=1)[0],
+                        have_vlans,
+                        to_range(sorted(cmd_always)),
+                    ),
+                )
+    return commands
+
+
+def bitmaps(wanted, current):
+    module = L2_interfaces.__new__(L2_interfaces)
+    module.state = "overridden"
+    module.commands = []
+    for want, have in zip(wanted, current):
+        module.compare_list(
+            {"trunk": dict((key, VlanSet.from_ranges(value)) for key, value in want.items())},
+            {"trunk": dict((key, VlanSet.from_ranges(value)) for key, value in have.items())},
+        )
+    return module.commands
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ports", type=int, nargs="+", default=[100, 700])
+    parser.add_argument("--vlans", type=int, default=4000)
+    args = parser.parse_args()
+
+    print("%8s %10s %10s %10s %8s" % ("ports", "commands", "lists", "bitmaps", "speedup"))
+    for count in args.ports:
+        wanted, current = ports(count, args.vlans)
+        start = time.perf_counter()
+        expected = lists(wanted, current)
+        base = time.perf_counter() - start
+        start = time.perf_counter()
+        commands = bitmaps(wanted, current)
+        elapsed = time.perf_counter() - start
+        if commands != expected:
+            raise AssertionError("the commands of %d ports differ" % count)
+        print(
+            "%8d %10d %9.2fs %9.3fs %7.1fx" % (count, len(commands), base, elapsed, base / elapsed),
+        )
+
+
+if __name__ == "__main__":
+    main()
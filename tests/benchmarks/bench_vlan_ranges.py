@@ -0,0 +1,100 @@
+#
+# (c) 2026 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Count the lines ios_vlans pushes to create --vlans VLANs in a merged run and
+to remove them in a purged run with one `vlan N` or `no vlan N` line per VLAN,
+and with the range commands ios_vlans generates. One VLAN in --named has a name and
+keeps a block of its own.
+
+Run from a collections tree:
+    python -m ansible_collections.cisco.ios.tests.benchmarks.bench_vlan_ranges --vlans 100 1000 4000
+"""
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import argparse
+import time
+
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.config.vlans.vlans import (
+    Vlans,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.vlans import (
+    VlansTemplate,
+)
+
+
+def vlans(count, named):
+    config = []
+    for index in range(count):
+        # leave a gap every 100 VLANs so that the ranges are split
+        vlan = {"vlan_id": 2 + index + index // 100}
+        if named and index % named == 0:
+            vlan["name"] = "vlan_%d" % vlan["vlan_id"]
+        config.append(vlan)
+    return config
+
+
+def generate(state, want, have):
+    module = Vlans.__new__(Vlans)
+    module._tmplt = VlansTemplate()
+    module.parsers = [
+        "name",
+        "state",
+        "remote_span",
+        "private_vlan.type",
+        "private_vlan.associated",
+    ]
+    module.state = state
+    module.commands = []
+    module.want = [dict(vlan) for vlan in want]
+    module.bare_vlans = set(vlan["vlan_id"] for vlan in want if len(vlan) == 1)
+    module.generate_commands(module.want, [dict(vlan) for vlan in have], "vlans")
+    return module.commands
+
+
+def per_vlan(state, config):
+    lines = 0
+    for vlan in config:
+        lines += 1 + (state == "merged" and "name" in vlan)
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--vlans", type=int, nargs="+", default=[100, 1000, 4000])
+    parser.add_argument("--named", type=int, default=50)
+    args = parser.parse_args()
+
+    print("%8s %8s %10s %10s %10s" % ("vlans", "state", "per vlan", "ranges", "time"))
+    for count in args.vlans:
+        config = vlans(min(count, 4000), args.named)
+        for state, want, have in [("merged", config, []), ("purged", config, config)]:
+            start = time.perf_counter()
+            commands = generate(state, want, have)
+            elapsed = time.perf_counter() - start
+            print(
+                "%8d %8s %10d %10d %9.3fs"
+                % (len(config), state, per_vlan(state, config), len(commands), elapsed),
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#
+# (c) 2026 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Time the parse of the show vlan output of a switch with --vlans VLANs, all of
+them remote-span VLANs and every tenth one with a vlan configuration, up to the
+full range of 4094 VLANs. Every VLAN must be parsed with its MTU, its remote
+span and its member.
+
+Run from a collections tree:
+    python -m ansible_collections.cisco.ios.tests.benchmarks.bench_vlans_facts --vlans 1000 4094
+"""
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import argparse
+import time
+
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.vlans.vlans import (
+    VlansFacts,
+)
+
+
+def show_vlan(count):
+    names = [
+        "VLAN Name                             Status    Ports",
+        "---- -------------------------------- --------- -------------------------------",
+    ]
+    types = [
+        "",
+        "VLAN Type  SAID       MTU   Parent RingNo BridgeNo Stp  BrdgMode Trans1 Trans2",
+        "---- ----- ---------- ----- ------ ------ -------- ---- -------- ------ ------",
+    ]
+    for vlan in range(1, count + 1):
+        names.append(
+            "%-4d %-32s %-9s Gi1/0/%d, Gi1/0/%d"
+            % (vlan, "VLAN%04d" % vlan, "active", vlan % 48 + 1, (vlan + 1) % 48 + 1),
+        )
+        if vlan % 10 == 0:
+            names.append("%48s Gi2/0/1, Gi2/0/2, Gi2/0/3" % "")
+        types.append(
+            "%-4d enet  %-10d 1500  -      -      -        -    -        0      0"
+            % (vlan, 100000 + vlan),
+        )
+    remote_span = ["", "Remote SPAN VLANs", "-" * 78, "1-%d" % count]
+    private_vlans = [
+        "",
+        "Primary Secondary Type              Ports",
+        "------- --------- ----------------- ------------------------------------------",
+    ]
+    return "\n".join(names + types + remote_span + private_vlans)
+
+
+def vlan_configurations(count):
+    return dict(
+        (vlan, {"vlan_id": vlan, "member": {"vni": 10000 + vlan}})
+        for vlan in range(10, count + 1, 10)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--vlans", type=int, nargs="+", default=[1000, 4094])
+    args = parser.parse_args()
+
+    facts = VlansFacts(None)
+    print("%8s %10s" % ("vlans", "parse"))
+    for count in args.vlans:
+        data = show_vlan(count)
+        conf = vlan_configurations(count)
+        start = time.perf_counter()
+        vlans = facts.parse_vlans(data, conf)
+        elapsed = time.perf_counter() - start
+        if len(vlans) != count or not all(
+            vlan.get("mtu") == 1500
+            and vlan.get("remote_span")
+            and ("member" in vlan) == (vlan["vlan_id"] % 10 == 0)
+            for vlan in vlans
+        ):
+            raise AssertionError("the %d VLANs are not all parsed" % count)
+        print("%8d %9.3fs" % (count, elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -7,9 +7,34 @@ from __future__ import absolute_import, division, print_function
 
 
 __metaclass__ = type
+from copy import deepcopy
 from textwrap import dedent
 from unittest.mock import patch
 
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
+    dict_merge,
+    validate_config,
+)
+
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.argspec.acls.acls import (
+    AclsArgs,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.acls.acls import (
+    AclsFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.acls import (
+    AclsTemplate,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.config_sections import (
+    iter_lines,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.network_template import (
+    IosNetworkTemplate,
+    ResultBuilder,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.spec_walker import (
+    SpecWalker,
+)
 from ansible_collections.cisco.ios.plugins.modules import ios_acls
 from ansible_collections.cisco.ios.tests.unit.modules.utils import set_module_args
 
@@ -1222,6 +1247,7 @@ class TestIosAclsModule(TestIosModule):
     def test_ios_acls_overridden_idempotent(self):
         self.execute_show_command.return_value = dedent(
             """\
+            ip access-list standard test_acl
             ip access-list extended 110
                 10 permit tcp 198.51.100.0 0.0.0.255 any eq 22 log (tag = testLog)
                 20 deny icmp 192.0.2.0 0.0.0.255 192.0.3.0 0.0.0.255 echo dscp ef ttl eq 10
@@ -1347,6 +1373,47 @@ class TestIosAclsModule(TestIosModule):
         ]
         self.assertEqual(sorted(result["commands"]), sorted(commands))
 
+    def test_ios_acls_deleted_empty_acl_from_running_config(self):
+        self.execute_show_command.return_value = dedent(
+            """\
+            ip access-list extended test_empty
+            ip access-list extended 110
+                10 permit tcp 198.51.100.0 0.0.0.255 any eq 22 log (tag = testLog)
+            """,
+        )
+        set_module_args(dict(config=[dict(afi="ipv4")], state="deleted"))
+        result = self.execute_module(changed=True)
+        commands = [
+            "no ip access-list extended 110",
+            "no ip access-list extended test_empty",
+        ]
+        self.assertEqual(sorted(result["commands"]), sorted(commands))
+        self.execute_show_command_name.assert_not_called()
+
+    def test_ios_acls_deleted_numbered_acl_names_fallback(self):
+        self.execute_show_command.return_value = dedent(
+            """\
+            access-list 10 permit 192.0.2.1
+            ip access-list extended 110
+                10 permit tcp 198.51.100.0 0.0.0.255 any eq 22 log (tag = testLog)
+            """,
+        )
+        self.execute_show_command_name.return_value = dedent(
+            """\
+            Standard IP access list 10
+            Extended IP access list 110
+            """,
+        )
+        set_module_args(dict(config=[dict(afi="ipv4")], state="deleted"))
+        result = self.execute_module(changed=True)
+        commands = [
+            "no ip access-list extended 110",
+            "no ip access-list standard 10",
+        ]
+        self.assertEqual(sorted(result["commands"]), sorted(commands))
+        # once for have, and once more for the facts after the change
+        self.assertEqual(self.execute_show_command_name.call_count, 2)
+
     def test_ios_acls_deleted_acl_based(self):
         self.execute_show_command.return_value = dedent(
             """\
@@ -3550,3 +3617,92 @@ class TestIosAclsModule(TestIosModule):
             },
         ]
         self.assertEqual(parsed_list, result["parsed"])
+
+    def test_ios_acls_result_builder_merges_like_dict_merge(self):
+        results = [
+            {"acls": {"test": {"name": "test", "aces": [{"sequence": "10", "grant": "permit"}]}}},
+            {"acls": {"test": {"aces": [{"sequence": "20"}, {"sequence": "20"}]}}},
+            {"acls": {"test": {"aces": [{"sequence": "10", "grant": "permit"}]}}},
+            {"acls": {"test": {"acl_type": "extended", "remarks": ["a", "b"]}}},
+            {"acls": {"test": {"remarks": ["b", "c"], "acl_type": None}}},
+            {"acls": {"other": {"name": "other", "aces": [{"protocol": ["ip", {"x": 1}]}]}}},
+            {"acls": {"other": {"aces": [{"protocol": ["ip", {"x": 1}]}, {"sequence": 5}]}}},
+            {"acls": {"test": "replaced"}},
+            {"acls": {"test": {"name": "test"}}},
+        ]
+        builder = ResultBuilder()
+        expected = {}
+        for result in results:
+            expected = dict_merge(expected, result)
+            self.assertEqual(builder.merge(deepcopy(result)), expected)
+        self.assertEqual(len(builder.result["acls"]["other"]["aces"]), 2)
+
+    def test_ios_acls_spec_walker_validates_like_argspec(self):
+        acls = {
+            "config": [
+                {
+                    "afi": "ipv4",
+                    "acls": [
+                        {
+                            "name": "test_acl",
+                            "acl_type": "extended",
+                            "aces": [
+                                {
+                                    "sequence": "10",
+                                    "grant": "permit",
+                                    "protocol": "tcp",
+                                    "source": {"any": True},
+                                    "destination": {
+                                        "host": "192.0.2.1",
+                                        "port_protocol": {"eq": 22},
+                                    },
+                                    "log": {"set": True},
+                                },
+                            ],
+                        },
+                        {"name": "110", "aces": [{"sequence": 20, "remarks": ["a", "b"]}]},
+                    ],
+                },
+            ],
+        }
+        spec = AclsArgs.argument_spec
+        expected = validate_config(spec, deepcopy(acls))
+        validated = SpecWalker(spec).validate(deepcopy(acls))
+        self.assertEqual(validated, expected)
+        self.assertEqual(list(validated), list(expected))
+        self.assertIs(
+            SpecWalker.for_spec(AclsArgs.argument_spec),
+            SpecWalker.for_spec(AclsArgs.argument_spec),
+        )
+
+    def test_ios_acls_parse_blocks(self):
+        data = "\n".join(
+            [
+                "ip access-list standard 10",
+                " 10 remark first",
+                " 10 permit 192.0.2.1 (12 matches)",
+                " remark trailing",
+                "ip access-list extended 110",
+                " 10 permit tcp 198.51.100.0 0.0.0.255 any eq 22 log (tag = testLog)",
+                " 20 remark second",
+                " 20 deny icmp any any echo",
+                "ipv6 access-list R1_TRAFFIC",
+                " sequence 10 remark ipv6",
+                " sequence 10 deny tcp any eq www any eq telnet ack dscp af11",
+            ],
+        )
+        facts = AclsFacts(None)
+        lines = list(facts.iter_sanitized(iter_lines(data)))
+        self.assertEqual(lines, facts.sanitize_data(data).splitlines())
+        self.assertEqual(
+            lines[1:4],
+            ["1  10 remark first", " 10 permit 192.0.2.1", "2  remark trailing"],
+        )
+
+        expected = IosNetworkTemplate(lines=lines, tmplt=AclsTemplate()).parse()
+        blocks = list(IosNetworkTemplate(lines=iter(lines), tmplt=AclsTemplate()).parse_blocks())
+        self.assertEqual([len(block["acls"]) for block in blocks], [1, 1, 1])
+        merged = {}
+        for block in blocks:
+            merged.update(block["acls"])
+        self.assertEqual(merged, expected["acls"])
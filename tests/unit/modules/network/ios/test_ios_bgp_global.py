@@ -7,9 +7,21 @@ from __future__ import absolute_import, division, print_function
 
 
 __metaclass__ = type
+from copy import deepcopy
 from textwrap import dedent
 from unittest.mock import patch
 
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.resource_module import (
+    ResourceModule,
+)
+
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.rm_templates.bgp_global import (
+    Bgp_globalTemplate,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.resource_module import (
+    IosResourceModule,
+    diverging_paths,
+)
 from ansible_collections.cisco.ios.plugins.modules import ios_bgp_global
 from ansible_collections.cisco.ios.tests.unit.modules.utils import AnsibleFailJson, set_module_args
 
@@ -925,3 +937,55 @@ class TestIosBgpGlobalModule(TestIosModule):
             },
         )
         self.execute_module(changed=False, commands=[])
+
+    def test_ios_bgp_global_compare_changed_parsers(self):
+        have = {
+            "neighbor_address": "192.0.2.1",
+            "remote_as": 65001,
+            "description": "client",
+            "fall_over": {"bfd": {"set": True}},
+            "send_community": {"both": True},
+        }
+        want = deepcopy(have)
+        want["description"] = "moved"
+        want["fall_over"] = {"route_map": "RMAP"}
+        del want["send_community"]
+        self.assertEqual(
+            diverging_paths(want, have),
+            set(["description", "fall_over.bfd", "fall_over.route_map", "send_community"]),
+        )
+        self.assertEqual(diverging_paths(have, deepcopy(have)), set())
+
+        parsers = [
+            "remote_as",
+            "description",
+            "fall_over.bfd",
+            "fall_over.route_map",
+            "send_community.both",
+            "send_community.set",
+            "shutdown",
+        ]
+        filtered = IosResourceModule.__new__(IosResourceModule)
+        filtered._tmplt = Bgp_globalTemplate()
+        filtered.commands = []
+        self.assertEqual(
+            filtered.changed_parsers(parsers, want, have),
+            [
+                "description",
+                "fall_over.bfd",
+                "fall_over.route_map",
+                "send_community.both",
+                "send_community.set",
+            ],
+        )
+        full = IosResourceModule.__new__(IosResourceModule)
+        full._tmplt = Bgp_globalTemplate()
+        full.commands = []
+        filtered.compare(parsers, want=want, have=have)
+        ResourceModule.compare(full, parsers, want=want, have=have)
+        self.assertEqual(filtered.commands, full.commands)
+        self.assertEqual(len(filtered.commands), 4)
+
+        filtered.commands = []
+        filtered.compare(parsers, want=have, have=deepcopy(have))
+        self.assertEqual(filtered.commands, [])
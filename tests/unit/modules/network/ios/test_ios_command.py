@@ -37,7 +37,7 @@ class TestIosCommandModule(TestIosModule):
         super(TestIosCommandModule, self).setUp()
 
         self.mock_run_commands = patch(
-            "ansible_collections.cisco.ios.plugins.modules.ios_command.run_commands",
+            "ansible_collections.cisco.ios.plugins.modules.ios_command.run_commands_batch",
         )
         self.run_commands = self.mock_run_commands.start()
 
@@ -57,7 +57,14 @@ class TestIosCommandModule(TestIosModule):
                 except ValueError:
                     command = item["command"]
                 filename = str(command).replace(" ", "_")
-                output.append(load_fixture(filename))
+                output.append(
+                    dict(
+                        command=item["command"],
+                        output=load_fixture(filename),
+                        error=None,
+                        elapsed=0.0,
+                    ),
+                )
             return output
 
         self.run_commands.side_effect = load_from_file
@@ -74,6 +81,18 @@ class TestIosCommandModule(TestIosModule):
         self.assertEqual(len(result["stdout"]), 2)
         self.assertTrue(result["stdout"][0].startswith("Cisco IOS Software"))
 
+    def test_ios_command_timing(self):
+        set_module_args(dict(commands=["show version", "show version"]))
+        result = self.execute_module()
+        self.assertEqual(
+            result["command_timing"],
+            [
+                {"command": "show version", "elapsed": 0.0},
+                {"command": "show version", "elapsed": 0.0},
+            ],
+        )
+        self.assertEqual(self.run_commands.call_count, 1)
+
     def test_ios_command_wait_for(self):
         wait_for = 'result[0] contains "Cisco IOS"'
         set_module_args(dict(commands=["show version"], wait_for=wait_for))
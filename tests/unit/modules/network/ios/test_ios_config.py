@@ -23,7 +23,16 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 from unittest.mock import MagicMock, patch
 
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.config import (
+    NetworkConfig,
+    dumps,
+)
+
 from ansible_collections.cisco.ios.plugins.cliconf.ios import Cliconf
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios import ios
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.config_tree import (
+    IosNetworkConfig,
+)
 from ansible_collections.cisco.ios.plugins.modules import ios_config
 from ansible_collections.cisco.ios.tests.unit.modules.utils import set_module_args
 
@@ -159,6 +168,68 @@ class TestIosConfigModule(TestIosModule):
         commands = ["interface GigabitEthernet0/0", "shutdown"]
         self.execute_module(changed=True, commands=commands)
 
+    def test_ios_config_lines_w_parents_scoped_running_config(self):
+        lines = ["neighbor 192.0.2.1 remote-as 65001"]
+        parents = ["router bgp 65000"]
+        set_module_args(dict(lines=lines, parents=parents))
+        self.conn.get_diff = MagicMock(
+            return_value=self.cliconf_obj.get_diff(
+                "router bgp 65000\n neighbor 192.0.2.1 remote-as 65001",
+                "",
+            ),
+        )
+        self.execute_module(changed=True, commands=parents + lines)
+        self.assertEqual(
+            self.get_config.call_args[1]["flags"],
+            ["| section ^router bgp 65000"],
+        )
+
+    def test_ios_config_lines_w_interface_parent_scoped_running_config(self):
+        lines = ["shutdown"]
+        parents = ["interface GigabitEthernet0/0"]
+        set_module_args(dict(lines=lines, parents=parents))
+        self.conn.get_diff = MagicMock(
+            return_value=self.cliconf_obj.get_diff(
+                "interface GigabitEthernet0/0\n shutdown",
+                self.running_config,
+            ),
+        )
+        self.execute_module(changed=True, commands=parents + lines)
+        self.assertEqual(
+            self.get_config.call_args[1]["flags"],
+            ["interface GigabitEthernet0/0"],
+        )
+
+    def test_ios_config_src_full_running_config(self):
+        src = load_fixture("ios_config_src.cfg")
+        set_module_args(dict(src=src))
+        self.conn.get_diff = MagicMock(
+            return_value=self.cliconf_obj.get_diff(src, self.running_config),
+        )
+        self.execute_module(
+            changed=True,
+            commands=["hostname foo", "interface GigabitEthernet0/0", "no ip address"],
+            sort=False,
+        )
+        self.assertEqual(self.get_config.call_args[1]["flags"], [])
+
+    def test_get_running_config_scope(self):
+        self.assertEqual(
+            ios_config.get_running_config_scope(["interface GigabitEthernet0/0"], "all"),
+            "| section ^interface GigabitEthernet0/0",
+        )
+        self.assertEqual(
+            ios_config.get_running_config_scope(
+                ["ip access-list extended test", "10 permit ip any any"],
+            ),
+            "| section ^ip access-list extended test",
+        )
+        self.assertIsNone(
+            ios_config.get_running_config_scope(["interface range GigabitEthernet0/1 - 2"]),
+        )
+        self.assertIsNone(ios_config.get_running_config_scope(["route-map (a|b) permit 10"]))
+        self.assertIsNone(ios_config.get_running_config_scope([]))
+
     def test_ios_config_before(self):
         lines = ["hostname foo"]
         set_module_args(dict(lines=lines, before=["test1", "test2"]))
@@ -461,3 +532,91 @@ class TestIosConfigModule(TestIosModule):
         )
         self.assertIn("interface GigabitEthernet0/0", raw)
         self.assertIn("description x", raw)
+
+    def test_config_tree_matches_network_config(self):
+        running = load_fixture("ios_config_config.cfg")
+        for src in (load_fixture("ios_config_src.cfg"), load_fixture("ios_config_defaults.cfg")):
+            for match in ("line", "strict", "exact"):
+                for replace in ("line", "block"):
+                    expected = dumps(
+                        NetworkConfig(indent=1, contents=src).difference(
+                            NetworkConfig(indent=1, contents=running),
+                            match=match,
+                            replace=replace,
+                        ),
+                        "commands",
+                    )
+                    result = dumps(
+                        IosNetworkConfig(indent=1, contents=src).difference(
+                            IosNetworkConfig(indent=1, contents=running),
+                            match=match,
+                            replace=replace,
+                        ),
+                        "commands",
+                    )
+                    self.assertEqual(result, expected)
+
+    def test_config_tree_ignore_lines_per_instance(self):
+        running = IosNetworkConfig(
+            indent=1,
+            contents="hostname router\nntp server 192.0.2.1\n",
+            ignore_lines=["ntp server"],
+        )
+        self.assertEqual([item.text for item in running.items], ["hostname router"])
+        candidate = IosNetworkConfig(indent=1, contents="ntp server 192.0.2.1\n")
+        self.assertEqual([item.text for item in candidate.items], ["ntp server 192.0.2.1"])
+        self.assertEqual(
+            dumps(candidate.difference(running), "commands"),
+            "ntp server 192.0.2.1",
+        )
+
+    def test_config_tree_add_skips_existing_children(self):
+        candidate = IosNetworkConfig(indent=1)
+        parents = ["interface GigabitEthernet0/0"]
+        candidate.add(["description test", "shutdown"], parents=parents)
+        candidate.add(["description test", "no shutdown"], parents=parents)
+        candidate.add(["hostname router", "hostname router"])
+        self.assertEqual(
+            str(candidate),
+            "interface GigabitEthernet0/0\n description test\n shutdown\n no shutdown\n"
+            "hostname router",
+        )
+
+    def test_ios_config_reports_config_cache(self):
+        src = load_fixture("ios_config_src.cfg")
+        set_module_args(dict(src=src))
+        self.conn.get_diff = MagicMock(
+            return_value=self.cliconf_obj.get_diff(src, self.running_config),
+        )
+        with patch(
+            "ansible_collections.cisco.ios.plugins.modules.ios_config.get_config_cache",
+            return_value={"hit": True},
+        ):
+            result = self.execute_module(changed=True)
+        self.assertEqual(result["config_cache"], {"hit": True})
+
+    def test_get_config_records_config_cache_hit(self):
+        module = type("Module", (object,), {})()
+        module._ios_capabilities = {"network_api": "cliconf", "config_cache": {"ttl": 60}}
+        module._ios_connection = MagicMock()
+        module._ios_connection.get_config.return_value = "hostname router"
+        module._ios_connection.get_config_cache_hit.side_effect = [True, False]
+        with patch.dict(ios._DEVICE_CONFIGS, clear=True):
+            self.assertIsNone(ios.get_config_cache(module))
+            ios.get_config(module)
+            self.assertEqual(ios.get_config_cache(module), {"hit": True})
+            ios.get_config(module)
+            self.assertEqual(module._ios_connection.get_config_cache_hit.call_count, 1)
+            # one fetch from the device is enough for the module to miss the cache
+            ios.get_config(module, flags=["| section interface"])
+            self.assertEqual(ios.get_config_cache(module), {"hit": False})
+
+    def test_get_config_without_config_cache(self):
+        module = type("Module", (object,), {})()
+        module._ios_capabilities = {"network_api": "cliconf"}
+        module._ios_connection = MagicMock()
+        module._ios_connection.get_config.return_value = "hostname router"
+        with patch.dict(ios._DEVICE_CONFIGS, clear=True):
+            ios.get_config(module)
+        self.assertIsNone(ios.get_config_cache(module))
+        module._ios_connection.get_config_cache_hit.assert_not_called()
@@ -19,8 +19,64 @@ from __future__ import absolute_import, division, print_function
 
 
 __metaclass__ = type
-from unittest.mock import patch
+import ast
+import importlib
+import os
+import pkgutil
+import subprocess
+import sys
+import tempfile
 
+from unittest.mock import MagicMock, call, patch
+
+from ansible.module_utils.connection import ConnectionError
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
+    NetworkTemplate,
+)
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
+    JinjaTemplate,
+)
+
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios import rm_templates
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts import resources
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.acls.acls import (
+    AclsFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.facts import (
+    FACT_RESOURCE_SUBSETS,
+    RESOURCE_FACTS_PACKAGE,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.prefix_lists.prefix_lists import (
+    Prefix_listsFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.route_maps.route_maps import (
+    Route_mapsFacts,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.config_sections import (
+    RUNNING_CONFIG_FILTER_RE,
+    RunningConfigSnapshot,
+    filter_section,
+    regex_alternation,
+    split_sections,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.interface_blocks import (
+    InterfaceBlockIndex,
+    get_interfaces_config,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.network_template import (
+    CompiledTemplate,
+    IosNetworkTemplate,
+    first_words,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.parallel_facts import (
+    populate_facts_parallel,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.parse_cache import (
+    ParseCache,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.utils import (
+    get_facts_targets,
+)
 from ansible_collections.cisco.ios.plugins.modules import ios_facts
 from ansible_collections.cisco.ios.tests.unit.modules.utils import set_module_args
 
@@ -33,7 +89,7 @@ class TestIosFactsModule(TestIosModule):
     def setUp(self):
         super(TestIosFactsModule, self).setUp()
         self.mock_run_commands = patch(
-            "ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.legacy.base.run_commands",
+            "ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.legacy.base.run_commands_batch",
         )
         self.run_commands = self.mock_run_commands.start()
 
@@ -63,13 +119,19 @@ class TestIosFactsModule(TestIosModule):
         self.mock_get_capabilities.stop()
 
     def load_fixtures(self, commands=None):
-        def load_from_file(*args, **kwargs):
-            commands = kwargs["commands"]
+        def load_from_file(module, commands, check_rc=True):
             output = list()
 
             for command in commands:
                 filename = str(command).split(" | ", 1)[0].replace(" ", "_")
-                output.append(load_fixture("ios_facts_%s" % filename))
+                output.append(
+                    dict(
+                        command=command,
+                        output=load_fixture("ios_facts_%s" % filename),
+                        error=None,
+                        elapsed=0.0,
+                    ),
+                )
             return output
 
         self.run_commands.side_effect = load_from_file
@@ -95,6 +157,20 @@ class TestIosFactsModule(TestIosModule):
             ["CAT0726R0ZU", "CAT0726R10A", "CAT0732R0M4"],
         )
 
+    def test_ios_facts_legacy_subsets_single_batch(self):
+        set_module_args(dict(gather_subset=["default", "hardware", "interfaces"]))
+        self.execute_module()
+        batches = [c[0][1] for c in self.run_commands.call_args_list]
+        self.assertIn("show version", batches[0])
+        self.assertIn("dir", batches[0])
+        self.assertIn("show interfaces", batches[0])
+        self.assertEqual(len(batches[0]), len(set(batches[0])))
+        # lldp and cdp neighbors are only requested once they are found enabled
+        self.assertEqual(
+            batches[1:],
+            [["show lldp neighbors detail"], ["show cdp neighbors detail"]],
+        )
+
     def test_ios_facts_tunnel_address_and_lineprotocol(self):
         set_module_args(dict(gather_subset="interfaces"))
         result = self.execute_module()
@@ -219,3 +295,368 @@ class TestIosFactsModule(TestIosModule):
                 "type": None,
             },
         )
+
+    def test_ios_facts_resources_share_running_config(self):
+        set_module_args(
+            dict(
+                gather_network_resources=["hostname", "interfaces", "l3_interfaces", "ntp_global"]
+            ),
+        )
+        running_config = load_fixture("ios_facts_show_running_config_sections.cfg")
+        connection = self.get_resource_connection.return_value
+        connection.get.side_effect = lambda command: (
+            running_config if command == "show running-config" else ""
+        )
+        result = self.execute_module()
+        self.assertEqual(connection.get.call_args_list, [call("show running-config")])
+        resources = result["ansible_facts"]["ansible_network_resources"]
+        self.assertEqual(resources["hostname"], {"hostname": "Router1"})
+        self.assertEqual(
+            resources["interfaces"],
+            [
+                {"name": "GigabitEthernet1", "description": "Uplink", "enabled": True},
+                {"name": "GigabitEthernet2", "description": "Downlink", "enabled": False},
+            ],
+        )
+        self.assertEqual(
+            resources["l3_interfaces"],
+            [
+                {"name": "GigabitEthernet1", "ipv4": [{"address": "192.0.2.1/24"}]},
+                {"name": "GigabitEthernet2"},
+            ],
+        )
+        self.assertEqual(
+            resources["ntp_global"],
+            {"servers": [{"server": "198.51.100.1"}, {"server": "198.51.100.2", "prefer": True}]},
+        )
+
+    def test_ios_facts_single_resource_uses_device_filter(self):
+        set_module_args(dict(gather_network_resources=["hostname"]))
+        connection = self.get_resource_connection.return_value
+        connection.get.return_value = "hostname Router1"
+        result = self.execute_module()
+        self.assertEqual(
+            connection.get.call_args_list,
+            [call("show running-config | section ^hostname")],
+        )
+        self.assertEqual(
+            result["ansible_facts"]["ansible_network_resources"]["hostname"],
+            {"hostname": "Router1"},
+        )
+
+    def test_ios_facts_resource_registry(self):
+        exported = dict((name, getattr(resources, name)) for name in resources.__all__)
+        self.assertEqual(len(exported), len(FACT_RESOURCE_SUBSETS))
+        for resource in FACT_RESOURCE_SUBSETS:
+            facts_class = FACT_RESOURCE_SUBSETS[resource]
+            self.assertIs(exported[facts_class.__name__], facts_class)
+            self.assertEqual(facts_class.__module__.split(".")[-2:], [resource, resource])
+        self.assertIsNone(FACT_RESOURCE_SUBSETS.get("unknown"))
+
+    def test_ios_facts_config_modules_import_their_facts(self):
+        # AnsiballZ only ships the module_utils a module imports by name
+        config_dir = os.path.join(os.path.dirname(resources.__file__), "..", "config")
+        for resource in FACT_RESOURCE_SUBSETS:
+            path = os.path.join(config_dir, resource, "%s.py" % resource)
+            with open(path) as f:
+                tree = ast.parse(f.read())
+            imported = [node.module for node in ast.walk(tree) if isinstance(node, ast.ImportFrom)]
+            self.assertIn("%s.%s.%s" % (RESOURCE_FACTS_PACKAGE, resource, resource), imported)
+
+    def test_ios_facts_resources_imported_on_demand(self):
+        code = (
+            "import sys\n"
+            "from %s import facts\n"
+            "print(sorted(m.split('.')[-1] for m in sys.modules if m.startswith('%s.')))\n"
+            "facts.FACT_RESOURCE_SUBSETS['hostname']\n"
+            "print(sorted(m.split('.')[-1] for m in sys.modules if m.startswith('%s.')))\n"
+        ) % ((RESOURCE_FACTS_PACKAGE,) * 3)
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        output = subprocess.check_output([sys.executable, "-c", code], env=env)
+        before, after = output.decode().splitlines()
+        self.assertNotIn("hostname", before)
+        self.assertNotIn("bgp_global", before)
+        self.assertIn("hostname", after)
+        self.assertNotIn("bgp_global", after)
+
+    def test_ios_facts_template_first_words(self):
+        self.assertEqual(first_words(r"^hostname (?P<hostname>\S+)"), set(["hostname"]))
+        self.assertEqual(first_words(r"\s+ip\s+address"), set(["ip"]))
+        self.assertEqual(
+            first_words(r"^\s*(ip|ipv6)\s+access-list\s+(\S+)"),
+            set(["ip", "ipv6"]),
+        )
+        self.assertEqual(first_words(r"^router\s*bgp\s"), set(["router", "routerbgp"]))
+        self.assertEqual(first_words(r"^(no\s)?shutdown$"), set(["no", "shutdown"]))
+        self.assertEqual(first_words(r"^\s*description(?: (?P<text>.+))?$"), set(["description"]))
+        self.assertIsNone(first_words(r"^(?P<order>\d+)"))
+        self.assertIsNone(first_words(r"^standby\S*"))
+        self.assertIsNone(first_words(""))
+
+    def test_ios_facts_templates_parse_like_network_template(self):
+        fixtures = os.path.join(os.path.dirname(__file__), "fixtures")
+        configs = []
+        for name in sorted(os.listdir(fixtures)):
+            if name.endswith(".cfg"):
+                with open(os.path.join(fixtures, name)) as f:
+                    configs.append(f.read().splitlines())
+        for module in pkgutil.iter_modules(rm_templates.__path__):
+            module = importlib.import_module("%s.%s" % (rm_templates.__name__, module.name))
+            for name, template in vars(module).items():
+                if not name.endswith("Template") or template.__module__ != module.__name__:
+                    continue
+                self.assertTrue(issubclass(template, IosNetworkTemplate), name)
+                for lines in configs:
+                    tmplt = template(lines=lines)
+                    try:
+                        expected = NetworkTemplate(lines=lines, tmplt=template()).parse()
+                    except Exception as exc:
+                        self.assertRaises(type(exc), tmplt.parse)
+                    else:
+                        self.assertEqual(tmplt.parse(), expected, name)
+                    for parser in template.PARSERS:
+                        self.assertIs(
+                            tmplt.get_parser(parser["name"]),
+                            NetworkTemplate.get_parser(tmplt, parser["name"]),
+                        )
+
+    def test_ios_facts_compiled_template(self):
+        compiled = CompiledTemplate()
+        jinja = JinjaTemplate()
+        variables = {"name": "GigabitEthernet1", "seq": "10", "acl": "test acl", "dict": "x"}
+        for value in [
+            "{{ name }}",
+            "'{{ acl }}'",
+            "{{ seq }}",
+            "vlan {{ seq }} name {{ name }}\n",
+            "{{ true }}",
+            "{{ dict }}",
+            "{{ name|lower }}",
+            "{% if seq %}sequence {{ seq }}{% endif %}",
+            "no vars",
+            "{{ missing }}",
+            "x {{ name }} {{ missing }}",
+        ]:
+            for fail_on_undefined in (True, False):
+                try:
+                    expected = jinja(value, variables, fail_on_undefined)
+                except Exception as exc:
+                    self.assertRaises(type(exc), compiled, value, variables, fail_on_undefined)
+                else:
+                    self.assertEqual(compiled(value, variables, fail_on_undefined), expected)
+        self.assertIs(compiled.renderer("{{ name }}"), CompiledTemplate().renderer("{{ name }}"))
+        self.assertEqual(compiled(["{{ name }}"], variables), ["{{ name }}"])
+
+    def test_ios_facts_parse_cache(self):
+        fixtures = os.path.join(os.path.dirname(__file__), "fixtures")
+        with open(os.path.join(fixtures, "ios_facts_show_running_config_sections.cfg")) as f:
+            lines = f.read().splitlines()
+        changed = [line.replace("description", "description changed") for line in lines]
+        templates = []
+        for module in pkgutil.iter_modules(rm_templates.__path__):
+            module = importlib.import_module("%s.%s" % (rm_templates.__name__, module.name))
+            for name, template in vars(module).items():
+                if name.endswith("Template") and template.__module__ == module.__name__:
+                    templates.append(template)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = ParseCache(tmpdir, 1024 * 1024, "1.0.0")
+            # the attributes a module has by the time its facts are gathered
+            module = type(
+                "Module",
+                (object,),
+                {"params": {}, "_connection": None, "_ios_parse_cache": cache},
+            )()
+            for config in [lines, lines, changed]:
+                for template in templates:
+                    try:
+                        expected = template(lines=config).parse()
+                    except Exception:
+                        continue
+                    self.assertEqual(template(lines=config, module=module).parse(), expected)
+            self.assertTrue(cache.misses)
+            self.assertGreaterEqual(cache.hits, cache.misses)
+
+            self.assertIsNone(ParseCache(tmpdir, 1024 * 1024, "2.0.0").get(cache.key("a")))
+            cache.set(cache.key("a"), {"results": [{"a": (1,)}]})
+            self.assertIsNone(cache.get(cache.key("a")))
+            cache.max_size = 0
+            self.assertEqual(cache.evict(), 0)
+            self.assertEqual(
+                [sorted(files) for dummy, dummy, files in os.walk(tmpdir) if files],
+                [[".evicted", ".size"]],
+            )
+
+    def test_ios_facts_parse_cache_size_cap(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = ParseCache(tmpdir, 4096, "1.0.0")
+            value = {"results": ["x" * 500]}
+            for index in range(40):
+                cache.set(cache.key(str(index)), value)
+                entry_path = cache._entry_path(cache.key(str(index)))
+                if os.path.exists(entry_path):
+                    # one use per second, older than the next write
+                    os.utime(entry_path, (1000 + index, 1000 + index))
+                sizes = [
+                    os.path.getsize(os.path.join(root, name))
+                    for root, dummy, files in os.walk(tmpdir)
+                    if root != tmpdir
+                    for name in files
+                ]
+                # the cap holds between two scans of the directory
+                self.assertLessEqual(sum(sizes), 4096)
+                with open(os.path.join(tmpdir, ".size")) as f:
+                    self.assertEqual(int(f.read()), sum(sizes))
+            self.assertIsNotNone(cache.get(cache.key("39")))
+            self.assertIsNone(cache.get(cache.key("0")))
+
+    def test_ios_facts_targets(self):
+        module = MagicMock()
+        module.params = {
+            "state": "merged",
+            "config": [
+                {"afi": "ipv4", "acls": [{"name": "std.1"}, {"name": 110}]},
+                {"afi": "ipv6", "acls": [{"name": "v6"}]},
+            ],
+        }
+        self.assertEqual(get_facts_targets(module, "name", nested="acls"), ["std.1", "110", "v6"])
+        module.params["config"].append({"afi": "ipv4", "acls": None})
+        self.assertIsNone(get_facts_targets(module, "name", nested="acls"))
+        module.params = {"state": "overridden", "config": [{"name": "GigabitEthernet0/1"}]}
+        self.assertIsNone(get_facts_targets(module, "name"))
+        module.params = {"state": "deleted", "config": None}
+        self.assertIsNone(get_facts_targets(module, "name"))
+
+        self.assertEqual(regex_alternation(["std.1", "a|b", "rm_1"]), r"(std\.1|a\|b|rm_1)")
+        self.assertEqual(regex_alternation(["std.1", "rm_1"], " "), r"(std\.1 |rm_1 )")
+
+        connection = MagicMock()
+        connection.get.side_effect = [
+            "Building configuration...\n!\ninterface GigabitEthernet0/1\n shutdown\nend",
+            ConnectionError("% Invalid input detected at '^' marker."),
+        ]
+        config = get_interfaces_config(connection, ["Gi0/1", "Loopback99"])
+        self.assertEqual(
+            connection.get.call_args_list,
+            [
+                call("show running-config interface Gi0/1"),
+                call("show running-config interface Loopback99"),
+            ],
+        )
+        self.assertEqual(
+            InterfaceBlockIndex.for_config(config).lines(),
+            ["interface GigabitEthernet0/1", " shutdown"],
+        )
+        connection.get.side_effect = None
+        get_interfaces_config(connection, ["Gi0/%d" % n for n in range(17)])
+        connection.get.assert_called_with("show running-config | section ^interface")
+
+    def test_ios_facts_targeted_commands(self):
+        sections = split_sections(
+            "ip access-list standard std.1\n permit 192.0.2.1\n"
+            "ip access-list standard std.10\n permit 192.0.2.10\n"
+            "ip access-list extended 110\n permit ip any any\n"
+            "access-list 1 permit 192.0.2.2\n"
+            "access-list 10 permit 192.0.2.3\n"
+            "ipv6 access-list v6\n permit ipv6 any any\n"
+            "ipv6 access-list v6.old\n permit ipv6 any any\n"
+            "ip prefix-list PL1 seq 5 permit 192.0.2.0/24\n"
+            "ip prefix-list PL10 seq 5 permit 192.0.2.0/24\n"
+            "ipv6 prefix-list PL1 seq 5 permit 2001:db8::/32\n"
+            "route-map RM1 permit 10\n match tag 10\n"
+            "route-map RM10 permit 10\n",
+        )
+        for facts, getter, targets, expected in [
+            (
+                AclsFacts,
+                "get_acl_data",
+                ["std.1", "1", "110", "v6"],
+                [
+                    "ip access-list standard std.1",
+                    " permit 192.0.2.1",
+                    "ip access-list extended 110",
+                    " permit ip any any",
+                    "access-list 1 permit 192.0.2.2",
+                    "ipv6 access-list v6",
+                    " permit ipv6 any any",
+                ],
+            ),
+            (
+                Prefix_listsFacts,
+                "get_prefix_list_data",
+                ["PL1"],
+                [
+                    "ip prefix-list PL1 seq 5 permit 192.0.2.0/24",
+                    "ipv6 prefix-list PL1 seq 5 permit 2001:db8::/32",
+                ],
+            ),
+            (
+                Route_mapsFacts,
+                "get_route_maps_data",
+                ["RM1"],
+                ["route-map RM1 permit 10", " match tag 10"],
+            ),
+        ]:
+            connection = MagicMock()
+            connection.get.return_value = ""
+            getattr(facts(MagicMock(), targets=targets), getter)(connection)
+            command = connection.get.call_args[0][0]
+            # the device takes "?" for a request for help and trims blanks
+            self.assertNotIn("?", command)
+            self.assertEqual(command, command.rstrip())
+            pattern = RUNNING_CONFIG_FILTER_RE.match(command).group(2)
+            self.assertEqual(filter_section(sections, pattern), expected)
+
+        connection = MagicMock()
+        connection.get.return_value = ""
+        get_interfaces_config(connection, ["GigabitEthernet0/1", "Loopback99"])
+        for command in [c[0][0] for c in connection.get.call_args_list]:
+            self.assertNotIn("?", command)
+            self.assertEqual(command, command.rstrip())
+
+        module = MagicMock()
+        for name in ["any?", "RM1 "]:
+            module.params = {
+                "state": "merged",
+                "config": [{"route_map": "RM2"}, {"route_map": name}],
+            }
+            self.assertIsNone(get_facts_targets(module, "route_map"))
+
+    def test_ios_facts_parse_parallel(self):
+        fixtures = os.path.join(os.path.dirname(__file__), "fixtures")
+        with open(os.path.join(fixtures, "ios_facts_show_running_config_sections.cfg")) as f:
+            config = f.read()
+        connection = MagicMock()
+        connection.get.side_effect = lambda command: {"show running-config": config}[command]
+        # the attributes a module has by the time its facts are gathered
+        module = type(
+            "Module",
+            (object,),
+            {
+                "params": {},
+                "no_log_values": set(),
+                "_connection": connection,
+                "_ios_parse_cache": None,
+            },
+        )()
+        resources = ["hostname", "interfaces", "l3_interfaces", "route_maps", "vlans"]
+        snapshot = RunningConfigSnapshot(connection)
+        self.assertEqual(snapshot.prefetch(), len(config))
+
+        expected = {}
+        for resource in resources:
+            if resource == "vlans":
+                continue
+            ansible_facts = {"ansible_network_resources": {}}
+            FACT_RESOURCE_SUBSETS[resource](module).populate_facts(snapshot, ansible_facts)
+            expected[resource] = ansible_facts["ansible_network_resources"]
+
+        with patch("os.cpu_count", return_value=4):
+            parsed = populate_facts_parallel(module, snapshot, FACT_RESOURCE_SUBSETS, resources, 4)
+        # show vlan is not in the running-config, vlans is left to the module
+        self.assertEqual(parsed, expected)
+        connection.get.assert_called_once_with("show running-config")
+
+        self.assertEqual(
+            populate_facts_parallel(module, snapshot, FACT_RESOURCE_SUBSETS, resources, 1),
+            {},
+        )
@@ -10,6 +10,9 @@ __metaclass__ = type
 from textwrap import dedent
 from unittest.mock import patch
 
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.interface_blocks import (
+    InterfaceBlockIndex,
+)
 from ansible_collections.cisco.ios.plugins.modules import ios_interfaces
 from ansible_collections.cisco.ios.tests.unit.modules.utils import set_module_args
 
@@ -845,3 +848,51 @@ class TestIosInterfacesModule(TestIosModule):
         self.assertEqual(result["commands"], expected_commands)
         # Explicitly assert changed is True as well
         self.assertTrue(result["changed"])
+
+    def test_ios_interfaces_block_index(self):
+        config = "\n".join(
+            [
+                "Building configuration...",
+                "interface GigabitEthernet0/10",
+                " description ten",
+                "interface Gi0/9",
+                " description nine",
+                " ip address 192.0.2.1 255.255.255.0",
+                "interface Loopback0",
+                "interface GigabitEthernet0/10",
+                " shutdown",
+            ],
+        )
+        index = InterfaceBlockIndex.for_config(config)
+        self.assertIs(InterfaceBlockIndex.for_config(str(config)), index)
+        self.assertEqual(
+            [block.name for block in index],
+            ["GigabitEthernet0/10", "GigabitEthernet0/9", "loopback0"],
+        )
+        self.assertEqual(
+            [block.name for block in sorted(index, key=lambda block: block.sort_key)],
+            ["GigabitEthernet0/9", "GigabitEthernet0/10", "loopback0"],
+        )
+        self.assertEqual(
+            index.get("GigabitEthernet0/10").lines,
+            ["interface GigabitEthernet0/10", " description ten", " shutdown"],
+        )
+        self.assertIn("gi0/9", index)
+        self.assertIsNone(index.get("GigabitEthernet0/1"))
+        self.assertEqual(
+            index.lines(["Gi0/9", "Loopback0", "Gi0/1"]),
+            [
+                "interface Gi0/9",
+                " description nine",
+                " ip address 192.0.2.1 255.255.255.0",
+                "interface Loopback0",
+            ],
+        )
+
+        # lines given without indentation belong to the interface above them
+        index = InterfaceBlockIndex("\n".join(line.strip() for line in config.splitlines()))
+        self.assertEqual(
+            index.get("Gi0/9").lines,
+            ["interface Gi0/9", "description nine", "ip address 192.0.2.1 255.255.255.0"],
+        )
+        self.assertEqual(index.get("Loopback0").lines, ["interface Loopback0"])
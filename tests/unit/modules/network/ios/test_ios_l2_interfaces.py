@@ -10,6 +10,7 @@ __metaclass__ = type
 from textwrap import dedent
 from unittest.mock import patch
 
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.vlan_set import VlanSet
 from ansible_collections.cisco.ios.plugins.modules import ios_l2_interfaces
 from ansible_collections.cisco.ios.tests.unit.modules.utils import set_module_args
 
@@ -115,6 +116,29 @@ class TestIosL2InterfacesModule(TestIosModule):
         self.maxDiff = None
         self.assertEqual(result["commands"], commands)
 
+    def test_ios_l2_interfaces_merged_gathers_named_interfaces(self):
+        self.execute_show_command.return_value = dedent(
+            """\
+            interface GigabitEthernet0/1
+             switchport mode access
+             switchport access vlan 10
+            interface GigabitEthernet0/2
+             switchport mode trunk
+            """,
+        )
+        set_module_args(
+            dict(
+                config=[dict(access=dict(vlan=20), mode="access", name="GigabitEthernet0/1")],
+                state="merged",
+            ),
+        )
+        result = self.execute_module(changed=True)
+        self.assertEqual(
+            result["commands"],
+            ["interface GigabitEthernet0/1", "switchport access vlan 20"],
+        )
+        self.assertEqual([entry["name"] for entry in result["before"]], ["GigabitEthernet0/1"])
+
     def test_ios_l2_interfaces_merged_idempotent(self):
         self.execute_show_command.return_value = dedent(
             """\
@@ -1575,3 +1599,53 @@ class TestIosL2InterfacesModule(TestIosModule):
         ]
         result = self.execute_module(changed=True)
         self.assertEqual(result["commands"], commands)
+
+    def test_ios_l2_interfaces_replaced_trunk_vlan_ranges(self):
+        self.execute_show_command.return_value = dedent(
+            """\
+            interface GigabitEthernet0/3
+             switchport trunk allowed vlan 1-1000
+             switchport trunk allowed vlan add 1002-2000,3000
+             switchport trunk pruning vlan 10-20
+             switchport mode trunk
+            """,
+        )
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        mode="trunk",
+                        name="GigabitEthernet0/3",
+                        trunk=dict(
+                            allowed_vlans=["500-1500", "1400-2500"],
+                            pruning_vlans=["10-20"],
+                        ),
+                    ),
+                ],
+                state="replaced",
+            ),
+        )
+        commands = [
+            "interface GigabitEthernet0/3",
+            "switchport trunk allowed vlan remove 1-499,3000",
+            "switchport trunk allowed vlan add 1001,2001-2500",
+        ]
+        result = self.execute_module(changed=True)
+        self.assertEqual(result["commands"], commands)
+
+    def test_ios_l2_interfaces_vlan_set(self):
+        vlans = VlanSet.from_ranges(["1-10", "20", "15-16,4094", "none", "30"])
+        self.assertEqual(vlans.to_range(), "1-10,15-16,20,4094")
+        self.assertEqual(list(vlans), list(range(1, 11)) + [15, 16, 20, 4094])
+        self.assertEqual(len(vlans), 14)
+        self.assertIn(20, vlans)
+        self.assertNotIn(11, vlans)
+        self.assertEqual(vlans, VlanSet([20, 4094, 16, 15] + list(range(1, 11))))
+        self.assertEqual((vlans - VlanSet.from_ranges("5-20")).to_range(), "1-4,4094")
+        self.assertEqual((vlans & VlanSet.from_ranges("5-20")).to_range(), "5-10,15-16,20")
+        self.assertEqual((vlans | VlanSet([11, 12])).to_range(), "1-12,15-16,20,4094")
+        self.assertFalse(VlanSet.from_ranges(["none"]))
+        odd = VlanSet(range(1, 4095, 2))
+        chunks = list(odd.chunks())
+        self.assertTrue(all(len(chunk) <= 220 for chunk in chunks))
+        self.assertEqual(",".join(chunks), odd.to_range())
@@ -7,9 +7,21 @@ from __future__ import absolute_import, division, print_function
 
 
 __metaclass__ = type
+from copy import deepcopy
 from textwrap import dedent
 from unittest.mock import patch
 
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
+    validate_config,
+)
+
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.argspec.lacp_interfaces.lacp_interfaces import (
+    Lacp_InterfacesArgs,
+)
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils import spec_walker
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.utils.spec_walker import (
+    SpecWalker,
+)
 from ansible_collections.cisco.ios.plugins.modules import ios_lacp_interfaces
 from ansible_collections.cisco.ios.tests.unit.modules.utils import set_module_args
 
@@ -332,3 +344,36 @@ class TestIosLacpInterfaceModule(TestIosModule):
         ]
         result = self.execute_module(changed=False)
         self.assertEqual(sorted(result["rendered"]), sorted(commands))
+
+    def test_ios_lacp_interfaces_spec_walker_validates_like_argspec(self):
+        spec = Lacp_InterfacesArgs.argument_spec
+        for data in [
+            {
+                "config": [
+                    {"name": "Port-channel10", "port_priority": "30", "fast_switchover": "yes"}
+                ]
+            },
+            {"config": None},
+        ]:
+            expected = validate_config(spec, deepcopy(data))
+            validated = SpecWalker(spec).validate(deepcopy(data))
+            self.assertEqual(validated, expected)
+            self.assertEqual(list(validated), list(expected))
+
+    def test_ios_lacp_interfaces_spec_walker_falls_back(self):
+        spec = Lacp_InterfacesArgs.argument_spec
+        with patch.object(spec_walker.utils, "validate_config") as full:
+            for data in [
+                {"config": [{"name": "Port-channel10", "unknown": 1}]},
+                {"config": [{"name": "Port-channel10", "port_priority": "high"}]},
+                {"config": [{"port_priority": 30}]},
+            ]:
+                self.assertIs(spec_walker.validate_config(spec, data), full.return_value)
+                full.assert_called_once_with(spec, data)
+                full.reset_mock()
+            data = {"config": [{"name": "Port-channel10", "port_priority": 30}]}
+            spec_walker.validate_config(spec, data)
+            full.assert_not_called()
+            module = type("Module", (object,), {"_debug": True})()
+            spec_walker.validate_config(spec, data, module)
+            full.assert_called_once_with(spec, data)
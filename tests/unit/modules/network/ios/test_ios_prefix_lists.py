@@ -635,3 +635,41 @@ class TestIosPrefixListsModule(TestIosModule):
         ]
         result = self.execute_module(changed=False)
         self.assertEqual(sorted(result["rendered"]), sorted(commands))
+
+    def test_ios_prefix_lists_replaced_sequence_order(self):
+        entries = [
+            dict(action="permit", le=15, prefix="1.0.0.0/8", sequence=5),
+            dict(action="deny", prefix="11.0.0.0/8", sequence=12),
+            dict(action="deny", ge=20, le=21, prefix="14.0.0.0/8", sequence=20),
+        ]
+        commands = [
+            "no ip prefix-list 10 seq 5 deny 1.0.0.0/8 le 15",
+            "ip prefix-list 10 seq 5 permit 1.0.0.0/8 le 15",
+            "ip prefix-list 10 seq 12 deny 11.0.0.0/8",
+            "no ip prefix-list 10 seq 10 deny 35.0.0.0/8 ge 10",
+            "no ip prefix-list 10 seq 15 deny 12.0.0.0/8 ge 15",
+        ]
+        for ordered in (entries, list(reversed(entries))):
+            set_module_args(
+                dict(
+                    config=[
+                        dict(
+                            afi="ipv4",
+                            prefix_lists=[
+                                dict(
+                                    description="this is test description",
+                                    entries=ordered,
+                                    name="10",
+                                ),
+                            ],
+                        ),
+                    ],
+                    state="replaced",
+                ),
+            )
+            result = self.execute_module(changed=True)
+            if ordered is entries:
+                self.assertEqual(result["commands"], commands)
+            else:
+                # entries out of sequence order are compared in their order
+                self.assertEqual(result["commands"], commands[2:3] + commands[:2] + commands[3:])
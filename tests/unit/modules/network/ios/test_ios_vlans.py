@@ -510,13 +510,7 @@ class TestIosVlansModule(TestIosModule):
         )
         result = self.execute_module(changed=True)
         commands = [
-            "no vlan 1",
-            "no vlan 150",
-            "no vlan 888",
-            "no vlan 1002",
-            "no vlan 1003",
-            "no vlan 1004",
-            "no vlan 1005",
+            "no vlan 1,150,888,1002-1005",
             "vlan 200",
             "name test_vlan_200",
             "state active",
@@ -573,9 +567,7 @@ class TestIosVlansModule(TestIosModule):
         )
         result = self.execute_module(changed=True)
         commands = [
-            "no vlan 1",
-            "no vlan 501",
-            "no vlan 502",
+            "no vlan 1,501-502",
             "vlan 500",
             "name Test_VLAN",
             "no state active",
@@ -1453,10 +1445,7 @@ class TestIosVlansModule(TestIosModule):
         )
         result = self.execute_module(changed=True)
         commands = [
-            "no vlan 201",
-            "no vlan 202",
-            "no vlan 901",
-            "no vlan 902",
+            "no vlan 201-202,901-902",
             "no vlan configuration 201",
             "no vlan configuration 202",
             "no vlan configuration 901",
@@ -1679,3 +1668,101 @@ class TestIosVlansModule(TestIosModule):
         result = self.execute_module(changed=False)
         self.maxDiff = None
         self.assertEqual(result["parsed"], parsed)
+
+    def test_ios_vlans_merged_and_purged_vlan_ranges(self):
+        self.mock_l2_device_command.side_effect = True
+        self.mock_execute_show_command_conf.side_effect = ""
+        self.execute_show_command.return_value = dedent(
+            """\
+            VLAN Name                             Status    Ports
+            ---- -------------------------------- --------- -------------------------------
+            1    default                          active    Gi0/1, Gi0/2
+            400  VLAN0400                         active
+            401  VLAN0401                         active
+            402  VLAN0402                         active
+            500  VLAN0500                         active
+
+            VLAN Type  SAID       MTU   Parent RingNo BridgeNo Stp  BrdgMode Trans1 Trans2
+            ---- ----- ---------- ----- ------ ------ -------- ---- -------- ------ ------
+            1    enet  100001     1500  -      -      -        -    -        0      0
+            400  enet  100400     1500  -      -      -        -    -        0      0
+            401  enet  100401     1500  -      -      -        -    -        0      0
+            402  enet  100402     1500  -      -      -        -    -        0      0
+            500  enet  100500     1500  -      -      -        -    -        0      0
+            """,
+        )
+        set_module_args(
+            dict(
+                config=[dict(vlan_id=vlan_id) for vlan_id in [300] + list(range(100, 200))]
+                + [dict(vlan_id=401), dict(vlan_id=600, name="named")],
+                state="merged",
+            ),
+        )
+        result = self.execute_module(changed=True)
+        self.assertEqual(
+            result["commands"],
+            ["vlan 600", "name named", "vlan 100-199,300"],
+        )
+
+        set_module_args(
+            dict(
+                config=[dict(vlan_id=vlan_id) for vlan_id in [500, 402, 400, 401]],
+                state="purged",
+            ),
+        )
+        result = self.execute_module(changed=True)
+        self.assertEqual(result["commands"], ["no vlan 400-402,500"])
+
+    def test_ios_vlans_parsed_tables_joined_on_vlan_id(self):
+        set_module_args(
+            dict(
+                running_config=dedent(
+                    """\
+                    VLAN Name                             Status    Ports
+                    ---- -------------------------------- --------- -------------------------------
+                    10   users                            active    Gi0/1, Gi0/2, Gi0/3, Gi0/4
+                                                                    Gi0/5, Gi0/6
+                    20   a_very_long_vlan_name_a_very_long_vlan_name
+                                                          sus/lshut
+                    30   voice                            active
+
+                    VLAN Type  SAID       MTU   Parent RingNo BridgeNo Stp  BrdgMode Trans1 Trans2
+                    ---- ----- ---------- ----- ------ ------ -------- ---- -------- ------ ------
+                    30   enet  100030     9000  -      -      -        -    -        0      0
+                    10   enet  100010     1500  -      -      -        -    -        0      0
+
+                    Remote SPAN VLANs
+                    ------------------------------------------------------------------------------
+                    20-30
+                    """,
+                ),
+                state="parsed",
+            ),
+        )
+        parsed = [
+            {
+                "name": "users",
+                "vlan_id": 10,
+                "state": "active",
+                "shutdown": "disabled",
+                "mtu": 1500,
+            },
+            {
+                "name": "a_very_long_vlan_name_a_very_long_vlan_name",
+                "vlan_id": 20,
+                "state": "suspend",
+                "shutdown": "enabled",
+                "remote_span": True,
+            },
+            {
+                "name": "voice",
+                "vlan_id": 30,
+                "state": "active",
+                "shutdown": "disabled",
+                "mtu": 9000,
+                "remote_span": True,
+            },
+        ]
+        result = self.execute_module(changed=False)
+        self.maxDiff = None
+        self.assertEqual(result["parsed"], parsed)
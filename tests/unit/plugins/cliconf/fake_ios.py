@@ -0,0 +1,129 @@
+#
+# (c) 2026 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+A minimal stand-in for a network_cli connection to an IOS device.
+
+Every line written to it is executed in order and its echo, output and the
+following prompt are queued, the way an IOS vty echoes type-ahead input.
+Each read that waits for a prompt costs one round trip of ``latency``
+seconds, and an error in the stream is raised at the next prompt, leaving
+the rest of the stream unread, like network_cli does.
+"""
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import re
+import time
+
+from ansible.errors import AnsibleConnectionFailure
+from ansible.module_utils.common.text.converters import to_bytes, to_text
+
+
+INVALID_INPUT = "% Invalid input detected at '^' marker."
+
+
+class FakeIosConnection(object):
+    def __init__(self, hostname="R1", latency=0.0, invalid=None, lines_per_read=None, outputs=None):
+        """
+        :param latency: Seconds spent on every read that waits for a prompt
+        :param invalid: Regex of lines the device rejects
+        :param lines_per_read: Return after this many prompts even when more
+                               output is pending, to mimic an early prompt match;
+                               the read ends right after a prompt, and the echo
+                               of the line typed at it starts the next read
+        :param outputs: Map of exec commands to their output text
+        """
+        self.hostname = hostname
+        self.latency = latency
+        self.invalid = re.compile(invalid) if invalid else None
+        self.lines_per_read = lines_per_read
+        self.outputs = outputs or {}
+        self.mode = ""
+        self.pending = []
+        self.executed = []
+        self.round_trips = 0
+
+    @property
+    def prompt(self):
+        if self.mode:
+            return "%s(%s)#" % (self.hostname, self.mode)
+        return "%s#" % self.hostname
+
+    def get_prompt(self):
+        return to_bytes(self.prompt)
+
+    def queue_message(self, level, message):
+        pass
+
+    def _execute(self, line):
+        output = [self.prompt + line]
+        self.executed.append(line)
+        stripped = line.strip()
+        if self.invalid and self.invalid.search(stripped):
+            output.append(INVALID_INPUT)
+        elif not self.mode and stripped in self.outputs:
+            output.extend(self.outputs[stripped].splitlines())
+        elif re.match(r"^conf(igure)?( t(erminal)?)?$", stripped):
+            self.mode = "config"
+        elif stripped == "end":
+            self.mode = ""
+        elif stripped == "exit" and self.mode:
+            self.mode = "config" if self.mode != "config" else ""
+        elif self.mode and stripped.startswith("interface "):
+            self.mode = "config-if"
+        elif self.mode and stripped.startswith("router "):
+            self.mode = "config-router"
+        self.pending.append(output)
+
+    def send(self, command, sendonly=False, strip_prompt=True, **kwargs):
+        for line in to_text(command).split("\n"):
+            self._execute(line)
+        if sendonly:
+            return None
+        return to_text(self.receive(strip_prompt=strip_prompt))
+
+    def receive(self, command=None, strip_prompt=True, **kwargs):
+        time.sleep(self.latency)
+        self.round_trips += 1
+        rows = []
+        error = False
+        count = 0
+        while self.pending:
+            output = self.pending.pop(0)
+            rows.extend(output)
+            count += 1
+            if INVALID_INPUT in output:
+                error = True
+                break
+            if self.lines_per_read and count >= self.lines_per_read:
+                break
+        if self.pending:
+            # the read ends at the prompt of the next line, its echo starts the next read
+            prompt, echo = self.pending[0][0].split("#", 1)
+            rows.append(prompt + "#")
+            self.pending[0][0] = echo
+        else:
+            rows.append(self.prompt)
+        if error:
+            raise AnsibleConnectionFailure("\n".join(rows))
+        if strip_prompt:
+            rows = [row for row in rows if "#" not in row]
+        return to_bytes("\n".join(rows).strip())
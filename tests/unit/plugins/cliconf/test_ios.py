@@ -22,21 +22,25 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 import json
+import tempfile
 
 from os import path
 
 
 try:
-    from unittest.mock import MagicMock
+    from unittest.mock import MagicMock, patch
 except ImportError:
-    from mock import MagicMock
+    from mock import MagicMock, patch
 
 from unittest import TestCase
 
+from ansible.errors import AnsibleConnectionFailure
 from ansible.module_utils.common.text.converters import to_bytes
 
 from ansible_collections.cisco.ios.plugins.cliconf import ios
 
+from .fake_ios import FakeIosConnection
+
 
 b_FIXTURE_DIR = b"%s/fixtures/ios" % (
     to_bytes(path.dirname(path.abspath(__file__)), errors="surrogate_or_strict")
@@ -72,6 +76,7 @@ class TestPluginCLIConfIOS(TestCase):
     def setUp(self):
         self._mock_connection = MagicMock()
         self._mock_connection.send.side_effect = _connection_side_effect
+        self._mock_connection.get_prompt.return_value = b"an-csr-01#"
         self._cliconf = ios.Cliconf(self._mock_connection)
         self.maxDiff = None
 
@@ -93,6 +98,110 @@ class TestPluginCLIConfIOS(TestCase):
 
         self.assertEqual(device_info, mock_device_info)
 
+    def test_get_device_info_filtered_vlan_probe(self):
+        """The L2/L3 probe does not fetch the whole VLAN table"""
+        self._cliconf.get_device_info()
+        self.assertIn(b"show vlan | include ^VLAN", self._sent_commands())
+        self.assertNotIn(b"show vlan", self._sent_commands())
+
+    def test_get_device_info_probe_not_served_for_show_vlan(self):
+        """The filtered probe output never stands in for show vlan"""
+        self._cliconf._options["config_cache_ttl"] = 60
+        self._cliconf.get_device_info()
+        self.assertEqual(self._cliconf.get("show vlan"), b"show vlan")
+        self.assertEqual(self._sent_commands().count(b"show vlan"), 1)
+
+    def _device_info_cliconf(self, cache_path, version):
+        connection = MagicMock()
+        connection.get_prompt.return_value = b"an-csr-01#"
+        connection.get_option.side_effect = {"host": "192.0.2.1"}.__getitem__
+
+        def send(*args, **kwargs):
+            command = kwargs.get("command", args[0] if args else None)
+            if command == b"show version":
+                return version
+            return _connection_side_effect(*args, **kwargs)
+
+        connection.send.side_effect = send
+        cliconf = ios.Cliconf(connection)
+        cliconf._options["device_info_cache_path"] = cache_path
+        return connection, cliconf
+
+    def _probed(self, connection):
+        return [
+            c
+            for c in connection.send.call_args_list
+            if c.kwargs.get("command") == b"show vlan | include ^VLAN"
+        ]
+
+    def test_get_device_info_disk_cache(self):
+        """The device type is read back from disk until the device reloads"""
+        with open(path.join(b_FIXTURE_DIR, b"show_version"), "rb") as f:
+            version = f.read()
+        reloaded = version.replace(b"uptime is 1 day, 16 hours", b"uptime is 3 hours")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_path = path.join(tmpdir, "cache", "device_info.json")
+            connection, cliconf = self._device_info_cliconf(cache_path, version)
+            self.assertEqual(cliconf.get_device_info()["network_os_type"], "L2")
+            self.assertEqual(len(self._probed(connection)), 1)
+            connection.get_option.assert_called_with("host")
+            with open(cache_path) as f:
+                self.assertEqual(list(json.load(f)), ["192.0.2.1"])
+
+            connection, cliconf = self._device_info_cliconf(cache_path, version)
+            self.assertEqual(cliconf.get_device_info()["network_os_type"], "L2")
+            self.assertEqual(self._probed(connection), [])
+
+            connection, cliconf = self._device_info_cliconf(cache_path, reloaded)
+            self.assertEqual(cliconf.get_device_info()["network_os_type"], "L2")
+            self.assertEqual(len(self._probed(connection)), 1)
+
+    def test_extract_banners(self):
+        """Every banner type is extracted and stripped in one pass"""
+        config = (
+            "hostname R1\n"
+            "banner exec ^C\nexec line 1\nexec line 2\n^C\n"
+            "banner incoming ^CIncoming^C\n"
+            "banner login ^C\nAuthorized access only\n^C\n"
+            "banner motd ^C\nMaintenance window Sunday\n^C\n"
+            "banner slip-ppp ^C\nslip-ppp line\n^C\n"
+            "line vty 0 4\n"
+            " description not a banner ^C\n"
+        )
+        stripped, banners = self._cliconf._extract_banners(config)
+        self.assertEqual(
+            banners,
+            {
+                "banner exec": "exec line 1\nexec line 2",
+                "banner incoming": "Incoming",
+                "banner login": "Authorized access only",
+                "banner motd": "Maintenance window Sunday",
+                "banner slip-ppp": "slip-ppp line",
+            },
+        )
+        self.assertEqual(
+            stripped,
+            "hostname R1\n"
+            + "!! banner removed\n" * 5
+            + "line vty 0 4\n description not a banner ^C\n",
+        )
+
+    def test_extract_banners_empty_body(self):
+        """An empty banner block is stripped without yielding a banner text"""
+        config = "hostname R1\nbanner motd ^C^C\nline vty 0 4\n"
+        self.assertEqual(
+            self._cliconf._extract_banners(config),
+            ("hostname R1\n!! banner removed\nline vty 0 4\n", {}),
+        )
+        diff = self._cliconf.get_diff(candidate=config, running="hostname R1\nline vty 0 4\n")
+        self.assertEqual(diff["config_diff"], "")
+        self.assertEqual(diff["banner_diff"], {})
+
+    def test_extract_banners_without_banners(self):
+        config = "hostname R1\ninterface Loopback0\n description banner motd ^C\n"
+        self.assertEqual(self._cliconf._extract_banners(config), (config, {}))
+
     def test_get_capabilities(self):
         """Test get_capabilities"""
         capabilities = json.loads(self._cliconf.get_capabilities())
@@ -138,3 +247,307 @@ class TestPluginCLIConfIOS(TestCase):
             ],
         }
         self.assertEqual(sorted(mock_capabilities), sorted(capabilities))
+
+    def test_get_capabilities_parse_cache(self):
+        """The parse cache settings are only reported when it is enabled"""
+        self.assertIsNone(self._cliconf.get_parse_cache_info())
+        self._cliconf._options["parse_cache_path"] = "/tmp/ios_parse_cache"
+        self._cliconf._options["parse_cache_max_size"] = 16
+        info = json.loads(self._cliconf.get_capabilities())["parse_cache"]
+        self.assertEqual(info["path"], "/tmp/ios_parse_cache")
+        self.assertEqual(info["max_size"], 16 * 1024 * 1024)
+        self.assertRegex(info["version"], r"^\d+\.\d+\.\d+")
+
+    def test_get_capabilities_parallel_parse(self):
+        """Parallel parsing is only reported with two workers or more"""
+        self.assertNotIn("parallel_parse", json.loads(self._cliconf.get_capabilities()))
+        self._cliconf._options["parse_workers"] = 1
+        self.assertIsNone(self._cliconf.get_parallel_parse_info())
+        self._cliconf._options["parse_workers"] = 4
+        self._cliconf._options["parse_parallel_min_size"] = 512
+        self.assertEqual(
+            json.loads(self._cliconf.get_capabilities())["parallel_parse"],
+            {"workers": 4, "min_size": 512 * 1024},
+        )
+
+    def _sent_commands(self):
+        return [
+            c.kwargs.get("command", c.args[0] if c.args else None)
+            for c in self._mock_connection.send.call_args_list
+        ]
+
+    def test_get_config_cache_disabled(self):
+        """Without a TTL every running-config request goes to the device"""
+        self._cliconf.get_config()
+        self._cliconf.get_config()
+        self.assertEqual(self._sent_commands().count(b"show running-config"), 2)
+        self.assertEqual(
+            self._cliconf.get_config_cache_info(),
+            {"enabled": False, "hits": 0, "misses": 0},
+        )
+
+    def test_get_config_cache_hit_and_local_filter(self):
+        """Repeated and filtered running-config requests are served from one fetch"""
+        self._cliconf._options["config_cache_ttl"] = 60
+        running = self._cliconf.get_config()
+        self.assertEqual(self._cliconf.get_config(), running)
+        self.assertEqual(
+            self._cliconf.get("show running-config | section ^interface"),
+            "interface GigabitEthernet1\n description Uplink\n ip address 192.0.2.1 255.255.255.0\n"
+            "interface GigabitEthernet2\n shutdown",
+        )
+        self.assertEqual(
+            self._cliconf.get("show running-config | include ^hostname"),
+            "hostname an-csr-01",
+        )
+        self.assertEqual(self._sent_commands().count(b"show running-config"), 1)
+        self.assertNotIn(b"show running-config | section ^interface", self._sent_commands())
+        self.assertEqual(
+            self._cliconf.get_config_cache_info(),
+            {"enabled": True, "hits": 3, "misses": 1},
+        )
+        self.assertEqual(
+            self._cliconf.get_config_cache_info(),
+            {"enabled": True, "hits": 0, "misses": 0},
+        )
+
+    def test_get_config_cache_hit_of_last_request(self):
+        """The last running-config request tells whether it came from the cache"""
+        self.assertNotIn("config_cache", json.loads(self._cliconf.get_capabilities()))
+        self._cliconf._options["config_cache_ttl"] = 60
+        self.assertEqual(
+            json.loads(self._cliconf.get_capabilities())["config_cache"],
+            {"ttl": 60},
+        )
+        self._cliconf.get_config()
+        self.assertFalse(self._cliconf.get_config_cache_hit())
+        self._cliconf.get_config()
+        self.assertTrue(self._cliconf.get_config_cache_hit())
+        self._cliconf.invalidate_config_cache()
+        self._cliconf.get("show running-config | include ^hostname")
+        self.assertFalse(self._cliconf.get_config_cache_hit())
+        self._cliconf.get("show running-config | include ^hostname")
+        self.assertTrue(self._cliconf.get_config_cache_hit())
+
+    def test_get_config_cache_invalidated_by_config_commands(self):
+        """Configuration changes clear the running-config cache"""
+        self._cliconf._options["config_cache_ttl"] = 60
+        self._cliconf._options["config_commands"] = []
+        self._cliconf.get_config()
+        self._cliconf.run_commands(["show version"])
+        self._cliconf.get_config()
+        self.assertEqual(self._sent_commands().count(b"show running-config"), 1)
+        self._cliconf.run_commands(["configure terminal", "end"])
+        self._cliconf.get_config()
+        self.assertEqual(self._sent_commands().count(b"show running-config"), 2)
+        self._cliconf.restore(filename="base.cfg", path="flash:")
+        self._cliconf.get_config()
+        self.assertEqual(self._sent_commands().count(b"show running-config"), 3)
+
+    def test_get_config_cache_invalidated_by_abbreviated_configure(self):
+        """Every abbreviation of configure is a configuration command"""
+        self._cliconf._options["config_commands"] = []
+        for command in [
+            "conf t",
+            "config t",
+            "configur terminal",
+            "configure",
+            "config replace flash:base.cfg force",
+        ]:
+            self.assertTrue(self._cliconf._is_config_command(command), command)
+        for command in ["show configuration", "con", "confreg"]:
+            self.assertFalse(self._cliconf._is_config_command(command), command)
+
+    def test_show_vlan_served_from_cache(self):
+        """show vlan is fetched once while the cache is valid"""
+        self._cliconf._options["config_cache_ttl"] = 60
+        self._cliconf._options["config_commands"] = []
+        self._cliconf.get("show vlan")
+        self._cliconf.get("show vlan")
+        self.assertEqual(self._sent_commands().count(b"show vlan"), 1)
+        self._cliconf.run_commands(["configure terminal", "vlan 10", "end"])
+        self._cliconf.get("show vlan")
+        self.assertEqual(self._sent_commands().count(b"show vlan"), 2)
+
+    def test_get_config_cache_ttl_expiry(self):
+        """Entries older than the TTL are fetched again"""
+        self._cliconf._options["config_cache_ttl"] = 30
+        with patch("ansible_collections.cisco.ios.plugins.cliconf.ios.time.time") as mock_time:
+            mock_time.return_value = 1000
+            self._cliconf.get_config()
+            mock_time.return_value = 1020
+            self._cliconf.get_config()
+            self.assertEqual(self._sent_commands().count(b"show running-config"), 1)
+            mock_time.return_value = 1031
+            self._cliconf.get_config()
+            self.assertEqual(self._sent_commands().count(b"show running-config"), 2)
+
+    def _fake_cliconf(self, window, **kwargs):
+        connection = FakeIosConnection(**kwargs)
+        cliconf = ios.Cliconf(connection)
+        cliconf._options.update(
+            {
+                "commit_confirm_immediate": False,
+                "commit_confirm_timeout": None,
+                "config_pipeline_window": window,
+                "command_pipeline_window": window,
+            },
+        )
+        return connection, cliconf
+
+    def test_edit_config_pipelined_matches_serial(self):
+        """Pipelined pushes return the same result in fewer round trips"""
+        candidate = ["interface GigabitEthernet1", "description Uplink", "no shutdown", "exit"]
+        candidate += ["ip route 10.0.%d.0 255.255.255.0 192.0.2.1" % i for i in range(20)]
+
+        serial_connection, serial = self._fake_cliconf(0)
+        expected = serial.edit_config(candidate=list(candidate))
+
+        for lines_per_read in (None, 3):
+            connection, cliconf = self._fake_cliconf(8, lines_per_read=lines_per_read)
+            self.assertEqual(cliconf.edit_config(candidate=list(candidate)), expected)
+            self.assertEqual(
+                [line for line in connection.executed if not line.startswith("!")],
+                serial_connection.executed,
+            )
+            self.assertEqual(connection.pending, [])
+        self.assertEqual(serial_connection.round_trips, len(candidate) + 2)
+        connection, cliconf = self._fake_cliconf(8)
+        cliconf.edit_config(candidate=list(candidate))
+        self.assertEqual(connection.round_trips, 5)
+
+    def test_edit_config_pipelined_window_read_in_pieces(self):
+        """A window returned over two reads is split on the same lines"""
+        window = ["interface GigabitEthernet1", "description Uplink", "ip mtu 9000"]
+        connection = MagicMock()
+        # the first read ends at the prompt the second line was typed at
+        connection.send.return_value = b"R1(config)#interface GigabitEthernet1\nR1(config-if)#"
+        connection.receive.return_value = (
+            b"description Uplink\nR1(config-if)#ip mtu 9000\n"
+            b"% MTU 9000 exceeds the maximum of 1500\n"
+            b"R1(config-if)#! ansible config window 1\nR1(config-if)#"
+        )
+        cliconf = ios.Cliconf(connection)
+        self.assertEqual(
+            cliconf._send_config_window(window),
+            ["", "", "% MTU 9000 exceeds the maximum of 1500"],
+        )
+        self.assertEqual(connection.receive.call_count, 1)
+
+    def test_edit_config_pipelined_error_mapped_to_line(self):
+        """The first device error names its line and stops the push"""
+        candidate = ["ip route 10.0.%d.0 255.255.255.0 192.0.2.1" % i for i in range(10)]
+        candidate[5] = "ip route bogus"
+        connection, cliconf = self._fake_cliconf(4, invalid="bogus")
+        with self.assertRaises(AnsibleConnectionFailure) as exc:
+            cliconf.edit_config(candidate=candidate)
+        self.assertIn("configuration line 'ip route bogus' failed", str(exc.exception))
+        self.assertIn("% Invalid input detected", str(exc.exception))
+        # the failing window was written, the following one was not
+        self.assertIn(candidate[7], connection.executed)
+        self.assertNotIn(candidate[8], connection.executed)
+        self.assertEqual(connection.pending, [])
+
+    def test_edit_config_pipelined_prompt_lines_sent_alone(self):
+        """Lines with a prompt/answer exchange leave the pipeline"""
+        candidate = [
+            "hostname R1",
+            {"command": "crypto key zeroize rsa", "prompt": "[yes/no]", "answer": "yes"},
+            "ip domain name example.com",
+        ]
+        connection, cliconf = self._fake_cliconf(4)
+        resp = cliconf.edit_config(candidate=candidate)
+        self.assertEqual(
+            resp["request"],
+            ["hostname R1", "crypto key zeroize rsa", "ip domain name example.com"],
+        )
+        self.assertEqual(resp["response"], ["", "", ""])
+
+    def _show_outputs(self):
+        return dict(
+            (
+                "show interfaces GigabitEthernet%d" % i,
+                "GigabitEthernet%d is up\n  MTU 1500 bytes" % i,
+            )
+            for i in range(1, 8)
+        )
+
+    def test_run_commands_batch_pipelined_matches_serial(self):
+        """Pipelined show commands return the serial output in fewer round trips"""
+        outputs = self._show_outputs()
+        commands = sorted(outputs)
+
+        serial_connection, serial = self._fake_cliconf(0, outputs=outputs)
+        expected = serial.run_commands_batch(commands=list(commands))
+        self.assertEqual([item["output"] for item in expected], [outputs[c] for c in commands])
+        self.assertEqual(serial_connection.round_trips, len(commands))
+
+        for lines_per_read in (None, 2):
+            connection, cliconf = self._fake_cliconf(
+                4,
+                outputs=outputs,
+                lines_per_read=lines_per_read,
+            )
+            batch = cliconf.run_commands_batch(commands=list(commands))
+            self.assertEqual(
+                [(item["command"], item["output"], item["error"]) for item in batch],
+                [(item["command"], item["output"], item["error"]) for item in expected],
+            )
+            self.assertTrue(all(item["pipelined"] for item in batch))
+            self.assertTrue(all(item["elapsed"] >= 0 for item in batch))
+            self.assertLess(connection.round_trips, serial_connection.round_trips)
+            self.assertEqual(connection.pending, [])
+
+        connection, cliconf = self._fake_cliconf(4, outputs=outputs)
+        self.assertEqual(
+            cliconf.run_commands(commands=list(commands)), [outputs[c] for c in commands]
+        )
+        self.assertEqual(connection.round_trips, 2)
+
+    def test_run_commands_batch_window_read_in_pieces(self):
+        """Echoes that follow the end of a read are counted"""
+        outputs = self._show_outputs()
+        commands = sorted(outputs)[:3]
+        connection, cliconf = self._fake_cliconf(3, outputs=outputs, lines_per_read=1)
+        connection.receive = MagicMock(side_effect=connection.receive)
+        batch = cliconf.run_commands_batch(commands=list(commands))
+        self.assertEqual([item["output"] for item in batch], [outputs[c] for c in commands])
+        self.assertTrue(all(item["pipelined"] for item in batch))
+        # one read per command, and no read once the last echo is in
+        self.assertEqual(connection.receive.call_count, 3)
+        self.assertEqual(connection.pending, [])
+
+    def test_run_commands_batch_error_reruns_window(self):
+        """An error in a pipelined window is reported against its command"""
+        outputs = self._show_outputs()
+        commands = sorted(outputs)
+        commands.insert(2, "show bogus")
+        connection, cliconf = self._fake_cliconf(4, outputs=outputs, invalid="bogus")
+        batch = cliconf.run_commands_batch(commands=commands, check_rc=False)
+        self.assertEqual([item["command"] for item in batch], commands)
+        self.assertIn("% Invalid input detected", batch[2]["error"])
+        for item in batch[:2] + batch[3:]:
+            self.assertIsNone(item["error"])
+            self.assertEqual(item["output"], outputs[item["command"]])
+        self.assertEqual(connection.pending, [])
+
+        connection, cliconf = self._fake_cliconf(4, outputs=outputs, invalid="bogus")
+        with self.assertRaises(AnsibleConnectionFailure):
+            cliconf.run_commands_batch(commands=commands)
+
+    def test_run_commands_batch_prompt_commands_sent_alone(self):
+        """Non show commands and prompt/answer commands leave the pipeline"""
+        outputs = self._show_outputs()
+        commands = [
+            "show interfaces GigabitEthernet1",
+            "clear counters",
+            "show interfaces GigabitEthernet2",
+            {"command": "show interfaces GigabitEthernet3", "prompt": "[confirm]", "answer": "y"},
+        ]
+        connection, cliconf = self._fake_cliconf(4, outputs=outputs)
+        batch = cliconf.run_commands_batch(commands=commands)
+        self.assertEqual(
+            [item.get("pipelined", False) for item in batch],
+            [False, False, False, False],
+        )
+        self.assertEqual(batch[2]["output"], outputs["show interfaces GigabitEthernet2"])
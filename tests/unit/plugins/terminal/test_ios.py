@@ -21,9 +21,11 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+from unittest.mock import MagicMock
+
 import pytest
 
-from ansible_collections.cisco.ios.plugins.terminal.ios import TerminalModule
+from ansible_collections.cisco.ios.plugins.terminal.ios import StderrMatcher, TerminalModule
 
 
 @pytest.fixture()
@@ -99,3 +101,60 @@ class TestTerminalStderrRegex:
     )
     def test_safe_output_not_flagged(self, terminal_stderr_patterns, safe_output):
         assert not _matches_any(terminal_stderr_patterns, safe_output)
+
+
+class TestStderrMatcher:
+    """The prefiltered matcher must agree with the plain regex list."""
+
+    SAMPLES = [
+        b"% Error opening tftp://192.0.2.1/cfg (Timed out)",
+        b"ERROR: interface is shutdown",
+        b"% Bad secret",
+        b"\n Bad passwords",
+        b"R1(config)#ip route bogus\n% Invalid input detected at '^' marker.\nR1(config)#",
+        b"% Incomplete command.",
+        b'% AMBIGUOUS COMMAND: "sh i"',
+        b"Connection timed out; remote host not responding",
+        b'Translating "foo"...domain server (255.255.255.255)\n% Unknown command or computer name, or unable to find computer address\nfile not found',
+        b"'x'  returned error code: 5",
+        b"% Bad mask /33 for address 10.0.0.1",
+        b"% 10.0.0.0 overlaps with GigabitEthernet1",
+        b"%BGP Error: \t",
+        b"% vrf Informational:  ",
+        b"Command authorization failed.",
+        b"Command Rejected (tacacs) :  ",
+        b"% General session commands not allowed under the address family",
+        b"% BGP: Error initializing topology",
+        b"%SNMP agent not enabled",
+        b"%IPv6 routing not enabled",
+        b"% invalid vlan",
+        b"%You must disable VTPv1 and VTPv2 or switch to VTPv3 before configuring a VLAN name longer than 32 characters",
+        b"router bgp 65001\n neighbor 192.0.2.1 remote-as 65002\nR1#",
+        b"interface GigabitEthernet1\n description Error-free link\nR1#",
+        b"",
+    ]
+
+    @pytest.mark.parametrize("response", SAMPLES)
+    def test_same_first_match(self, response):
+        matcher = StderrMatcher(TerminalModule.terminal_stderr_patterns)
+        expected = None
+        for regex in TerminalModule.terminal_stderr_re:
+            match = regex.search(response)
+            if match:
+                expected = (regex.pattern, match.span())
+                break
+        match = matcher.search(response)
+        assert ((matcher.pattern, match.span()) if match else None) == expected
+
+    def test_literals_are_lowercase(self):
+        for literal, regex in TerminalModule.terminal_stderr_patterns:
+            assert literal is None or literal == literal.lower()
+
+    def test_instance_uses_matcher(self):
+        terminal = TerminalModule(MagicMock())
+        assert len(terminal.terminal_stderr_re) == 1
+        assert terminal.terminal_stderr_re[0].search(b"% Invalid input detected")
+        assert not terminal.terminal_stderr_re[0].search(b"R1#")
+        assert len(TerminalModule.terminal_stderr_re) == len(
+            TerminalModule.terminal_stderr_patterns
+        )